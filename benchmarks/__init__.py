@@ -0,0 +1,10 @@
+# encoding: utf-8
+
+"""
+Performance benchmarks for python-pptx.
+
+Run with ``python -m benchmarks``; ``python -m benchmarks --help`` describes
+the options. Each benchmark is timed against synthetic decks whose size is
+set on the command line, and the results can be saved as JSON and compared
+with those from another commit.
+"""
@@ -0,0 +1,85 @@
+# encoding: utf-8
+
+"""
+Command-line entry point, ``python -m benchmarks``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import argparse
+import sys
+
+from .decks import DeckSize, SIZES
+from .runner import compare, load, run_benchmarks, save
+from .suite import BENCHMARKS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Time python-pptx operations against synthetic decks.'
+    )
+    parser.add_argument(
+        '-s', '--size', choices=sorted(SIZES), default='small',
+        help='preset deck size (default: small)'
+    )
+    for field in DeckSize._fields:
+        parser.add_argument(
+            '--%s' % field.replace('_', '-'), type=int, dest=field,
+            help='override the %s of the preset size' % field
+        )
+    parser.add_argument(
+        '-k', '--filter', default='*',
+        help='run only benchmarks whose name matches this glob pattern'
+    )
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='number of timed runs of each benchmark (default: 5)'
+    )
+    parser.add_argument(
+        '-o', '--output', help='save the results as JSON to this file'
+    )
+    parser.add_argument(
+        '-c', '--compare', help='JSON results file to compare against'
+    )
+    parser.add_argument(
+        '-l', '--list', action='store_true',
+        help='list the benchmarks and exit'
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, func in BENCHMARKS:
+            print('%-24s %s' % (name, func.__doc__))
+        return 0
+
+    size = SIZES[args.size]._replace(**dict(
+        (field, getattr(args, field)) for field in DeckSize._fields
+        if getattr(args, field) is not None
+    ))
+    results = run_benchmarks(BENCHMARKS, size, args.repeat, args.filter)
+
+    print('deck size: %s' % ', '.join(
+        '%s=%d' % item for item in zip(DeckSize._fields, size)
+    ))
+    for name, timing in sorted(results['results'].items()):
+        print('%-24s median %9.4fs   min %9.4fs' % (
+            name, timing['median'], timing['min']
+        ))
+
+    if args.output:
+        save(results, args.output)
+    if args.compare:
+        print('\ncompared with %s:' % args.compare)
+        for name, seconds, base_seconds, ratio in compare(
+                results, load(args.compare)):
+            print('%-24s %9.4fs vs %9.4fs   x%.2f' % (
+                name, seconds, base_seconds, ratio
+            ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
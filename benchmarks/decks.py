@@ -0,0 +1,123 @@
+# encoding: utf-8
+
+"""
+Synthetic decks of parameterized size for the benchmarks.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from collections import namedtuple
+
+from PIL import Image as PIL_Image
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.compat import BytesIO
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches, Pt
+
+
+#: The size of a synthetic deck. *slides* is the number of slides, each
+#: having *shapes* text boxes. *images* distinct pictures are spread over the
+#: slides, and the first slide has a chart of *chart_points* categories and
+#: a table of *table_rows* by *table_cols* cells.
+DeckSize = namedtuple(
+    'DeckSize',
+    ('slides', 'shapes', 'images', 'chart_points', 'table_rows', 'table_cols')
+)
+
+SIZES = {
+    'small': DeckSize(10, 5, 2, 10, 5, 4),
+    'medium': DeckSize(100, 10, 20, 100, 20, 6),
+    'large': DeckSize(1000, 20, 200, 1000, 50, 10),
+}
+
+
+def build_deck(size):
+    """
+    Return a new |Presentation| object populated to *size*.
+    """
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    images = [image_stream(idx) for idx in range(size.images)]
+    for slide_idx in range(size.slides):
+        slide = prs.slides.add_slide(layout)
+        for shape_idx in range(size.shapes):
+            textbox = slide.shapes.add_textbox(
+                Inches(0.5), Inches(0.25 * shape_idx), Inches(4), Inches(0.25)
+            )
+            textbox.text_frame.text = (
+                'Slide %d shape %d {{name}}' % (slide_idx, shape_idx)
+            )
+        for image in images[slide_idx::size.slides]:
+            image.seek(0)
+            slide.shapes.add_picture(image, Inches(5), Inches(1))
+    if size.slides:
+        slide = prs.slides[0]
+        add_chart(slide, size.chart_points)
+        fill_table(add_table(slide, size.table_rows, size.table_cols))
+    return prs
+
+
+def chart_data(points, offset=0):
+    """
+    Return a |CategoryChartData| object with a single series of *points*
+    values, each incremented by *offset*.
+    """
+    data = CategoryChartData()
+    data.categories = ['Category %d' % idx for idx in range(points)]
+    data.add_series('Series 1', [idx + offset for idx in range(points)])
+    return data
+
+
+def add_chart(slide, points):
+    """
+    Add a column chart of *points* categories to *slide* and return its
+    graphic frame.
+    """
+    return slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(5), Inches(3), Inches(4),
+        Inches(3), chart_data(points)
+    )
+
+
+def add_table(slide, rows, cols):
+    """
+    Add an empty table of *rows* by *cols* cells to *slide* and return its
+    graphic frame.
+    """
+    return slide.shapes.add_table(
+        rows, cols, Inches(0.5), Inches(4), Inches(4), Pt(12) * rows
+    )
+
+
+def deck_blob(size):
+    """
+    Return the bytes of a .pptx file populated to *size*.
+    """
+    stream = BytesIO()
+    build_deck(size).save(stream)
+    return stream.getvalue()
+
+
+def fill_table(graphic_frame):
+    """
+    Set the text of every cell of the table in *graphic_frame*.
+    """
+    table = graphic_frame.table
+    for row_idx, row in enumerate(table.rows):
+        for col_idx, cell in enumerate(row.cells):
+            cell.text = '%d,%d' % (row_idx, col_idx)
+
+
+def image_stream(idx):
+    """
+    Return a PNG image in a stream, distinct for each value of *idx*.
+    """
+    color = (idx % 256, (idx // 256) % 256, 128)
+    stream = BytesIO()
+    PIL_Image.new('RGB', (16, 16), color).save(stream, 'PNG')
+    stream.seek(0)
+    return stream
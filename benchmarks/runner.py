@@ -0,0 +1,109 @@
+# encoding: utf-8
+
+"""
+Timing of the benchmarks, and saving and comparing their results as JSON.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import fnmatch
+import json
+import platform
+import subprocess
+import time
+import timeit
+
+import pptx
+
+
+def compare(results, baseline):
+    """
+    Return a list of `(name, seconds, baseline_seconds, ratio)` 4-tuples,
+    one for each benchmark timed in both *results* and *baseline*, comparing
+    their median times. A ratio greater than 1.0 means *results* is slower.
+    """
+    rows = []
+    for name, timing in sorted(results['results'].items()):
+        base_timing = baseline['results'].get(name)
+        if base_timing is None:
+            continue
+        seconds, base_seconds = timing['median'], base_timing['median']
+        ratio = seconds / base_seconds if base_seconds else float('inf')
+        rows.append((name, seconds, base_seconds, ratio))
+    return rows
+
+
+def run_benchmarks(benchmarks, size, repeat, pattern='*'):
+    """
+    Return a results dict for each of *benchmarks*, `(name, function)`
+    pairs, whose name matches glob *pattern*, timing each *repeat* times
+    against decks of *size*. Alongside the timings, the dict records the
+    commit, versions, platform, and deck size they were taken with.
+    """
+    results = {}
+    for name, func in benchmarks:
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        results[name] = _time(func, size, repeat)
+    return {
+        'commit': _git_commit(),
+        'pptx_version': pptx.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'size': size._asdict(),
+        'results': results,
+    }
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def _git_commit():
+    """
+    Return the hash of the commit checked out in the working directory, or
+    |None| when not in a git working tree.
+    """
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.STDOUT
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def _time(func, size, repeat):
+    """
+    Return a dict of statistics for *repeat* runs of benchmark *func*
+    against decks of *size*, in seconds.
+    """
+    timer = timeit.default_timer
+    times = []
+    for _ in range(repeat):
+        run = func(size)
+        start = timer()
+        run()
+        times.append(timer() - start)
+    times.sort()
+    middle = len(times) // 2
+    median = (
+        times[middle] if len(times) % 2 else
+        (times[middle - 1] + times[middle]) / 2
+    )
+    return {
+        'min': times[0],
+        'median': median,
+        'max': times[-1],
+        'repeat': repeat,
+    }
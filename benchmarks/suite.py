@@ -0,0 +1,158 @@
+# encoding: utf-8
+
+"""
+The benchmarks. Each is a function called with a |DeckSize| to set up
+a single run and returning a function that performs the timed operation.
+Setup is repeated before each run and is not timed.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+import subprocess
+import sys
+
+import pptx
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+from pptx.extract import iter_text
+from pptx.util import Inches
+
+from .decks import (
+    add_chart, add_table, chart_data, deck_blob, fill_table, image_stream
+)
+
+
+#: (name, function) pairs of the benchmarks, in the order they are run.
+BENCHMARKS = []
+
+
+def benchmark(func):
+    """
+    Register *func* as a benchmark named for the function.
+    """
+    BENCHMARKS.append((func.__name__, func))
+    return func
+
+
+_deck_blobs = {}
+
+
+def _deck(size):
+    """
+    Return a new |Presentation| object loaded from a deck of *size*, built
+    once per size.
+    """
+    return Presentation(BytesIO(_deck_blob(size)))
+
+
+def _deck_blob(size):
+    blob = _deck_blobs.get(size)
+    if blob is None:
+        blob = _deck_blobs[size] = deck_blob(size)
+    return blob
+
+
+@benchmark
+def import_pptx(size):
+    """Start a new interpreter and import pptx, the cold-start cost."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(pptx.__file__))
+    args = [sys.executable, '-c', 'import pptx']
+    return lambda: subprocess.check_call(args, env=env)
+
+
+@benchmark
+def open_deck(size):
+    """Load a deck from a .pptx file."""
+    blob = _deck_blob(size)
+    return lambda: Presentation(BytesIO(blob))
+
+
+@benchmark
+def save_deck(size):
+    """Save a loaded deck, every part of which has been parsed."""
+    prs = _deck(size)
+    for slide in prs.slides:
+        slide.shapes
+    return lambda: prs.save(BytesIO())
+
+
+@benchmark
+def add_slides(size):
+    """Add *slides* slides to a new presentation."""
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+
+    def run():
+        for _ in range(size.slides):
+            prs.slides.add_slide(layout)
+    return run
+
+
+@benchmark
+def add_picture(size):
+    """Add *images* distinct pictures, each on a new slide."""
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    images = [image_stream(idx) for idx in range(size.images)]
+
+    def run():
+        for image in images:
+            slide = prs.slides.add_slide(layout)
+            slide.shapes.add_picture(image, Inches(1), Inches(1))
+    return run
+
+
+@benchmark
+def add_chart_points(size):
+    """Add a chart of *chart_points* categories to a slide."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return lambda: add_chart(slide, size.chart_points)
+
+
+@benchmark
+def replace_chart_data(size):
+    """Replace the data of a chart of *chart_points* categories."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    chart = add_chart(slide, size.chart_points).chart
+    data = chart_data(size.chart_points, offset=1)
+    return lambda: chart.replace_data(data)
+
+
+@benchmark
+def fill_table_cells(size):
+    """Set the text of each cell of a *table_rows* by *table_cols* table."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    graphic_frame = add_table(slide, size.table_rows, size.table_cols)
+    return lambda: fill_table(graphic_frame)
+
+
+@benchmark
+def extract_text_shapes(size):
+    """Get the text of each shape of a loaded deck via the object model."""
+    prs = _deck(size)
+
+    def run():
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                if shape.has_text_frame:
+                    shape.text_frame.text
+    return run
+
+
+@benchmark
+def extract_text_stream(size):
+    """Get the text of each paragraph of a deck with pptx.extract."""
+    blob = _deck_blob(size)
+
+    def run():
+        for _ in iter_text(BytesIO(blob)):
+            pass
+    return run
@@ -252,6 +252,8 @@ rst_epilog = """
 
 .. |Package| replace:: :class:`Package`
 
+.. |PackageTemplate| replace:: :class:`.PackageTemplate`
+
 .. |PackURI| replace:: :class:`.PackURI`
 
 .. |_Paragraph| replace:: :class:`_Paragraph`
@@ -278,6 +280,8 @@ rst_epilog = """
 
 .. |PresentationPart| replace:: :class:`.PresentationPart`
 
+.. |PresentationTemplate| replace:: :class:`.PresentationTemplate`
+
 .. |Pt| replace:: :class:`.Pt`
 
 .. |_Relationship| replace:: :class:`._Relationship`
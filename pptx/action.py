@@ -77,12 +77,14 @@ class ActionSetting(Subshape):
     @property
     def target_slide(self):
         """
-        A reference to the slide in this presentation that is the target of
-        the slide jump action in this shape. Slide jump actions include
-        `PP_ACTION.FIRST_SLIDE`, `LAST_SLIDE`, `NEXT_SLIDE`,
+        Read/write. A reference to the slide in this presentation that is the
+        target of the slide jump action in this shape. Slide jump actions
+        include `PP_ACTION.FIRST_SLIDE`, `LAST_SLIDE`, `NEXT_SLIDE`,
         `PREVIOUS_SLIDE`, and `NAMED_SLIDE`. Returns |None| for all other
         actions. In particular, the `LAST_SLIDE_VIEWED` action and the `PLAY`
-        (start other presentation) actions are not supported.
+        (start other presentation) actions are not supported. A `NEXT_SLIDE`
+        or `PREVIOUS_SLIDE` target is found from the position of this slide,
+        which costs a walk of the slide id list.
         """
         slide_jump_actions = (
             PP_ACTION.FIRST_SLIDE,
@@ -113,6 +115,20 @@ class ActionSetting(Subshape):
             rId = self._hlink.rId
             return self.part.related_parts[rId].slide
 
+    @target_slide.setter
+    def target_slide(self, slide):
+        # assigning a slide sets a `NAMED_SLIDE` jump to it, |None| removes
+        # any action defined on the object
+        self._remove_hlink()
+        if slide is None:
+            return
+        hlink = (
+            self._element.get_or_add_hlinkHover() if self._hover else
+            self._element.get_or_add_hlinkClick()
+        )
+        hlink.action = 'ppaction://hlinksldjump'
+        hlink.rId = self.part.relate_to(slide.part, RT.SLIDE)
+
     @property
     def _hlink(self):
         """
@@ -123,6 +139,19 @@ class ActionSetting(Subshape):
             return self._element.hlinkHover
         return self._element.hlinkClick
 
+    def _remove_hlink(self):
+        """
+        Remove the a:hlinkClick or a:hlinkHover element, including dropping
+        any relationship it might have.
+        """
+        hlink = self._hlink
+        if hlink is None:
+            return
+        rId = hlink.rId
+        if rId:
+            self.part.drop_rel(rId)
+        self._element.remove(hlink)
+
     @lazyproperty
     def _slide(self):
         """
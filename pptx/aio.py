@@ -0,0 +1,176 @@
+# encoding: utf-8
+
+"""
+asyncio variants of opening and saving a presentation, for services running
+on an event loop. Requires Python 3.5 or later.
+
+Parsing, serializing, and compressing a presentation are CPU-bound and would
+block the event loop for the duration. These functions run that work in an
+executor instead. :func:`save_async` streams the package to an asynchronous
+byte sink in chunks as it is compressed, rather than building the whole file
+in memory first.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+
+from .api import Presentation
+from .compat import BytesIO
+
+
+#: Size in bytes of the chunks :func:`save_async` writes to its sink, other
+#: than the last one.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+async def open_async(pptx=None, executor=None):
+    """
+    Return a |Presentation| object loaded from *pptx*, parsed in *executor*
+    or the event loop's default executor when |None|. *pptx* is anything
+    accepted by :func:`pptx.Presentation`, or an asynchronous byte source
+    whose ``read()`` method is a coroutine function, such as an uploaded
+    file in an asyncio web framework.
+    """
+    loop = asyncio.get_event_loop()
+    read = getattr(pptx, 'read', None)
+    if asyncio.iscoroutinefunction(read):
+        pptx = BytesIO(await read())
+    return await loop.run_in_executor(executor, Presentation, pptx)
+
+
+async def save_async(
+        prs, sink, executor=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Save presentation *prs* to *sink*, an object having a ``write(data)``
+    method which may return an awaitable, such as an asyncio stream or an
+    async file. The package is serialized and compressed in *executor*, or
+    the event loop's default executor when |None|, and written to *sink* in
+    chunks of *chunk_size* bytes as it is produced.
+
+    Serialization is suspended while *sink* is behind by more than a couple
+    of chunks. Cancelling the awaiting task stops serialization at its next
+    write and leaves a partial package in *sink*.
+    """
+    loop = asyncio.get_event_loop()
+    queue = asyncio.Queue(maxsize=2)
+    stream = _ChunkQueueStream(loop, queue, chunk_size)
+    save = loop.run_in_executor(executor, _save, prs, stream)
+
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            result = sink.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+        await save
+    except BaseException:
+        stream.cancel()
+        save.add_done_callback(_discard_result)
+        raise
+
+
+class _Cancelled(Exception):
+    """
+    Raised in the saving thread when the awaiting task has gone away.
+    """
+
+
+class _ChunkQueueStream(object):
+    """
+    Write-only, non-seekable file-like object used as the target of
+    :meth:`Presentation.save` in the saving thread. Bytes written are
+    gathered into chunks of *chunk_size* and put on asyncio *queue*, blocking
+    while the queue is full. A |None| item marks the end of the stream.
+    """
+    def __init__(self, loop, queue, chunk_size):
+        super(_ChunkQueueStream, self).__init__()
+        self._loop = loop
+        self._queue = queue
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._cancelled = threading.Event()
+
+    def abort(self):
+        """
+        Discard any buffered bytes and put the end of stream marker on the
+        queue, so the reader stops after a failed save.
+        """
+        del self._buffer[:]
+        self._put(None)
+
+    def cancel(self):
+        """
+        Cause the next attempt to write to this stream to raise |_Cancelled|.
+        """
+        self._cancelled.set()
+
+    def close(self):
+        """
+        Put any remaining buffered bytes on the queue, followed by the end of
+        stream marker.
+        """
+        if self._buffer:
+            self._put(bytes(self._buffer))
+            del self._buffer[:]
+        self._put(None)
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        self._buffer.extend(data)
+        while len(self._buffer) >= self._chunk_size:
+            chunk = bytes(self._buffer[:self._chunk_size])
+            del self._buffer[:self._chunk_size]
+            self._put(chunk)
+        return len(data)
+
+    def _put(self, item):
+        """
+        Put *item* on the queue from the saving thread, waiting for room
+        while checking periodically for cancellation.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._queue.put(item), self._loop
+        )
+        while True:
+            if self._cancelled.is_set():
+                future.cancel()
+                raise _Cancelled()
+            try:
+                return future.result(timeout=0.05)
+            except concurrent.futures.TimeoutError:
+                continue
+
+
+def _discard_result(future):
+    """
+    Retrieve the outcome of *future* so an exception it ended with, such as
+    |_Cancelled|, is not reported as never retrieved.
+    """
+    if not future.cancelled():
+        future.exception()
+
+
+def _save(prs, stream):
+    """
+    Save *prs* to *stream*, then close the stream to mark its end. Runs in
+    the executor. When the save fails the stream is ended without its
+    remaining bytes, and the exception is raised by the awaiting task.
+    """
+    try:
+        prs.save(stream)
+    except _Cancelled:
+        raise
+    except Exception:
+        stream.abort()
+        raise
+    stream.close()
@@ -14,26 +14,73 @@ from __future__ import (
 import os
 
 from .opc.constants import CONTENT_TYPE as CT
+from .opc.package import PackageTemplate
 from .package import Package
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, slides=None):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    *slides* optionally selects the slides to load, for quickly working on
+    a few slides of a large presentation. It is a collection of zero-based
+    slide indexes or a function called with each slide index and returning
+    |True| to select it. Other slides are not parsed unless accessed, and
+    are saved unchanged otherwise.
     """
     if pptx is None:
-        pptx = _default_pptx_path()
+        return _default_template().new_presentation()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, slides).main_document_part
+    return _presentation(presentation_part, pptx)
 
-    if not _is_pptx_package(presentation_part):
-        tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
-        raise ValueError(tmpl % (pptx, presentation_part.content_type))
 
-    return presentation_part.presentation
+class PresentationTemplate(object):
+    """
+    A presentation file read and parsed once, from which any number of
+    independent |Presentation| objects can be created by calling
+    :meth:`new_presentation`. This avoids re-reading and re-parsing the same
+    template for each presentation generated from it. *pptx* is a path or
+    file-like object as for :func:`Presentation`, the built-in default
+    template when omitted.
+
+    Each new presentation shares the unchanged blobs of the template and
+    copies the XML of a part only when that part is first accessed, so
+    creating one costs little more than building its part graph.
+    Presentations created from the same template are fully independent of
+    each other and of the template.
+    """
+    def __init__(self, pptx=None):
+        super(PresentationTemplate, self).__init__()
+        if pptx is None:
+            pptx = _default_pptx_path()
+        self._pptx = pptx
+        self._package_template = PackageTemplate.open(pptx)
+
+    def new_presentation(self):
+        """
+        Return a new |Presentation| object having the contents of this
+        template.
+        """
+        package = self._package_template.fork(Package)
+        return _presentation(package.main_document_part, self._pptx)
+
+
+def _default_template():
+    """
+    Return the |PresentationTemplate| for the built-in default .pptx
+    package, loaded on first use.
+    """
+    global _default_presentation_template
+    if _default_presentation_template is None:
+        _default_presentation_template = PresentationTemplate()
+    return _default_presentation_template
+
+
+_default_presentation_template = None
 
 
 def _default_pptx_path():
@@ -44,6 +91,17 @@ def _default_pptx_path():
     return os.path.join(_thisdir, 'templates', 'default.pptx')
 
 
+def _presentation(presentation_part, pptx):
+    """
+    Return the |Presentation| object of *presentation_part*, loaded from
+    *pptx*. Raises |ValueError| if it is not a PowerPoint presentation part.
+    """
+    if not _is_pptx_package(presentation_part):
+        tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
+        raise ValueError(tmpl % (pptx, presentation_part.content_type))
+    return presentation_part.presentation
+
+
 def _is_pptx_package(prs_part):
     """
     Return |True| if *prs_part* is a valid main document part, |False|
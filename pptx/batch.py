@@ -0,0 +1,309 @@
+# encoding: utf-8
+
+"""
+Batch generation of presentations from a template and a sequence of data
+records, distributed across a pool of worker processes.
+
+Each worker loads the template once as a |PresentationTemplate| and then,
+for each record it is given, creates a new presentation from it, calls the
+render function with that presentation and the record, and returns the saved
+presentation. The parent process writes each deck as it arrives, either to
+a directory or into a single zip archive. Records are handed to the pool
+only as decks are written, at most a few per worker ahead, so memory use
+does not grow with the number of records even when writing falls behind
+rendering. An exception raised while rendering a record is
+recorded against that record and does not affect any other.
+
+Also usable from the command line; ``python -m pptx.batch --help`` describes
+the arguments.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import traceback
+import zipfile
+
+from .api import PresentationTemplate
+from .compat import BytesIO
+
+
+def generate_decks(
+        template, render, records, output, processes=None, name=None):
+    """
+    Return a |BatchResult| object describing the generation of a deck from
+    *template* for each item in *records*, written to *output*.
+
+    *template* is a path to the template .pptx file, or |None| for the
+    built-in default template. *render* is called as `render(prs, record)`
+    for each record with a new |Presentation| object to populate; it must be
+    a module-level function so it can be sent to the worker processes.
+    *records* is any iterable, consumed lazily, and each record must be
+    picklable.
+
+    *output* is the path of a directory, created if it does not exist, or of
+    a zip archive when it ends with ``.zip``. *name* is called as
+    `name(record, idx)` to get the filename of each deck and defaults to
+    ``deck-000001.pptx`` style numbering. *processes* is the number of
+    worker processes, defaulting to the number of CPUs. When it is 0 decks
+    are generated in the calling process, which is handy for debugging.
+    """
+    name = _default_name if name is None else name
+    result = BatchResult()
+    with _DeckWriter(output) as writer:
+        for idx, record, blob, error in _render_all(
+                template, render, records, processes):
+            if error is None:
+                writer.write(name(record, idx), blob)
+                result._add_success(len(blob))
+            else:
+                result._add_failure(idx, record, error)
+    result._finish()
+    return result
+
+
+class BatchResult(object):
+    """
+    The outcome of a call to :func:`generate_decks`, including throughput
+    statistics and the error raised for each record that failed.
+    """
+    def __init__(self):
+        super(BatchResult, self).__init__()
+        self._start = time.time()
+        self.elapsed = 0.0
+        self.succeeded = 0
+        self.bytes_written = 0
+        self.failures = []
+
+    @property
+    def decks_per_second(self):
+        """
+        Average number of decks generated per second, counting failed
+        records, or 0.0 when no time has elapsed.
+        """
+        if not self.elapsed:
+            return 0.0
+        return (self.succeeded + len(self.failures)) / self.elapsed
+
+    @property
+    def failed(self):
+        """
+        Number of records whose deck could not be generated.
+        """
+        return len(self.failures)
+
+    def __str__(self):
+        return (
+            '%d decks generated, %d failed, %d bytes in %.2fs (%.1f decks/s)'
+            % (
+                self.succeeded, self.failed, self.bytes_written,
+                self.elapsed, self.decks_per_second
+            )
+        )
+
+    def _add_failure(self, idx, record, error):
+        self.failures.append((idx, record, error))
+
+    def _add_success(self, byte_count):
+        self.succeeded += 1
+        self.bytes_written += byte_count
+
+    def _finish(self):
+        self.elapsed = time.time() - self._start
+
+
+def main(argv=None):
+    """
+    Command-line entry point. Records are read from a JSON-lines file, one
+    record per line, and the render function is named as
+    ``package.module:function``. Returns the process exit status, 1 when any
+    record failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m pptx.batch',
+        description='Generate a deck from a template for each data record.'
+    )
+    parser.add_argument(
+        'template', help='template .pptx file, "-" for the default template'
+    )
+    parser.add_argument(
+        'render', help='render function as package.module:function'
+    )
+    parser.add_argument('records', help='JSON-lines file of data records')
+    parser.add_argument(
+        'output', help='output directory, or a path ending in .zip'
+    )
+    parser.add_argument(
+        '-j', '--processes', type=int, default=None,
+        help='number of worker processes (default: number of CPUs)'
+    )
+    args = parser.parse_args(argv)
+
+    template = None if args.template == '-' else args.template
+    with open(args.records) as f:
+        records = (json.loads(line) for line in f if line.strip())
+        result = generate_decks(
+            template, _import_function(args.render), records, args.output,
+            args.processes
+        )
+
+    for idx, record, error in result.failures:
+        print('record %d failed:\n%s' % (idx, error), file=sys.stderr)
+    print(result)
+    return 1 if result.failures else 0
+
+
+class _DeckWriter(object):
+    """
+    Context manager writing each deck blob to a directory or a zip archive,
+    depending on *output*.
+    """
+    def __init__(self, output):
+        super(_DeckWriter, self).__init__()
+        self._output = output
+        self._zipf = None
+
+    def __enter__(self):
+        if self._output.lower().endswith('.zip'):
+            self._zipf = zipfile.ZipFile(
+                self._output, 'w', zipfile.ZIP_STORED
+            )
+        elif not os.path.isdir(self._output):
+            os.makedirs(self._output)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if self._zipf is not None:
+            self._zipf.close()
+
+    def write(self, filename, blob):
+        """
+        Write *blob* as *filename*. A .pptx file is already compressed, so
+        decks are stored uncompressed in a zip archive.
+        """
+        if self._zipf is not None:
+            self._zipf.writestr(filename, blob)
+            return
+        with open(os.path.join(self._output, filename), 'wb') as f:
+            f.write(blob)
+
+
+# worker process state and functions ---------------------------------
+
+_worker_template = None
+_worker_render = None
+
+
+#: Number of records handed to the pool ahead of the decks written, for
+#: each worker process.
+_RECORDS_PER_PROCESS = 2
+
+
+def _bounded_feed(items, slots, stopped):
+    """
+    Generate each of *items*, first acquiring one of *slots*, a semaphore
+    released as each result is consumed. Stops early once *stopped* is set.
+    """
+    for item in items:
+        slots.acquire()
+        if stopped.is_set():
+            return
+        yield item
+
+
+def _default_name(record, idx):
+    return 'deck-%06d.pptx' % (idx + 1)
+
+
+def _import_function(qualified_name):
+    """
+    Return the function named by *qualified_name*, like
+    'package.module:function'.
+    """
+    module_name, _, function_name = qualified_name.partition(':')
+    if not function_name:
+        raise ValueError(
+            "render function must be given as 'module:function', got '%s'"
+            % qualified_name
+        )
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _init_worker(template, render):
+    """
+    Load the template once for each worker process.
+    """
+    global _worker_render, _worker_template
+    _worker_template = PresentationTemplate(template)
+    _worker_render = render
+
+
+def _render_all(template, render, records, processes):
+    """
+    Generate an `(idx, record, blob, error)` 4-tuple for each of *records*,
+    in completion order when a pool of *processes* workers is used.
+    """
+    indexed_records = enumerate(records)
+    if processes == 0:
+        _init_worker(template, render)
+        for item in indexed_records:
+            yield _render_one(item)
+        return
+
+    # a pool respawns a worker whose initializer raises, endlessly, so
+    # a template that cannot be loaded must fail here rather than there
+    PresentationTemplate(template)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    slots = threading.Semaphore(_RECORDS_PER_PROCESS * processes)
+    stopped = threading.Event()
+    pool = multiprocessing.Pool(
+        processes, initializer=_init_worker, initargs=(template, render)
+    )
+    try:
+        for result in pool.imap_unordered(
+                _render_one, _bounded_feed(indexed_records, slots, stopped)):
+            slots.release()
+            yield result
+        pool.close()
+    except BaseException:
+        # wake the feeder if it is waiting for a slot so the pool can stop
+        stopped.set()
+        slots.release()
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _render_one(indexed_record):
+    """
+    Return an `(idx, record, blob, error)` 4-tuple for *indexed_record*, an
+    `(idx, record)` pair. *error* is the formatted traceback when rendering
+    failed, in which case *blob* is |None|.
+    """
+    idx, record = indexed_record
+    try:
+        prs = _worker_template.new_presentation()
+        _worker_render(prs, record)
+        stream = BytesIO()
+        prs.save(stream)
+    except Exception:
+        return idx, record, None, traceback.format_exc()
+    return idx, record, stream.getvalue(), None
+
+
+if __name__ == '__main__':
+    # run the imported module's main() so the functions sent to worker
+    # processes are pickled by their `pptx.batch` name, not as `__main__`
+    from pptx.batch import main as batch_main
+    sys.exit(batch_main())
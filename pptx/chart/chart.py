@@ -154,14 +154,44 @@ class Chart(PartElementProxy):
         plotArea = self._chartSpace.chart.plotArea
         return _Plots(plotArea, self)
 
-    def replace_data(self, chart_data):
+    def replace_data(self, chart_data, incremental=False):
         """
         Use the categories and series values in the |ChartData| object
         *chart_data* to replace those in the XML and Excel worksheet for this
         chart.
+
+        When *incremental* is |True|, only those series whose name, values,
+        or worksheet references differ from those already cached in the
+        chart XML are rewritten. If the worksheet layout is unchanged, the
+        cells of the changed series are overwritten in the existing embedded
+        workbook rather than regenerating it. The workbook is assumed to be
+        consistent with the cached chart data, as it is for a chart created
+        or last updated by |pptx|. The workbook is always regenerated for
+        data downsampled keeping its full resolution, whose worksheet of the
+        full resolution data is not reflected in the chart XML.
         """
         rewriter = SeriesXmlRewriterFactory(self.chart_type, chart_data)
-        rewriter.replace_series_data(self._chartSpace)
+
+        if not incremental:
+            rewriter.replace_series_data(self._chartSpace)
+            self._workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
+            return
+
+        changed_series, layout_unchanged = rewriter.update_series_data(
+            self._chartSpace
+        )
+        if chart_data.full_resolution_data is not None:
+            self._workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
+            return
+        if not changed_series and layout_unchanged:
+            return
+        if layout_unchanged:
+            cells = [
+                cell for series_data in changed_series
+                for cell in chart_data.series_cells(series_data)
+            ]
+            if self._workbook.update_cells(cells):
+                return
         self._workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
 
     @lazyproperty
@@ -11,6 +11,7 @@ from collections import Sequence
 from numbers import Number
 
 from ..util import lazyproperty
+from .downsample import LTTB, downsample_indices
 from .xlsx import (
     BubbleWorkbookWriter, CategoryWorkbookWriter, XyWorkbookWriter
 )
@@ -31,6 +32,7 @@ class _BaseChartData(Sequence):
         super(_BaseChartData, self).__init__()
         self._number_format = number_format
         self._series = []
+        self._full_resolution_data = None
 
     def __getitem__(self, index):
         return self._series.__getitem__(index)
@@ -41,6 +43,32 @@ class _BaseChartData(Sequence):
     def append(self, series):
         return self._series.append(series)
 
+    def downsample(self, max_points, method=LTTB, keep_full_resolution=False):
+        """
+        Reduce each series in this chart data to at most *max_points* data
+        points, so the chart remains responsive in PowerPoint when the source
+        data has many thousands of points. Must be called after all series
+        are added and before the chart data is used to create or replace a
+        chart. *method* is either ``'lttb'`` (largest-triangle-three-buckets,
+        the default) which best preserves the visual shape of a line, or
+        ``'min_max'`` which keeps the lowest and highest point in each of
+        `max_points // 2` buckets. A series having no more than *max_points*
+        points is left unchanged.
+
+        When *keep_full_resolution* is |True|, the data as it was before
+        downsampling is also written to a second worksheet named "Full
+        Resolution" in the embedded Excel workbook. The chart itself always
+        depicts the downsampled data.
+        """
+        full_resolution_data = (
+            self._full_resolution_copy()
+            if keep_full_resolution and self._full_resolution_data is None
+            else None
+        )
+        self._downsample(max_points, method)
+        if full_resolution_data is not None:
+            self._full_resolution_data = full_resolution_data
+
     def data_point_offset(self, series):
         """
         The total integer number of data points appearing in the series of
@@ -53,6 +81,15 @@ class _BaseChartData(Sequence):
             count += len(this_series)
         raise ValueError('series not in chart data object')
 
+    @property
+    def full_resolution_data(self):
+        """
+        A chart data object containing the data in this one as it was before
+        being downsampled with *keep_full_resolution* |True|, or |None| if no
+        full-resolution data was kept.
+        """
+        return self._full_resolution_data
+
     @property
     def number_format(self):
         """
@@ -64,6 +101,22 @@ class _BaseChartData(Sequence):
         """
         return self._number_format
 
+    def new_chartSpace(self, chart_type):
+        """
+        Return a newly created `c:chartSpace` element for a chart of
+        *chart_type* containing the series in this chart data object. This
+        is equivalent to parsing :meth:`xml_bytes` but avoids re-parsing the
+        parts of the chart XML that do not depend on the series.
+        """
+        return ChartXmlWriter(chart_type, self).chartSpace
+
+    def series_cells(self, series):
+        """
+        Return a `(row, col, value)` 3-tuple for each Excel worksheet cell
+        written for *series*, with zero-based row and column offsets.
+        """
+        return self._workbook_writer.series_cells(series)
+
     def series_index(self, series):
         """
         Return the integer index of *series* in this sequence.
@@ -110,6 +163,21 @@ class _BaseChartData(Sequence):
         """
         return self._workbook_writer.y_values_ref(series)
 
+    def _downsample(self, max_points, method):
+        """
+        Reduce the data points in each series to at most *max_points* using
+        *method*. Must be implemented by each subclass.
+        """
+        raise NotImplementedError('must be implemented by all subclasses')
+
+    def _full_resolution_copy(self):
+        """
+        Return a new chart data object containing the same series and data
+        points as this one, unaffected by later downsampling of this one.
+        Must be implemented by each subclass.
+        """
+        raise NotImplementedError('must be implemented by all subclasses')
+
     @property
     def _workbook_writer(self):
         """
@@ -229,6 +297,18 @@ class _BaseSeriesData(Sequence):
         """
         return self._chart_data.y_values_ref(self)
 
+    def _retain(self, offsets):
+        """
+        Discard all data points in this series other than those at
+        *offsets*, a sorted sequence of integers. Offsets beyond the end of
+        this series are ignored.
+        """
+        data_points = self._data_points
+        self._data_points = [
+            data_points[offset] for offset in offsets
+            if offset < len(data_points)
+        ]
+
 
 class _BaseDataPoint(object):
     """
@@ -331,6 +411,49 @@ class CategoryChartData(_BaseChartData):
         """
         return self._workbook_writer.values_ref(series)
 
+    def _downsample(self, max_points, method):
+        """
+        Reduce each series to at most *max_points* data points using
+        *method*. Categories are shared by all series, so the points kept are
+        the union of those selected for each series and the category labels
+        are reduced to match. This means the result can have more than
+        *max_points* points when the series differ in shape.
+        """
+        categories = self.categories
+        if categories.depth > 1:
+            raise ValueError('cannot downsample multi-level categories')
+        if all(len(series) <= max_points for series in self):
+            return
+
+        offsets = set()
+        for series in self:
+            values = series.values
+            offsets.update(
+                downsample_indices(
+                    list(range(len(values))), values, max_points, method
+                )
+            )
+        offsets = sorted(offsets)
+
+        categories._retain(offsets)
+        for series in self:
+            series._retain(offsets)
+
+    def _full_resolution_copy(self):
+        """
+        Return a new |CategoryChartData| object having the same categories
+        and series as this one.
+        """
+        chart_data = CategoryChartData(self._number_format)
+        categories = self.categories
+        chart_data.categories = [category.label for category in categories]
+        chart_data.categories.number_format = categories._number_format
+        for series in self:
+            chart_data.add_series(
+                series.name, series.values, series._number_format
+            )
+        return chart_data
+
     @lazyproperty
     def _workbook_writer(self):
         """
@@ -506,6 +629,18 @@ class Categories(Sequence):
     def number_format(self, value):
         self._number_format = value
 
+    def _retain(self, offsets):
+        """
+        Discard all categories other than those at *offsets*, a sorted
+        sequence of integers. Offsets beyond the last category are ignored.
+        Only valid for single-level categories.
+        """
+        categories = self._categories
+        self._categories = [
+            categories[offset] for offset in offsets
+            if offset < len(categories)
+        ]
+
 
 class Category(object):
     """
@@ -696,6 +831,32 @@ class XyChartData(_BaseChartData):
         self.append(series_data)
         return series_data
 
+    def _downsample(self, max_points, method):
+        """
+        Reduce each series independently to at most *max_points* data points
+        using *method*, based on the X and Y value of each point.
+        """
+        for series in self:
+            series._retain(
+                downsample_indices(
+                    series.x_values, series.y_values, max_points, method
+                )
+            )
+
+    def _full_resolution_copy(self):
+        """
+        Return a new chart data object of the same type as this one, having
+        the same series and data points.
+        """
+        chart_data = type(self)(self._number_format)
+        for series in self:
+            series_copy = chart_data.add_series(
+                series.name, series._number_format
+            )
+            for data_point in series:
+                series_copy.append(data_point)
+        return chart_data
+
     @lazyproperty
     def _workbook_writer(self):
         """
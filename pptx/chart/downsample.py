@@ -0,0 +1,187 @@
+# encoding: utf-8
+
+"""
+Point-selection algorithms used to reduce oversized chart series to a target
+number of data points.
+
+Each algorithm returns the sorted offsets of the points to keep rather than
+the reduced values themselves, so a chart data object can retain the
+selected data point objects, including any per-point number format. NumPy is
+used to vectorize the per-bucket computations when it is installed; the pure
+Python implementation produces the same selection.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+LTTB = 'lttb'
+MIN_MAX = 'min_max'
+
+
+def downsample_indices(xs, ys, max_points, method=LTTB):
+    """
+    Return a sorted list of the offsets of at most *max_points* points
+    selected from the points defined by *xs* and *ys* using *method*, either
+    ``'lttb'`` (largest-triangle-three-buckets) or ``'min_max'`` (the lowest
+    and highest point in each bucket). All offsets are returned when there
+    are no more than *max_points* points. A point having a |None| Y value is
+    otherwise never selected.
+    """
+    if method not in (LTTB, MIN_MAX):
+        raise ValueError(
+            "downsampling method must be 'lttb' or 'min_max', got %r" % method
+        )
+    if max_points < 3:
+        raise ValueError('max_points must be at least 3, got %d' % max_points)
+    if len(ys) <= max_points:
+        return list(range(len(ys)))
+
+    present = [idx for idx, y in enumerate(ys) if y is not None]
+    if len(present) < len(ys):
+        xs = [xs[idx] for idx in present]
+        ys = [ys[idx] for idx in present]
+        if len(ys) <= max_points:
+            return present
+        return [
+            present[idx]
+            for idx in downsample_indices(xs, ys, max_points, method)
+        ]
+
+    if method == LTTB:
+        return lttb_indices(xs, ys, max_points)
+    return min_max_indices(ys, max_points)
+
+
+def lttb_indices(xs, ys, max_points):
+    """
+    Return the offsets of the *max_points* points selected from *xs* and
+    *ys* by the largest-triangle-three-buckets algorithm. The first and last
+    points are always selected. Each remaining bucket contributes the point
+    forming the largest triangle with the previously selected point and the
+    average of the following bucket.
+    """
+    if numpy is not None:
+        return _lttb_indices_numpy(xs, ys, max_points)
+
+    point_count = len(ys)
+    every = (point_count - 2) / (max_points - 2)
+    selected = [0]
+    a = 0
+    for bucket in range(max_points - 2):
+        avg_start, avg_end = _lttb_avg_range(bucket, every, point_count)
+        avg_len = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / avg_len
+        avg_y = sum(ys[avg_start:avg_end]) / avg_len
+
+        ax, ay = xs[a], ys[a]
+        max_area, next_a = -1.0, None
+        for idx in range(*_lttb_bucket_range(bucket, every)):
+            area = abs(
+                (ax - avg_x) * (ys[idx] - ay) - (ax - xs[idx]) * (avg_y - ay)
+            )
+            if area > max_area:
+                max_area, next_a = area, idx
+
+        selected.append(next_a)
+        a = next_a
+
+    selected.append(point_count - 1)
+    return selected
+
+
+def min_max_indices(ys, max_points):
+    """
+    Return the sorted offsets of the points having the lowest and highest
+    value in each of `max_points // 2` equal-width buckets over *ys*. This
+    preserves the visual envelope of noisy series, such as spikes, that
+    averaging approaches would smooth away.
+    """
+    if numpy is not None:
+        return _min_max_indices_numpy(ys, max_points)
+
+    selected = []
+    for start, end in _min_max_bucket_ranges(len(ys), max_points):
+        offsets = range(start, end)
+        lo = min(offsets, key=ys.__getitem__)
+        hi = max(offsets, key=ys.__getitem__)
+        selected.extend(sorted(set((lo, hi))))
+    return selected
+
+
+def _lttb_avg_range(bucket, every, point_count):
+    """
+    Return the (start, end) offsets of the bucket following *bucket*, whose
+    average is the third vertex of each candidate triangle.
+    """
+    start = int((bucket + 1) * every) + 1
+    end = min(int((bucket + 2) * every) + 1, point_count)
+    return start, end
+
+
+def _lttb_bucket_range(bucket, every):
+    """
+    Return the (start, end) offsets of the candidate points in *bucket*.
+    """
+    return int(bucket * every) + 1, int((bucket + 1) * every) + 1
+
+
+def _lttb_indices_numpy(xs, ys, max_points):
+    """
+    NumPy implementation of :func:`lttb_indices`. Buckets are still visited
+    in sequence since each selection depends on the previous one, but the
+    averages and triangle areas are computed a bucket at a time.
+    """
+    xs = numpy.asarray(xs, dtype=float)
+    ys = numpy.asarray(ys, dtype=float)
+    point_count = len(ys)
+    every = (point_count - 2) / (max_points - 2)
+    selected = [0]
+    a = 0
+    for bucket in range(max_points - 2):
+        avg_start, avg_end = _lttb_avg_range(bucket, every, point_count)
+        avg_x = xs[avg_start:avg_end].mean()
+        avg_y = ys[avg_start:avg_end].mean()
+
+        start, end = _lttb_bucket_range(bucket, every)
+        ax, ay = xs[a], ys[a]
+        areas = numpy.abs(
+            (ax - avg_x) * (ys[start:end] - ay) -
+            (ax - xs[start:end]) * (avg_y - ay)
+        )
+        a = start + int(areas.argmax())
+        selected.append(a)
+
+    selected.append(point_count - 1)
+    return selected
+
+
+def _min_max_bucket_ranges(point_count, max_points):
+    """
+    Generate the (start, end) offsets of each min/max bucket.
+    """
+    bucket_count = max_points // 2
+    for bucket in range(bucket_count):
+        start = bucket * point_count // bucket_count
+        end = (bucket + 1) * point_count // bucket_count
+        yield start, end
+
+
+def _min_max_indices_numpy(ys, max_points):
+    """
+    NumPy implementation of :func:`min_max_indices`.
+    """
+    ys = numpy.asarray(ys, dtype=float)
+    selected = []
+    for start, end in _min_max_bucket_ranges(len(ys), max_points):
+        values = ys[start:end]
+        lo = start + int(values.argmin())
+        hi = start + int(values.argmax())
+        selected.extend(sorted(set((lo, hi))))
+    return selected
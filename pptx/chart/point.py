@@ -12,7 +12,9 @@ from collections import Sequence
 
 from .datalabel import DataLabel
 from ..dml.chtfmt import ChartFormat
+from ..dml.color import RGBColor
 from .marker import Marker
+from ..text.text import TextFrame
 from ..util import lazyproperty
 
 
@@ -30,6 +32,75 @@ class _BasePoints(Sequence):
             raise IndexError('point index out of range')
         return Point(self._ser, idx)
 
+    def format_points(self, fills=None, labels=None, markers=None):
+        """
+        Apply per-point formatting to many points in this series at once.
+        Each argument is either a mapping of point index to value or
+        a sequence having the value for point *n* at offset *n*, where
+        a |None| item leaves that point unchanged. *fills* values are an
+        |RGBColor| or :ref:`MsoThemeColorIndex` member applied as a solid
+        fill, *labels* values are the text of the point's data label, and
+        *markers* values are an :ref:`XlMarkerStyle` member.
+
+        This produces the same XML as assigning each point's properties
+        individually through :attr:`Point.format`, :attr:`Point.data_label`,
+        and :attr:`Point.marker`, but the `c:dPt` and `c:dLbl` elements are
+        all added and placed in point order in a single pass, which matters
+        when formatting thousands of points. Raises |IndexError| when a point
+        index is out of range.
+        """
+        fills = self._point_values(fills)
+        labels = self._point_values(labels)
+        markers = self._point_values(markers)
+
+        dPt_idxs = set(idx for idx, _ in fills + markers)
+        dPts = self._ser.get_or_add_dPts(dPt_idxs) if dPt_idxs else {}
+
+        for idx, color in fills:
+            fill = ChartFormat(dPts[idx]).fill
+            fill.solid()
+            if isinstance(color, RGBColor):
+                fill.fore_color.rgb = color
+            else:
+                fill.fore_color.theme_color = color
+
+        for idx, style in markers:
+            Marker(dPts[idx]).style = style
+
+        if labels:
+            dLbls = self._ser.get_or_add_dLbls()
+            dLbl_map = dLbls.get_or_add_dLbls_for_points(
+                [idx for idx, _ in labels]
+            )
+            for idx, text in labels:
+                dLbl = dLbl_map[idx]
+                # c:spPr or c:txPr alongside c:tx causes the "can't save" bug
+                # on bubble charts, as for an individual |DataLabel|.
+                dLbl._remove_spPr()
+                dLbl._remove_txPr()
+                TextFrame(dLbl.get_or_add_rich(), self).text = text
+
+    def _point_values(self, values):
+        """
+        Return a list of (idx, value) pairs for the items in *values*, either
+        a mapping of point index to value or a sequence of values in point
+        order. Items having a value of |None| are skipped.
+        """
+        if values is None:
+            return []
+        items = (
+            values.items() if hasattr(values, 'items') else enumerate(values)
+        )
+        point_count = self.__len__()
+        point_values = []
+        for idx, value in items:
+            if value is None:
+                continue
+            if idx < 0 or idx >= point_count:
+                raise IndexError('point index out of range')
+            point_values.append((idx, value))
+        return point_values
+
 
 class BubblePoints(_BasePoints):
     """
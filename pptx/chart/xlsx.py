@@ -6,11 +6,15 @@ Chart builder and related objects.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import posixpath
+
 from contextlib import contextmanager
+from numbers import Number
+from zipfile import ZipFile
 
-from xlsxwriter import Workbook
+from lxml import etree
 
-from ..compat import BytesIO
+from ..compat import BytesIO, is_integer, is_string
 
 
 class _BaseWorkbookWriter(object):
@@ -30,6 +34,7 @@ class _BaseWorkbookWriter(object):
         xlsx_file = BytesIO()
         with self._open_worksheet(xlsx_file) as (workbook, worksheet):
             self._populate_worksheet(workbook, worksheet)
+            self._write_full_resolution_worksheet(workbook)
         return xlsx_file.getvalue()
 
     @contextmanager
@@ -40,11 +45,21 @@ class _BaseWorkbookWriter(object):
         stream object (such as a ``BytesIO`` instance) is expected as
         *xlsx_file*.
         """
+        from xlsxwriter import Workbook
+
         workbook = Workbook(xlsx_file, {'in_memory': True})
         worksheet = workbook.add_worksheet()
         yield workbook, worksheet
         workbook.close()
 
+    def series_cells(self, series):
+        """
+        Return a list of `(row, col, value)` 3-tuples, one for each worksheet
+        cell written for *series*, including its name. Row and column are
+        zero-based offsets. Must be overridden by each subclass.
+        """
+        raise NotImplementedError('must be provided by each subclass')
+
     def _populate_worksheet(self, workbook, worksheet):
         """
         Must be overridden by each subclass to provide the particulars of
@@ -52,6 +67,19 @@ class _BaseWorkbookWriter(object):
         """
         raise NotImplementedError('must be provided by each subclass')
 
+    def _write_full_resolution_worksheet(self, workbook):
+        """
+        Write the data kept when the chart data was downsampled, if any, to
+        a second worksheet in *workbook*, in the same layout as the first.
+        The chart does not reference this worksheet.
+        """
+        full_resolution_data = self._chart_data.full_resolution_data
+        if full_resolution_data is None:
+            return
+        worksheet = workbook.add_worksheet('Full Resolution')
+        workbook_writer = type(self)(full_resolution_data)
+        workbook_writer._populate_worksheet(workbook, worksheet)
+
 
 class CategoryWorkbookWriter(_BaseWorkbookWriter):
     """
@@ -80,6 +108,18 @@ class CategoryWorkbookWriter(_BaseWorkbookWriter):
         """
         return "Sheet1!$%s$1" % self._series_col_letter(series)
 
+    def series_cells(self, series):
+        """
+        Return a `(row, col, value)` 3-tuple for each worksheet cell written
+        for *series*; its name in the first row followed by its values.
+        """
+        col = series.categories.depth + series.index
+        cells = [(0, col, series.name)]
+        cells.extend(
+            (idx + 1, col, value) for idx, value in enumerate(series.values)
+        )
+        return cells
+
     def values_ref(self, series):
         """
         The Excel worksheet reference to the values for this series (not
@@ -167,6 +207,19 @@ class XyWorkbookWriter(_BaseWorkbookWriter):
         row = self.series_table_row_offset(series) + 1
         return 'Sheet1!$B$%d' % row
 
+    def series_cells(self, series):
+        """
+        Return a `(row, col, value)` 3-tuple for each worksheet cell written
+        for *series*; its name as the heading of the Y column followed by
+        each X and Y value.
+        """
+        offset = self.series_table_row_offset(series)
+        cells = [(offset, 1, series.name)]
+        for idx, (x, y) in enumerate(zip(series.x_values, series.y_values)):
+            row = offset + idx + 1
+            cells.extend([(row, 0, x), (row, 1, y)])
+        return cells
+
     def series_table_row_offset(self, series):
         """
         Return the number of rows preceding the data table for *series* in
@@ -234,6 +287,19 @@ class BubbleWorkbookWriter(XyWorkbookWriter):
         bottom_row = top_row + len(series) - 1
         return "Sheet1!$C$%d:$C$%d" % (top_row, bottom_row)
 
+    def series_cells(self, series):
+        """
+        Return a `(row, col, value)` 3-tuple for each worksheet cell written
+        for *series*, including the bubble size column.
+        """
+        cells = super(BubbleWorkbookWriter, self).series_cells(series)
+        offset = self.series_table_row_offset(series)
+        cells.extend(
+            (offset + idx + 1, 2, size)
+            for idx, size in enumerate(series.bubble_sizes)
+        )
+        return cells
+
     def _populate_worksheet(self, workbook, worksheet):
         """
         Write chart data contents to *worksheet* in the bubble chart layout.
@@ -264,3 +330,186 @@ class BubbleWorkbookWriter(XyWorkbookWriter):
             worksheet.write_column(
                 offset+1, 2, series.bubble_sizes, chart_num_format
             )
+
+
+class WorksheetCellPatcher(object):
+    """
+    Overwrites the values of individual cells in the `Sheet1` worksheet of an
+    existing Excel workbook blob, leaving the other members of the workbook
+    package untouched. This is much cheaper than regenerating the workbook
+    when only a few series of a chart have changed.
+    """
+
+    _nsmap = {
+        'r': (
+            'http://schemas.openxmlformats.org/officeDocument/2006/relations'
+            'hips'
+        ),
+        'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+        's': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    }
+
+    def __init__(self, xlsx_blob):
+        super(WorksheetCellPatcher, self).__init__()
+        self._xlsx_blob = xlsx_blob
+
+    def patched_blob(self, cells):
+        """
+        Return a new workbook blob in which the value of each cell in
+        *cells*, a sequence of `(row, col, value)` 3-tuples, has been
+        written to the worksheet. Return |None| if the worksheet cannot be
+        located, in which case the caller should regenerate the workbook.
+        """
+        with ZipFile(BytesIO(self._xlsx_blob)) as zipf:
+            sheet_path = self._sheet_path(zipf)
+            if sheet_path is None:
+                return None
+            sheet = etree.fromstring(zipf.read(sheet_path))
+            sheetData = sheet.find(self._qn('s:sheetData'))
+            if sheetData is None:
+                return None
+            for row, col, value in cells:
+                self._write_cell(sheetData, row, col, value)
+            sheet_xml = etree.tostring(
+                sheet, encoding='UTF-8', standalone=True
+            )
+
+            xlsx_file = BytesIO()
+            with ZipFile(xlsx_file, 'w') as new_zipf:
+                for info in zipf.infolist():
+                    if info.filename == sheet_path:
+                        new_zipf.writestr(info, sheet_xml)
+                    else:
+                        new_zipf.writestr(info, zipf.read(info))
+        return xlsx_file.getvalue()
+
+    @staticmethod
+    def _cell_ref(row, col):
+        """
+        Return the A1-style reference for the cell at zero-based *row* and
+        *col*, e.g. 'AB12'.
+        """
+        col_letters = ''
+        col += 1
+        while col:
+            col, rem = divmod(col - 1, 26)
+            col_letters = chr(ord('A') + rem) + col_letters
+        return '%s%d' % (col_letters, row + 1)
+
+    @staticmethod
+    def _col_offset(cell_ref):
+        """
+        Return the zero-based column offset of A1-style *cell_ref*.
+        """
+        col = 0
+        for char in cell_ref:
+            if char.isdigit():
+                break
+            col = col * 26 + ord(char) - ord('A') + 1
+        return col - 1
+
+    def _get_or_add_c(self, row_elm, ref, col):
+        """
+        Return the `c` element for cell *ref* in *row_elm*, newly inserted in
+        column order if not present.
+        """
+        c_tag = self._qn('s:c')
+        for c in row_elm.iterchildren(c_tag):
+            c_ref = c.get('r')
+            if c_ref == ref:
+                return c
+            if c_ref is not None and self._col_offset(c_ref) > col:
+                new_c = etree.Element(c_tag, r=ref)
+                c.addprevious(new_c)
+                return new_c
+        return etree.SubElement(row_elm, c_tag, r=ref)
+
+    def _get_or_add_row(self, sheetData, row):
+        """
+        Return the `row` element for zero-based *row* in *sheetData*, newly
+        inserted in row order if not present.
+        """
+        row_tag, r = self._qn('s:row'), row + 1
+        for row_elm in sheetData.iterchildren(row_tag):
+            row_r = int(row_elm.get('r', 0))
+            if row_r == r:
+                return row_elm
+            if row_r > r:
+                new_row = etree.Element(row_tag, r=str(r))
+                row_elm.addprevious(new_row)
+                return new_row
+        return etree.SubElement(sheetData, row_tag, r=str(r))
+
+    @classmethod
+    def _qn(cls, tag):
+        """
+        Return the Clark-notation qualified name of namespace-prefixed *tag*.
+        """
+        prefix, tagroot = tag.split(':')
+        return '{%s}%s' % (cls._nsmap[prefix], tagroot)
+
+    def _sheet_path(self, zipf):
+        """
+        Return the package path of the worksheet named `Sheet1` (or the first
+        worksheet when none has that name) in workbook package *zipf*, or
+        |None| if it cannot be determined.
+        """
+        try:
+            workbook = etree.fromstring(zipf.read('xl/workbook.xml'))
+            rels = etree.fromstring(zipf.read('xl/_rels/workbook.xml.rels'))
+        except KeyError:
+            return None
+
+        sheets = workbook.xpath('s:sheets/s:sheet', namespaces=self._nsmap)
+        if not sheets:
+            return None
+        named = [sheet for sheet in sheets if sheet.get('name') == 'Sheet1']
+        rId = (named or sheets)[0].get(self._qn('r:id'))
+
+        targets = rels.xpath(
+            'rel:Relationship[@Id="%s"]/@Target' % rId,
+            namespaces=self._nsmap
+        )
+        if not targets:
+            return None
+        target = targets[0]
+        if target.startswith('/'):
+            return target[1:]
+        return posixpath.normpath(posixpath.join('xl', target))
+
+    def _write_cell(self, sheetData, row, col, value):
+        """
+        Write *value* to the cell at *row* and *col*, preserving its style.
+        A string is written as an inline string. |None| leaves the cell
+        blank.
+        """
+        ref = self._cell_ref(row, col)
+        c = self._get_or_add_c(self._get_or_add_row(sheetData, row), ref, col)
+        for child in list(c):
+            c.remove(child)
+        c.attrib.pop('t', None)
+
+        if value is None:
+            return
+
+        if is_string(value):
+            c.set('t', 'inlineStr')
+            is_ = etree.SubElement(c, self._qn('s:is'))
+            t = etree.SubElement(is_, self._qn('s:t'))
+            t.text = value
+            if value != value.strip():
+                t.set(
+                    '{http://www.w3.org/XML/1998/namespace}space', 'preserve'
+                )
+            return
+
+        if isinstance(value, bool):
+            c.set('t', 'b')
+            etree.SubElement(c, self._qn('s:v')).text = '1' if value else '0'
+            return
+
+        if not isinstance(value, Number):
+            raise TypeError('cannot write %r to worksheet cell' % value)
+        etree.SubElement(c, self._qn('s:v')).text = (
+            '%d' % value if is_integer(value) else repr(float(value))
+        )
@@ -6,6 +6,7 @@ Composers for default chart XML for various chart types.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from collections import OrderedDict
 from copy import deepcopy
 from xml.sax.saxutils import escape
 
@@ -95,14 +96,83 @@ class _BaseChartXmlWriter(object):
         self._chart_data = series_seq
         self._series_seq = list(series_seq)
 
+    # skeleton `c:chartSpace` elements, keyed by their XML text, shared by
+    # all writers; only the most recently used are kept, as the text varies
+    # with the number format and axis options of the chart data
+    _skeletons = OrderedDict()
+    _max_skeletons = 32
+
+    @property
+    def chartSpace(self):
+        """
+        A newly created `c:chartSpace` element for the chart specified by
+        this chart builder. The series-independent "skeleton" of the chart,
+        comprising axes, legend, and plot options, is parsed only once for
+        each distinct chart type and option set and deep-copied thereafter;
+        only the `c:ser` elements are parsed for each new chart.
+        """
+        chartSpace = deepcopy(self._skeleton)
+        xChart = chartSpace.plotArea.xCharts[0]
+        for ser in self._sers:
+            xChart._insert_ser(ser)
+        return chartSpace
+
     @property
     def xml(self):
         """
         The full XML stream for the chart specified by this chart builder, as
-        unicode text. This method must be overridden by each subclass.
+        unicode text.
+        """
+        return self._chartSpace_xml(self._ser_xml)
+
+    def _chartSpace_xml(self, ser_xml):
+        """
+        Return the full XML for this chart as unicode text, with *ser_xml*
+        inserted as the series elements of its plot. This method must be
+        overridden by each subclass.
+        """
+        raise NotImplementedError('must be implemented by all subclasses')
+
+    @property
+    def _sers(self):
+        """
+        A list of newly parsed `c:ser` elements, one for each series in this
+        chart, in series order.
+        """
+        plotArea = parse_xml(
+            '<c:plotArea %s>\n%s</c:plotArea>' % (
+                nsdecls('c', 'a', 'r'), self._ser_xml
+            )
+        )
+        return list(plotArea)
+
+    @property
+    def _ser_xml(self):
+        """
+        The XML for the `c:ser` elements of this chart as unicode text. This
+        property must be overridden by each subclass.
         """
         raise NotImplementedError('must be implemented by all subclasses')
 
+    @property
+    def _skeleton(self):
+        """
+        The cached skeleton `c:chartSpace` element for this chart, containing
+        no series. The skeleton is parsed from the chart XML with no series
+        on first use and must not be modified. The least recently used
+        skeleton is dropped once more than `_max_skeletons` are cached.
+        """
+        skeletons = _BaseChartXmlWriter._skeletons
+        skeleton_xml = self._chartSpace_xml('')
+        skeleton = skeletons.pop(skeleton_xml, None)
+        if skeleton is None:
+            skeleton = parse_xml(skeleton_xml.encode('utf-8'))
+            while len(skeletons) >= self._max_skeletons:
+                skeletons.popitem(last=False)
+        # re-inserted, so the most recently used is last
+        skeletons[skeleton_xml] = skeleton
+        return skeleton
+
 
 class _BaseSeriesXmlWriter(object):
     """
@@ -237,6 +307,37 @@ class _BaseSeriesXmlRewriter(object):
         for ser, series_data in zip(plotArea.sers, chart_data):
             self._rewrite_ser_data(ser, series_data, date_1904)
 
+    def update_series_data(self, chartSpace):
+        """
+        Rewrite only those series under *chartSpace* having cached data that
+        differs from the corresponding series in the chart data. Series are
+        matched by position and compared on their name, values, and
+        worksheet references. The series count is adjusted just as it is in
+        :meth:`replace_series_data`.
+
+        Returns a `(changed_series, layout_unchanged)` 2-tuple.
+        *changed_series* is a list of the series data objects that were
+        rewritten. *layout_unchanged* is |True| when the worksheet layout
+        implied by the new data is the same as before, such that the
+        workbook can be updated by overwriting just the cells of the changed
+        series.
+        """
+        plotArea, date_1904 = chartSpace.plotArea, chartSpace.date_1904
+        chart_data = self._chart_data
+        layout_unchanged = len(plotArea.sers) == len(chart_data)
+        self._adjust_ser_count(plotArea, len(chart_data))
+        changed_series = []
+        for ser, series_data in zip(plotArea.sers, chart_data):
+            old_sigs = self._ser_signatures(ser)
+            new_sigs = self._series_data_signatures(series_data, date_1904)
+            if old_sigs == new_sigs:
+                continue
+            if not self._same_layout(old_sigs, new_sigs):
+                layout_unchanged = False
+            self._rewrite_ser_data(ser, series_data, date_1904)
+            changed_series.append(series_data)
+        return changed_series, layout_unchanged
+
     def _add_cloned_sers(self, plotArea, count):
         """
         Add `c:ser` elements to the last xChart element in *plotArea*, cloned
@@ -275,6 +376,88 @@ class _BaseSeriesXmlRewriter(object):
         """
         raise NotImplementedError('must be implemented by each subclass')
 
+    def _same_layout(self, old_sigs, new_sigs):
+        """
+        Return |True| if the signatures in *old_sigs* and *new_sigs* differ
+        only in point values, not in worksheet reference, number format, or
+        point count. A subclass can extend this to name data sources that
+        cannot change without disturbing the worksheet layout.
+        """
+        for tag, new_sig in new_sigs.items():
+            old_sig = old_sigs.get(tag)
+            if old_sig is None or old_sig[:4] != new_sig[:4]:
+                return False
+        return True
+
+    def _series_data_signatures(self, series_data, date_1904):
+        """
+        Return a dict mapping each data source tag rewritten for a series to
+        the signature that data source would have when written from
+        *series_data*.
+        """
+        raise NotImplementedError('must be implemented by each subclass')
+
+    def _ser_signatures(self, ser):
+        """
+        Return a dict mapping the tag of each data source rewritten by this
+        rewriter to its signature as it currently appears in *ser*. A data
+        source not present in *ser* has a signature of |None|.
+        """
+        signatures = {}
+        for tag in self._ser_source_tags:
+            sources = ser.xpath('./%s' % tag)
+            if not sources:
+                signatures[tag] = None
+                continue
+            source = sources[0]
+            signatures[tag] = (
+                tuple(source.xpath('.//c:f/text()')),
+                tuple(source.xpath('.//c:formatCode/text()')),
+                tuple(source.xpath('.//c:ptCount/@val')),
+                len(source.xpath('.//c:lvl')),
+                tuple(
+                    (pt.get('idx'), pt.xpath('string(c:v)'))
+                    for pt in source.xpath('.//c:pt')
+                ),
+            )
+        return signatures
+
+    @property
+    def _ser_source_tags(self):
+        """
+        Sequence of tags of the `c:ser` child elements rewritten by this
+        rewriter, like ``('c:tx', 'c:cat', 'c:val')``.
+        """
+        raise NotImplementedError('must be implemented by each subclass')
+
+    @staticmethod
+    def _numRef_signature(ref, number_format, values):
+        """
+        Return the signature of a `c:numRef` data source having worksheet
+        reference *ref*, *number_format*, and *values*.
+        """
+        return (
+            (ref,),
+            ('{0}'.format(number_format),),
+            ('{0}'.format(len(values)),),
+            0,
+            tuple(
+                ('{0}'.format(idx), '{0}'.format(value))
+                for idx, value in enumerate(values) if value is not None
+            ),
+        )
+
+    @staticmethod
+    def _tx_signature(series_data):
+        """
+        Return the signature of the `c:tx` element written for
+        *series_data*.
+        """
+        return (
+            (series_data.name_ref,), (), ('1',), 0,
+            (('0', series_data.name),)
+        )
+
     def _trim_ser_count_by(self, plotArea, count):
         """
         Remove the last *count* ser elements from *plotArea*. Any xChart
@@ -298,8 +481,7 @@ class _AreaChartXmlWriter(_BaseChartXmlWriter):
     """
     Provides specialized methods particular to the ``<c:areaChart>`` element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         return (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -367,7 +549,7 @@ class _AreaChartXmlWriter(_BaseChartXmlWriter):
             '</c:chartSpace>\n'
         ).format(**{
             'grouping_xml': self._grouping_xml,
-            'ser_xml':      self._ser_xml,
+            'ser_xml':      ser_xml,
             'cat_ax_xml':   self._cat_ax_xml,
         })
 
@@ -455,8 +637,7 @@ class _BarChartXmlWriter(_BaseChartXmlWriter):
     """
     Provides specialized methods particular to the ``<c:barChart>`` element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         return (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -504,7 +685,7 @@ class _BarChartXmlWriter(_BaseChartXmlWriter):
         ).format(**{
             'barDir_xml':   self._barDir_xml,
             'grouping_xml': self._grouping_xml,
-            'ser_xml':      self._ser_xml,
+            'ser_xml':      ser_xml,
             'overlap_xml':  self._overlap_xml,
             'cat_ax_xml':   self._cat_ax_xml,
             'val_ax_pos':   self._val_ax_pos,
@@ -654,8 +835,7 @@ class _DoughnutChartXmlWriter(_BaseChartXmlWriter):
     Provides specialized methods particular to the ``<c:doughnutChart>``
     element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         return (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -705,7 +885,7 @@ class _DoughnutChartXmlWriter(_BaseChartXmlWriter):
             '  </c:txPr>\n'
             '</c:chartSpace>\n'
         ).format(**{
-            'ser_xml':      self._ser_xml,
+            'ser_xml':      ser_xml,
         })
 
     @property
@@ -743,8 +923,7 @@ class _LineChartXmlWriter(_BaseChartXmlWriter):
     """
     Provides specialized methods particular to the ``<c:lineChart>`` element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         return (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -800,7 +979,7 @@ class _LineChartXmlWriter(_BaseChartXmlWriter):
             '</c:chartSpace>\n'
         ).format(**{
             'grouping_xml': self._grouping_xml,
-            'ser_xml':      self._ser_xml,
+            'ser_xml':      ser_xml,
             'cat_ax_xml':   self._cat_ax_xml,
         })
 
@@ -911,8 +1090,7 @@ class _PieChartXmlWriter(_BaseChartXmlWriter):
     """
     Provides specialized methods particular to the ``<c:pieChart>`` element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         return (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -940,7 +1118,7 @@ class _PieChartXmlWriter(_BaseChartXmlWriter):
             '  </c:txPr>\n'
             '</c:chartSpace>\n'
         ).format(**{
-            'ser_xml': self._ser_xml,
+            'ser_xml': ser_xml,
         })
 
     @property
@@ -974,8 +1152,7 @@ class _RadarChartXmlWriter(_BaseChartXmlWriter):
     """
     Generates XML for the ``<c:radarChart>`` element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         return (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -1057,7 +1234,7 @@ class _RadarChartXmlWriter(_BaseChartXmlWriter):
             '</c:chartSpace>\n'
         ).format(**{
             'radar_style': self._radar_style,
-            'ser_xml':     self._ser_xml,
+            'ser_xml':     ser_xml,
         })
 
     @property
@@ -1106,8 +1283,7 @@ class _XyChartXmlWriter(_BaseChartXmlWriter):
     """
     Generates XML for the ``<c:scatterChart>`` element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         xml = (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -1175,7 +1351,7 @@ class _XyChartXmlWriter(_BaseChartXmlWriter):
             '    </a:p>\n'
             '  </c:txPr>\n'
             '</c:chartSpace>\n'
-        ) % (self._scatterStyle_val, self._ser_xml)
+        ) % (self._scatterStyle_val, ser_xml)
         return xml
 
     @property
@@ -1247,8 +1423,7 @@ class _BubbleChartXmlWriter(_XyChartXmlWriter):
     Provides specialized methods particular to the ``<c:bubbleChart>``
     element.
     """
-    @property
-    def xml(self):
+    def _chartSpace_xml(self, ser_xml):
         xml = (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
             '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawin'
@@ -1327,7 +1502,7 @@ class _BubbleChartXmlWriter(_XyChartXmlWriter):
             '    </a:p>\n'
             '  </c:txPr>\n'
             '</c:chartSpace>\n'
-        ) % self._ser_xml
+        ) % ser_xml
         return xml
 
     @property
@@ -1781,6 +1956,30 @@ class _BubbleSeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_yVal(xml_writer.yVal)
         ser._insert_bubbleSize(xml_writer.bubbleSize)
 
+    def _series_data_signatures(self, series_data, date_1904):
+        """
+        Return signatures for the `c:tx`, `c:xVal`, `c:yVal`, and
+        `c:bubbleSize` elements written for *series_data*.
+        """
+        number_format = series_data.number_format
+        return {
+            'c:tx':         self._tx_signature(series_data),
+            'c:xVal':       self._numRef_signature(
+                series_data.x_values_ref, number_format, series_data.x_values
+            ),
+            'c:yVal':       self._numRef_signature(
+                series_data.y_values_ref, number_format, series_data.y_values
+            ),
+            'c:bubbleSize': self._numRef_signature(
+                series_data.bubble_sizes_ref, number_format,
+                series_data.bubble_sizes
+            ),
+        }
+
+    @property
+    def _ser_source_tags(self):
+        return ('c:tx', 'c:xVal', 'c:yVal', 'c:bubbleSize')
+
 
 class _CategorySeriesXmlRewriter(_BaseSeriesXmlRewriter):
     """
@@ -1801,6 +2000,74 @@ class _CategorySeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_cat(xml_writer.cat)
         ser._insert_val(xml_writer.val)
 
+    def _same_layout(self, old_sigs, new_sigs):
+        """
+        Categories are shared by all series and are not patched in place, so
+        any change to them counts as a layout change.
+        """
+        if old_sigs.get('c:cat') != new_sigs['c:cat']:
+            return False
+        return super(_CategorySeriesXmlRewriter, self)._same_layout(
+            old_sigs, new_sigs
+        )
+
+    def _series_data_signatures(self, series_data, date_1904):
+        """
+        Return signatures for the `c:tx`, `c:cat`, and `c:val` elements
+        written for *series_data*.
+        """
+        return {
+            'c:tx':  self._tx_signature(series_data),
+            'c:cat': self._cat_signature(series_data, date_1904),
+            'c:val': self._numRef_signature(
+                series_data.values_ref, series_data.number_format,
+                series_data.values
+            ),
+        }
+
+    @property
+    def _ser_source_tags(self):
+        return ('c:tx', 'c:cat', 'c:val')
+
+    @staticmethod
+    def _cat_signature(series_data, date_1904):
+        """
+        Return the signature of the `c:cat` element written for
+        *series_data*, which takes one of three forms depending on whether
+        the categories are numeric, single-level, or multi-level.
+        """
+        categories = series_data.categories
+        ref = series_data.categories_ref
+        cat_count = '{0}'.format(categories.leaf_count)
+
+        if categories.are_numeric:
+            return (
+                (ref,), ('{0}'.format(categories.number_format),),
+                (cat_count,), 0,
+                tuple(
+                    ('{0}'.format(idx), category.numeric_str_val(date_1904))
+                    for idx, category in enumerate(categories)
+                ),
+            )
+
+        if categories.depth == 1:
+            return (
+                (ref,), (), (cat_count,), 0,
+                tuple(
+                    ('{0}'.format(idx), to_unicode(category.label))
+                    for idx, category in enumerate(categories)
+                ),
+            )
+
+        levels = list(categories.levels)
+        return (
+            (ref,), (), (cat_count,), len(levels),
+            tuple(
+                ('%d' % idx, '%s' % name)
+                for level in levels for idx, name in level
+            ),
+        )
+
 
 class _XySeriesXmlRewriter(_BaseSeriesXmlRewriter):
     """
@@ -1820,3 +2087,23 @@ class _XySeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_tx(xml_writer.tx)
         ser._insert_xVal(xml_writer.xVal)
         ser._insert_yVal(xml_writer.yVal)
+
+    def _series_data_signatures(self, series_data, date_1904):
+        """
+        Return signatures for the `c:tx`, `c:xVal`, and `c:yVal` elements
+        written for *series_data*.
+        """
+        number_format = series_data.number_format
+        return {
+            'c:tx':   self._tx_signature(series_data),
+            'c:xVal': self._numRef_signature(
+                series_data.x_values_ref, number_format, series_data.x_values
+            ),
+            'c:yVal': self._numRef_signature(
+                series_data.y_values_ref, number_format, series_data.y_values
+            ),
+        }
+
+    @property
+    def _ser_source_tags(self):
+        return ('c:tx', 'c:xVal', 'c:yVal')
@@ -0,0 +1,153 @@
+# encoding: utf-8
+
+"""
+Adapter functions creating chart data and table content from a pandas
+DataFrame.
+
+pandas is not imported by this module; the functions only use the
+DataFrame interface of the object passed to them, so pandas need only be
+installed by a caller that actually has a DataFrame. Values are taken
+a column at a time using the column's array conversions rather than by
+visiting each row of the DataFrame.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from .chart.data import CategoryChartData, XyChartData
+from .compat import Unicode
+from .text.text import TextFrame
+
+
+def category_chart_data(df, number_format=None):
+    """
+    Return a |CategoryChartData| object containing a series for each column
+    of DataFrame *df*, named with the column label. The index of *df*
+    provides the categories; a `MultiIndex` produces multi-level categories,
+    the first index level being the outermost. Missing values (NaN) become
+    empty data points.
+
+    Each series gets a number format suited to the dtype of its column,
+    ``'0'`` for integer and boolean columns and the chart-level format for
+    all others, unless *number_format* is specified, in which case it is
+    used for every series.
+    """
+    chart_data = CategoryChartData()
+    index = df.index
+    if index.nlevels > 1:
+        _add_multi_level_categories(chart_data.categories, index)
+    else:
+        chart_data.categories = index.tolist()
+
+    for name in df.columns:
+        column = df[name]
+        chart_data.add_series(
+            Unicode(name), _column_values(column),
+            _series_number_format(column, number_format)
+        )
+    return chart_data
+
+
+def xy_chart_data(df, x_column=None, number_format=None):
+    """
+    Return an |XyChartData| object containing a series for each column of
+    DataFrame *df* other than *x_column*, named with the column label. The
+    X values of each point are taken from *x_column* or, when it is |None|,
+    from the index of *df*. Points having a missing X or Y value are
+    omitted. *number_format* is applied as in :func:`category_chart_data`.
+    """
+    chart_data = XyChartData()
+    if x_column is None:
+        xs, x_present = df.index.tolist(), df.index.notna().tolist()
+    else:
+        xs = _column_values(df[x_column])
+        x_present = df[x_column].notna().tolist()
+
+    for name in df.columns:
+        if x_column is not None and name == x_column:
+            continue
+        column = df[name]
+        series_data = chart_data.add_series(
+            Unicode(name), _series_number_format(column, number_format)
+        )
+        ys, y_present = column.tolist(), column.notna().tolist()
+        for x, y, has_x, has_y in zip(xs, ys, x_present, y_present):
+            if has_x and has_y:
+                series_data.add_data_point(x, y)
+    return chart_data
+
+
+def add_table(shapes, df, left, top, width, height, index=False):
+    """
+    Return a |GraphicFrame| shape containing a table populated from
+    DataFrame *df*, newly added to *shapes* at the specified position and
+    size. The first row of the table holds the column labels and each
+    following row a row of *df*. The index of *df* is included as the first
+    column when *index* is |True|. Missing values (NaN) appear as empty
+    cells.
+    """
+    if index:
+        df = df.reset_index()
+    header = [Unicode(name) for name in df.columns]
+    body = df.astype(object).where(df.notna(), '').astype(Unicode).values
+    rows = [header] + body.tolist()
+
+    graphic_frame = shapes.add_table(
+        len(rows), len(header), left, top, width, height
+    )
+    tbl = graphic_frame.table._tbl
+    for tr, texts in zip(tbl.tr_lst, rows):
+        for tc, text in zip(tr.tc_lst, texts):
+            TextFrame(tc.get_or_add_txBody(), graphic_frame).text = text
+    return graphic_frame
+
+
+def _add_multi_level_categories(categories, index):
+    """
+    Add the hierarchy of categories represented by `MultiIndex` *index* to
+    *categories*. Consecutive index entries sharing a label at a level share
+    the category at that level. All labels are converted to strings, as is
+    required for multi-level categories.
+    """
+    levels = [
+        [Unicode(label) for label in index.get_level_values(level)]
+        for level in range(index.nlevels)
+    ]
+    path = []
+    prior = None
+    for labels in zip(*levels):
+        depth = 0
+        if prior is not None:
+            while depth < len(labels) - 1 and labels[depth] == prior[depth]:
+                depth += 1
+        del path[depth:]
+        for label in labels[depth:]:
+            if path:
+                category = path[-1].add_sub_category(label)
+            else:
+                category = categories.add_category(label)
+            path.append(category)
+        prior = labels
+
+
+def _column_values(column):
+    """
+    Return a list of the Python values in pandas series *column*, with
+    |None| in place of any missing value. Boolean values become 1 and 0.
+    """
+    if column.dtype.kind == 'b':
+        column = column.astype(int)
+    if not column.hasnans:
+        return column.tolist()
+    return column.astype(object).where(column.notna(), None).tolist()
+
+
+def _series_number_format(column, number_format):
+    """
+    Return *number_format* if not |None|, otherwise the number format suited
+    to the dtype of pandas series *column*.
+    """
+    if number_format is not None:
+        return number_format
+    if column.dtype.kind in 'biu':
+        return '0'
+    return None
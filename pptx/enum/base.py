@@ -115,9 +115,21 @@ class MetaEnumeration(type):
     def __new__(meta, clsname, bases, clsdict):
         meta._add_enum_members(clsdict)
         meta._collect_valid_settings(clsdict)
-        meta._generate_docs_page(clsname, clsdict)
         return type.__new__(meta, clsname, bases, clsdict)
 
+    @property
+    def __docs_rst__(cls):
+        """
+        The RST documentation page for the enumeration, generated on first
+        access rather than when the enumeration is defined, as only the
+        documentation build needs it.
+        """
+        docs_rst = cls.__dict__.get('_docs_rst')
+        if docs_rst is None:
+            docs_rst = _DocsPageFormatter(cls.__name__, cls.__dict__).page_str
+            cls._docs_rst = docs_rst
+        return docs_rst
+
     @classmethod
     def _add_enum_members(meta, clsdict):
         """
@@ -132,23 +144,15 @@ class MetaEnumeration(type):
     @classmethod
     def _collect_valid_settings(meta, clsdict):
         """
-        Return a sequence containing the enumeration values that are valid
-        assignment values. Return-only values are excluded.
+        Add a set of the enumeration values that are valid assignment values
+        to *clsdict*, so checking a value costs a hash lookup whatever the
+        size of the enumeration. Return-only values are excluded.
         """
         enum_members = clsdict['__members__']
-        valid_settings = []
+        valid_settings = set()
         for member in enum_members:
-            valid_settings.extend(member.valid_settings)
-        clsdict['_valid_settings'] = valid_settings
-
-    @classmethod
-    def _generate_docs_page(meta, clsname, clsdict):
-        """
-        Return the RST documentation page for the enumeration.
-        """
-        clsdict['__docs_rst__'] = (
-            _DocsPageFormatter(clsname, clsdict).page_str
-        )
+            valid_settings.update(member.valid_settings)
+        clsdict['_valid_settings'] = frozenset(valid_settings)
 
 
 class EnumerationBase(object):
@@ -165,7 +169,11 @@ class EnumerationBase(object):
         """
         Raise |ValueError| if *value* is not an assignable value.
         """
-        if value not in cls._valid_settings:
+        try:
+            is_valid = value in cls._valid_settings
+        except TypeError:  # unhashable, so not a member
+            is_valid = False
+        if not is_valid:
             raise ValueError(
                 "%s not a member of %s enumeration" % (value, cls.__name__)
             )
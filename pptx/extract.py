@@ -0,0 +1,196 @@
+# encoding: utf-8
+
+"""
+Fast extraction of the text in a presentation, for search indexing and the
+like, without loading the presentation.
+
+The slide and notes parts are streamed from the package and parsed
+incrementally with `lxml.etree.iterparse()`, each paragraph being discarded
+as soon as its text is produced. No |Presentation| object, part, or custom
+element class instance is created, so memory use does not depend on the size
+of the presentation. Only the package relationships and the presentation
+part, which are small, are parsed whole to find the slides in order.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from collections import namedtuple
+from zipfile import ZipFile
+
+from lxml import etree
+
+from .opc.constants import NAMESPACE as NS, RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI, PackURI
+from .oxml.ns import qn
+
+
+#: The text of a single paragraph of a shape, produced by :func:`iter_text`.
+#: *slide_index* is the zero-based position of the slide in the
+#: presentation, *shape_id* and *shape_name* identify the shape on that slide
+#: or its notes page, and *is_notes* is |True| for text from the notes page.
+#: The text of a table cell is attributed to the graphic frame containing the
+#: table, and that of a grouped shape to the shape itself.
+TextRecord = namedtuple(
+    'TextRecord', ('slide_index', 'shape_id', 'shape_name', 'text', 'is_notes')
+)
+
+
+def iter_text(pptx, notes=True):
+    """
+    Generate a |TextRecord| for each non-empty paragraph in the presentation
+    in *pptx*, a path to a .pptx file or a file-like object containing one.
+    Slides are visited in presentation order and the paragraphs of each in
+    document order, followed by those of its notes page unless *notes* is
+    |False|. Paragraph text is formed as for :attr:`_Paragraph.text`, a line
+    break becoming a line feed character.
+    """
+    zipf = ZipFile(pptx, 'r')
+    try:
+        for slide_idx, slide_partname in enumerate(_slide_partnames(zipf)):
+            for record in _iter_part_text(zipf, slide_partname, slide_idx):
+                yield record
+            if not notes:
+                continue
+            notes_partname = _related_partname(
+                zipf, slide_partname, RT.NOTES_SLIDE
+            )
+            if notes_partname is None:
+                continue
+            for record in _iter_part_text(
+                    zipf, notes_partname, slide_idx, is_notes=True):
+                yield record
+    finally:
+        zipf.close()
+
+
+_parser = etree.XMLParser(resolve_entities=False)
+
+_a_p = qn('a:p')
+_a_t = qn('a:t')
+_a_br = qn('a:br')
+_mc_Fallback = qn('ve:Fallback')
+_p_cNvPr = qn('p:cNvPr')
+_r_id = qn('r:id')
+_shape_tags = frozenset(
+    qn(tag) for tag in
+    ('p:sp', 'p:grpSp', 'p:graphicFrame', 'p:cxnSp', 'p:pic')
+)
+_event_tags = tuple(_shape_tags) + (_a_p, _mc_Fallback, _p_cNvPr)
+_rel_tag = '{%s}Relationship' % NS.OPC_RELATIONSHIPS
+
+
+def _iter_part_text(zipf, partname, slide_idx, is_notes=False):
+    """
+    Generate a |TextRecord| for each non-empty paragraph in the slide or
+    notes part *partname*, parsed incrementally and discarded as it goes.
+    The fallback content of an `mc:AlternateContent` element is skipped, as
+    it repeats the preferred content.
+    """
+    shapes = []  # stack of [shape_id, shape_name] for enclosing shapes
+    fallback_depth = 0
+    stream = zipf.open(partname.membername)
+    try:
+        events = etree.iterparse(
+            stream, events=('start', 'end'), tag=_event_tags,
+            resolve_entities=False
+        )
+        for event, elm in events:
+            tag = elm.tag
+            if event == 'start':
+                if tag in _shape_tags:
+                    shapes.append([None, None])
+                elif tag == _mc_Fallback:
+                    fallback_depth += 1
+                continue
+            if tag == _mc_Fallback:
+                fallback_depth -= 1
+                _discard(elm)
+            elif tag == _p_cNvPr:
+                if shapes and shapes[-1][0] is None:
+                    shapes[-1][:] = [int(elm.get('id')), elm.get('name')]
+            elif tag == _a_p:
+                text = _paragraph_text(elm)
+                elm.clear()
+                if text and shapes and not fallback_depth:
+                    shape_id, shape_name = shapes[-1]
+                    yield TextRecord(
+                        slide_idx, shape_id, shape_name, text, is_notes
+                    )
+            elif tag in _shape_tags:
+                shapes.pop()
+                _discard(elm)
+    finally:
+        stream.close()
+
+
+def _discard(elm):
+    """
+    Release *elm* and any siblings preceding it, which have been fully
+    processed.
+    """
+    elm.clear()
+    parent = elm.getparent()
+    if parent is None:
+        return
+    while elm.getprevious() is not None:
+        del parent[0]
+
+
+def _paragraph_text(p):
+    """
+    Return the text of `a:p` element *p*.
+    """
+    return ''.join(
+        '\n' if elm.tag == _a_br else (elm.text or '')
+        for elm in p.iter(_a_t, _a_br)
+    )
+
+
+def _related_partname(zipf, source_partname, reltype):
+    """
+    Return the |PackURI| of the part related to *source_partname* by
+    a relationship of *reltype*, or |None| if there is no such relationship.
+    """
+    for rId, rel_type, partname in _rels(zipf, source_partname):
+        if rel_type == reltype:
+            return partname
+    return None
+
+
+def _rels(zipf, source_uri):
+    """
+    Return a list of `(rId, reltype, partname)` 3-tuples, one for each
+    internal relationship from *source_uri*.
+    """
+    try:
+        rels_xml = zipf.read(source_uri.rels_uri.membername)
+    except KeyError:
+        return []
+    rels = []
+    for rel in etree.fromstring(rels_xml, _parser).iter(_rel_tag):
+        if rel.get('TargetMode') == 'External':
+            continue
+        partname = PackURI.from_rel_ref(source_uri.baseURI, rel.get('Target'))
+        rels.append((rel.get('Id'), rel.get('Type'), partname))
+    return rels
+
+
+def _slide_partnames(zipf):
+    """
+    Return a list of the partnames of the slides in the package in *zipf*,
+    in presentation order.
+    """
+    prs_partname = [
+        partname for _, reltype, partname in _rels(zipf, PACKAGE_URI)
+        if reltype == RT.OFFICE_DOCUMENT
+    ][0]
+    partnames_by_rId = dict(
+        (rId, partname) for rId, _, partname in _rels(zipf, prs_partname)
+    )
+    presentation = etree.fromstring(
+        zipf.read(prs_partname.membername), _parser
+    )
+    return [
+        partnames_by_rId[sldId.get(_r_id)]
+        for sldId in presentation.iter(qn('p:sldId'))
+    ]
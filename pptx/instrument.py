@@ -0,0 +1,201 @@
+# encoding: utf-8
+
+"""
+Instrumentation of the phases of loading and saving a presentation, to find
+out where the time goes.
+
+A listener registered with :func:`add_listener` is called with a |Span| for
+each timed phase, like the parsing of a part or the writing of a zip member,
+and a |Count| for each counted event. :func:`recording` registers
+a |Recorder| for the duration of a ``with`` block::
+
+    with instrument.recording() as recorder:
+        prs.save('deck.pptx')
+    print(recorder.report())
+
+While no listener is registered, an instrumentation point costs a function
+call and nothing is timed.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import threading
+import timeit
+
+from collections import namedtuple
+from contextlib import contextmanager
+
+
+#: A timed phase, like ``'parse_part'``. *start* is the value of
+#: :func:`timeit.default_timer` when the phase began and *duration* its
+#: length in seconds. *attrs* is a dict of details, such as the `partname`,
+#: `content_type`, and `bytes` of the part concerned.
+Span = namedtuple('Span', ('name', 'start', 'duration', 'attrs'))
+
+#: A counted event, like ``'blobs_hashed'``, adding *value* to the count
+#: for *name*. *attrs* is a dict of details like those of a |Span|.
+Count = namedtuple('Count', ('name', 'value', 'attrs'))
+
+
+_listeners = ()
+_lock = threading.Lock()
+_timer = timeit.default_timer
+
+
+def add_listener(listener):
+    """
+    Register *listener*, a callable called with each |Span| and |Count|
+    produced in any thread until it is removed with
+    :func:`remove_listener`.
+    """
+    global _listeners
+    with _lock:
+        _listeners = _listeners + (listener,)
+
+
+def count(name, value=1, **attrs):
+    """
+    Report a |Count| of *value* for *name* to the registered listeners.
+    """
+    if not _listeners:
+        return
+    _emit(Count(name, value, attrs))
+
+
+@contextmanager
+def recording():
+    """
+    Context manager registering a new |Recorder| for the duration of the
+    ``with`` block and returning it.
+    """
+    recorder = Recorder()
+    add_listener(recorder)
+    try:
+        yield recorder
+    finally:
+        remove_listener(recorder)
+
+
+def remove_listener(listener):
+    """
+    Stop calling *listener*, registered with :func:`add_listener`.
+    """
+    global _listeners
+    with _lock:
+        listeners = list(_listeners)
+        listeners.remove(listener)
+        _listeners = tuple(listeners)
+
+
+def span(name, **attrs):
+    """
+    Return a context manager timing the phase *name* performed in its
+    ``with`` block and reporting it as a |Span| when the block exits. The
+    object returned by the ``with`` statement has a ``set(**attrs)`` method
+    to add details known only once the phase is under way, like the size of
+    a blob produced.
+    """
+    if not _listeners:
+        return _null_span
+    return _ActiveSpan(name, attrs)
+
+
+class Recorder(object):
+    """
+    Listener keeping each |Span| and |Count| it receives, in its `spans` and
+    `counts` lists.
+    """
+    def __init__(self):
+        super(Recorder, self).__init__()
+        self.spans = []
+        self.counts = []
+
+    def __call__(self, event):
+        if isinstance(event, Span):
+            self.spans.append(event)
+        else:
+            self.counts.append(event)
+
+    def report(self):
+        """
+        Return a text table of the number of spans and total seconds for
+        each span name, longest total first, followed by the total of each
+        count. The time of a span includes that of any span within it.
+        """
+        lines = ['%-28s %8s %10s' % ('span', 'calls', 'seconds')]
+        for name, (calls, seconds) in sorted(
+                self.totals().items(), key=lambda item: -item[1][1]):
+            lines.append('%-28s %8d %10.4f' % (name, calls, seconds))
+        count_totals = self.count_totals()
+        if count_totals:
+            lines.append('')
+            lines.append('%-28s %19s' % ('count', 'total'))
+            for name, total in sorted(count_totals.items()):
+                lines.append('%-28s %19s' % (name, total))
+        return '\n'.join(lines)
+
+    def count_totals(self):
+        """
+        Return a dict mapping each count name to the sum of its values.
+        """
+        totals = {}
+        for event in self.counts:
+            totals[event.name] = totals.get(event.name, 0) + event.value
+        return totals
+
+    def totals(self):
+        """
+        Return a dict mapping each span name to a `(calls, seconds)` pair.
+        """
+        totals = {}
+        for event in self.spans:
+            calls, seconds = totals.get(event.name, (0, 0.0))
+            totals[event.name] = (calls + 1, seconds + event.duration)
+        return totals
+
+
+class _ActiveSpan(object):
+    """
+    Context manager timing its ``with`` block and reporting the |Span|.
+    """
+    def __init__(self, name, attrs):
+        super(_ActiveSpan, self).__init__()
+        self._name = name
+        self._attrs = attrs
+
+    def __enter__(self):
+        self._start = _timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = _timer() - self._start
+        _emit(Span(self._name, self._start, duration, self._attrs))
+        return False
+
+    def set(self, **attrs):
+        self._attrs.update(attrs)
+
+
+class _NullSpan(object):
+    """
+    Context manager used in place of |_ActiveSpan| while no listener is
+    registered, doing nothing.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_null_span = _NullSpan()
+
+
+def _emit(event):
+    for listener in _listeners:
+        listener(event)
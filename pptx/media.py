@@ -11,6 +11,7 @@ import hashlib
 import os
 
 from .compat import is_string
+from .instrument import count, span
 from .opc.constants import CONTENT_TYPE as CT
 from .util import lazyproperty
 
@@ -100,7 +101,11 @@ class Video(object):
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        blob = self._blob
+        with span('hash_blob', bytes=len(blob)):
+            sha1 = hashlib.sha1(blob).hexdigest()
+        count('blobs_hashed')
+        return sha1
 
 
 SPEAKER_IMAGE_BYTES = base64.b64decode(
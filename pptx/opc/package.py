@@ -7,8 +7,14 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import
 
+import re
+import tempfile
+
+from copy import deepcopy
+
 from pptx.util import lazyproperty
 
+from ..instrument import count, span
 from .constants import RELATIONSHIP_TYPE as RT
 from .oxml import CT_Relationships, serialize_part_xml
 from ..oxml import parse_xml
@@ -105,23 +111,32 @@ class OpcPackage(object):
         matching *tmpl*, which is a printf (%)-style template string
         containing a single replacement item, a '%d' to be used to insert the
         integer portion of the partname. Example: '/ppt/slides/slide%d.xml'
+
+        The partnames in use are collected in a single traversal of the
+        package the first time *tmpl* is used, and each partname returned is
+        recorded as used, so a later call does not traverse the package
+        again. A partname is therefore not reused even if its part is later
+        removed from the package.
         """
-        partnames = [part.partname for part in self.iter_parts()]
-        for n in range(1, len(partnames)+2):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
-        raise Exception('ProgrammingError: ran out of candidate_partnames')
+        return self._partname_index.next_partname(tmpl)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, deferred=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
-        package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        *pkg_file*. *deferred*, when given, is a function called with the
+        |PackageReader| for *pkg_file* and returning the partnames of the XML
+        parts whose parsing is to be deferred until their element tree is
+        first accessed. A deferred part that is never accessed is saved
+        unchanged.
+        """
+        with span('open_package'):
+            pkg_reader = PackageReader.from_file(pkg_file)
+            package = cls()
+            part_factory = PartFactory
+            if deferred is not None:
+                part_factory = _DeferringPartFactory(deferred(pkg_reader))
+            Unmarshaller.unmarshal(pkg_reader, package, part_factory)
         return package
 
     def part_related_by(self, reltype):
@@ -161,9 +176,30 @@ class OpcPackage(object):
         Save this package to *pkg_file*, where *file* can be either a path to
         a file (a string) or a file-like object.
         """
-        for part in self.parts:
-            part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        with span('save_package'):
+            with span('walk_parts') as walk_span:
+                parts = self.parts
+                walk_span.set(parts=len(parts))
+            with span('before_marshal'):
+                for part in parts:
+                    part.before_marshal()
+            PackageWriter.write(pkg_file, self.rels, parts)
+
+    @lazyproperty
+    def _partname_index(self):
+        """
+        |_PartnameIndex| instance from which :meth:`next_partname` allocates
+        partnames.
+        """
+        return _PartnameIndex(self)
+
+    @lazyproperty
+    def spill_file(self):
+        """
+        |_SpillFile| instance holding the blobs of parts of this package that
+        have been spilled to disk, created on first use.
+        """
+        return _SpillFile()
 
 
 class Part(object):
@@ -179,6 +215,18 @@ class Part(object):
         self._blob = blob
         self._package = package
 
+    def __getattr__(self, name):
+        # Only reached when normal attribute lookup fails. For `_blob` this
+        # means the part has been spilled, so its blob is read back from the
+        # spill file, without keeping it, each time it is needed.
+        blob_source = self.__dict__.get('_blob_source')
+        if name != '_blob' or blob_source is None:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" %
+                (type(self).__name__, name)
+            )
+        return blob_source.blob
+
     # load/save interface to OpcPackage ------------------------------
 
     def after_unmarshal(self):
@@ -226,6 +274,23 @@ class Part(object):
         """
         return self._content_type
 
+    def copy(self, partname, package=None):
+        """
+        Return a new part of the same class as this one, having *partname*
+        and the same content but no relationships. The copy belongs to
+        *package*, or to the package of this part when |None|. The blob is
+        shared rather than copied, being immutable, including when it has
+        been spilled.
+        """
+        package = self._package if package is None else package
+        blob_source = self.__dict__.get('_blob_source')
+        if blob_source is None:
+            return self.load(partname, self._content_type, self._blob, package)
+        part = self.load(partname, self._content_type, None, package)
+        del part._blob
+        part._blob_source = blob_source
+        return part
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
@@ -311,6 +376,18 @@ class Part(object):
         """
         return RelationshipCollection(self._partname.baseURI)
 
+    def spill(self):
+        """
+        Move the blob of this part to the spill file of its package,
+        releasing the memory it occupies. The blob is read back when needed,
+        such as when the package is saved. Does nothing if the blob is
+        already spilled.
+        """
+        if '_blob' not in self.__dict__:
+            return
+        self._blob_source = self._package.spill_file.append(self._blob)
+        del self._blob
+
     def target_ref(self, rId):
         """
         Return URL contained in target ref of relationship identified by
@@ -341,15 +418,86 @@ class XmlPart(Part):
         )
         self._element = element
 
+    def __getattr__(self, name):
+        # Only reached when normal attribute lookup fails. For `_element`
+        # this means the part was loaded from a |PackageTemplate|, loaded
+        # deferred, or has been spilled, and its element tree has not since
+        # been accessed. It is built from its XML source and kept from then
+        # on.
+        xml_source = self.__dict__.get('_xml_source')
+        if name != '_element' or xml_source is None:
+            return super(XmlPart, self).__getattr__(name)
+        with span(
+                'parse_part', partname=self._partname,
+                content_type=self._content_type, lazy=True):
+            element = self._element = xml_source.copy_element()
+        count('parts_parsed', lazy=True)
+        del self._xml_source
+        return element
+
     @property
     def blob(self):
-        return serialize_part_xml(self._element)
+        if '_element' not in self.__dict__:
+            return self._xml_source.blob
+        with span(
+                'serialize_part', partname=self._partname,
+                content_type=self._content_type) as serialize_span:
+            blob = serialize_part_xml(self._element)
+            serialize_span.set(bytes=len(blob))
+        return blob
+
+    def copy(self, partname, package=None):
+        """
+        Return a new part of the same class as this one, having *partname*
+        and a copy of its element tree but no relationships. The copy belongs
+        to *package*, or to the package of this part when |None|. When this
+        part has not yet built its element tree, the copy shares its XML
+        source and builds its own element tree from it on first access.
+        """
+        package = self._package if package is None else package
+        part = type(self)(partname, self._content_type, None, package)
+        if '_element' in self.__dict__:
+            part._element = deepcopy(self._element)
+            return part
+        del part._element
+        part._xml_source = self._xml_source
+        return part
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        with span(
+                'parse_part', partname=partname, content_type=content_type,
+                bytes=len(blob)):
+            element = parse_xml(blob)
+        count('parts_parsed', lazy=False)
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def load_deferred(cls, partname, content_type, blob, package):
+        """
+        Return an instance of this part whose XML in *blob* is not parsed
+        until its element tree is first accessed. A part that is never
+        accessed saves *blob* unchanged.
+        """
+        part = cls(partname, content_type, None, package)
+        del part._element
+        part._xml_source = _DeferredXml(blob)
+        return part
+
+    @classmethod
+    def load_shared(cls, partname, content_type, shared_xml, package):
+        """
+        Return an instance of this part whose element tree is a copy of the
+        one in *shared_xml*, a |_SharedXml| object belonging to
+        a |PackageTemplate|. The copy is made on first access to the element
+        tree, so a part that is never accessed costs neither a parse nor
+        a copy and saves the original blob unchanged.
+        """
+        part = cls(partname, content_type, None, package)
+        del part._element
+        part._xml_source = shared_xml
+        return part
+
     @property
     def part(self):
         """
@@ -359,6 +507,85 @@ class XmlPart(Part):
         """
         return self
 
+    def spill(self):
+        """
+        Serialize the XML of this part to the spill file of its package and
+        release its element tree. The XML is read back when needed, such as
+        when the package is saved, and parsed again if the element tree is
+        accessed. Does nothing if the part has no element tree of its own.
+        """
+        if '_element' not in self.__dict__:
+            return
+        self._xml_source = self._package.spill_file.append(self.blob)
+        del self._element
+
+
+class PackageTemplate(object):
+    """
+    The contents of a package file, read once and used to produce any number
+    of independent packages by calling :meth:`fork`. Part blobs are shared
+    by all forks. The XML of each part is parsed at most once, when first
+    needed by any fork, and each fork gets its own copy of that element tree
+    the first time it accesses the part. A fork never affects the template
+    or other forks.
+    """
+    def __init__(self, pkg_reader):
+        super(PackageTemplate, self).__init__()
+        self._pkg_reader = pkg_reader
+        self._shared_xml = {}
+
+    def fork(self, package_cls=OpcPackage):
+        """
+        Return a new instance of *package_cls*, an |OpcPackage| subclass,
+        having the contents of this template.
+        """
+        package = package_cls()
+        Unmarshaller.unmarshal(self._pkg_reader, package, self._load_part)
+        return package
+
+    @classmethod
+    def open(cls, pkg_file):
+        """
+        Return a |PackageTemplate| instance loaded with the contents of
+        *pkg_file*.
+        """
+        return cls(PackageReader.from_file(pkg_file))
+
+    def _load_part(self, partname, content_type, blob, package):
+        """
+        Part factory used to unmarshal a fork. XML parts are loaded with
+        a shared element tree; others are loaded as |PartFactory| would.
+        """
+        PartClass = PartFactory._part_cls_for(content_type)
+        if not issubclass(PartClass, XmlPart):
+            return PartClass.load(partname, content_type, blob, package)
+        shared_xml = self._shared_xml.get(partname)
+        if shared_xml is None:
+            shared_xml = self._shared_xml[partname] = _SharedXml(blob)
+        return PartClass.load_shared(
+            partname, content_type, shared_xml, package
+        )
+
+
+class _DeferringPartFactory(object):
+    """
+    Part factory used by :meth:`OpcPackage.open` to load the XML parts named
+    in *deferred_partnames* with their parsing deferred. Other parts are
+    loaded as |PartFactory| would.
+    """
+    def __init__(self, deferred_partnames):
+        super(_DeferringPartFactory, self).__init__()
+        self._deferred_partnames = deferred_partnames
+
+    def __call__(self, partname, content_type, blob, package):
+        PartClass = PartFactory._part_cls_for(content_type)
+        if (partname in self._deferred_partnames and
+                issubclass(PartClass, XmlPart)):
+            return PartClass.load_deferred(
+                partname, content_type, blob, package
+            )
+        return PartClass.load(partname, content_type, blob, package)
+
 
 class PartFactory(object):
     """
@@ -387,11 +614,36 @@ class PartFactory(object):
 class RelationshipCollection(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+
+    Relationships are also indexed by type and target, and the lowest rId
+    number that may be free is tracked, so adding a relationship to a part
+    having many of them costs no more than adding one to a part having few.
     """
     def __init__(self, baseURI):
         super(RelationshipCollection, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_key = {}
+        self._rId_floor = 1
+
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+        key = _rel_key(rel)
+        rels = self._rels_by_key[key]
+        rels.remove(rel)
+        if not rels:
+            del self._rels_by_key[key]
+        match = _rId_pattern.match(rId)
+        if match:
+            self._rId_floor = min(self._rId_floor, int(match.group(1)))
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            del self[rId]
+        super(RelationshipCollection, self).__setitem__(rId, rel)
+        self._rels_by_key.setdefault(_rel_key(rel), []).append(rel)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -462,20 +714,8 @@ class RelationshipCollection(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        rels = self._rels_by_key.get((reltype, is_external, target))
+        return rels[0] if rels else None
 
     def _get_rel_of_type(self, reltype):
         """
@@ -498,10 +738,26 @@ class RelationshipCollection(dict):
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        # every rId numbered below the floor is known to be in use
+        n = self._rId_floor
+        while 'rId%d' % n in self:
+            n += 1
+        self._rId_floor = n
+        return 'rId%d' % n
+
+
+def _rel_key(rel):
+    """
+    Return the `(reltype, is_external, target)` key under which *rel* is
+    indexed, the target being a part or, for an external relationship, its
+    URL.
+    """
+    is_external = rel.is_external
+    target = rel.target_ref if is_external else rel.target_part
+    return (rel.reltype, is_external, target)
+
+
+_rId_pattern = re.compile(r'rId([0-9]+)$')
 
 
 class Unmarshaller(object):
@@ -516,13 +772,16 @@ class Unmarshaller(object):
         contents of *pkg_reader*, delegating construction of each part to
         *part_factory*. Package relationships are added to *pkg*.
         """
-        parts = Unmarshaller._unmarshal_parts(
-            pkg_reader, package, part_factory
-        )
-        Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
-        for part in parts.values():
-            part.after_unmarshal()
-        package.after_unmarshal()
+        with span('unmarshal_parts'):
+            parts = Unmarshaller._unmarshal_parts(
+                pkg_reader, package, part_factory
+            )
+        with span('unmarshal_relationships'):
+            Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
+        with span('after_unmarshal'):
+            for part in parts.values():
+                part.after_unmarshal()
+            package.after_unmarshal()
 
     @staticmethod
     def _unmarshal_parts(pkg_reader, package, part_factory):
@@ -552,6 +811,58 @@ class Unmarshaller(object):
             source.load_rel(srel.reltype, target, srel.rId, srel.is_external)
 
 
+class _PartnameIndex(object):
+    """
+    The partnames used in *package* for each partname template, found by
+    traversing the package once per template and then kept up to date with
+    the partnames allocated from it.
+    """
+    def __init__(self, package):
+        super(_PartnameIndex, self).__init__()
+        self._package = package
+        self._used = {}  # tmpl -> set of partnames in use
+        self._used_idxs = {}  # prefix -> set of partname indexes in use
+        self._next_n = {}  # tmpl or prefix -> lowest number that may be free
+
+    def next_idx(self, prefix):
+        """
+        Return the lowest partname index not used by a partname beginning
+        with *prefix*, like ``'/ppt/media/image'``, recording it as used.
+        Partnames differing only in their extension share a sequence.
+        """
+        used = self._used_idxs.get(prefix)
+        if used is None:
+            used = self._used_idxs[prefix] = set(
+                part.partname.idx for part in self._package.iter_parts()
+                if part.partname.startswith(prefix)
+                and part.partname.idx is not None
+            )
+        n = self._next_n.get(prefix, 1)
+        while n in used:
+            n += 1
+        used.add(n)
+        self._next_n[prefix] = n + 1
+        return n
+
+    def next_partname(self, tmpl):
+        """
+        Return a |PackURI| instance for the lowest-numbered partname matching
+        *tmpl* that is not in use, recording it as used.
+        """
+        used = self._used.get(tmpl)
+        if used is None:
+            used = self._used[tmpl] = set(
+                part.partname for part in self._package.iter_parts()
+            )
+        n = self._next_n.get(tmpl, 1)
+        while tmpl % n in used:
+            n += 1
+        partname = PackURI(tmpl % n)
+        used.add(partname)
+        self._next_n[tmpl] = n + 1
+        return partname
+
+
 class _Relationship(object):
     """
     Value object for relationship to part.
@@ -589,3 +900,100 @@ class _Relationship(object):
             return self._target
         else:
             return self._target.partname.relative_ref(self._baseURI)
+
+
+class _DeferredXml(object):
+    """
+    The unparsed XML of a part loaded with its parsing deferred.
+    """
+    def __init__(self, blob):
+        super(_DeferredXml, self).__init__()
+        self.blob = blob
+
+    def copy_element(self):
+        """
+        Return the element tree parsed from this blob.
+        """
+        return parse_xml(self.blob)
+
+
+class _SharedXml(object):
+    """
+    The blob of an XML part in a |PackageTemplate| along with its element
+    tree, parsed on first use. The element tree is never modified; each fork
+    works on its own copy.
+    """
+    def __init__(self, blob):
+        super(_SharedXml, self).__init__()
+        self.blob = blob
+
+    def copy_element(self):
+        """
+        Return a deep copy of the element tree parsed from this blob.
+        """
+        return deepcopy(self.element)
+
+    @lazyproperty
+    def element(self):
+        """
+        The element tree parsed from this blob, shared by all forks and
+        never modified.
+        """
+        return parse_xml(self.blob)
+
+
+class _SpillFile(object):
+    """
+    Anonymous temporary file to which the blobs of parts are moved to free
+    the memory they occupy. Blobs are appended uncompressed so reading one
+    back costs only a seek and a read. The file is deleted when closed or
+    garbage-collected.
+    """
+    def __init__(self):
+        super(_SpillFile, self).__init__()
+        self._file = tempfile.TemporaryFile()
+
+    def append(self, blob):
+        """
+        Return a |_SpilledBlob| object for *blob*, newly appended to this
+        file.
+        """
+        self._file.seek(0, 2)
+        offset = self._file.tell()
+        self._file.write(blob)
+        return _SpilledBlob(self, offset, len(blob))
+
+    def close(self):
+        self._file.close()
+
+    def read(self, offset, length):
+        """
+        Return the *length* bytes stored at *offset* in this file.
+        """
+        self._file.seek(offset)
+        return self._file.read(length)
+
+
+class _SpilledBlob(object):
+    """
+    The location of a part blob in a |_SpillFile|. Acts as the XML source of
+    a spilled |XmlPart| as well as the blob source of other parts.
+    """
+    def __init__(self, spill_file, offset, length):
+        super(_SpilledBlob, self).__init__()
+        self._spill_file = spill_file
+        self._offset = offset
+        self._length = length
+
+    @property
+    def blob(self):
+        """
+        The spilled blob, read from the spill file.
+        """
+        return self._spill_file.read(self._offset, self._length)
+
+    def copy_element(self):
+        """
+        Return a new element tree parsed from the spilled blob.
+        """
+        return parse_xml(self.blob)
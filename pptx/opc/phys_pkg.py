@@ -12,6 +12,7 @@ from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
 
 from ..compat import is_string
 from ..exceptions import PackageNotFoundError
+from ..instrument import count, span
 
 from .packuri import CONTENT_TYPES_URI
 
@@ -136,9 +137,16 @@ class _ZipPkgReader(PhysPkgReader):
 class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
+
+    A *pkg_file* stream that cannot seek, such as a pipe or an HTTP response,
+    is written strictly front to back; each part is flushed to it as soon as
+    it is written, so only one part at a time is held in memory.
     """
     def __init__(self, pkg_file):
         super(_ZipPkgWriter, self).__init__()
+        self._stream = None
+        if not is_string(pkg_file) and not _is_seekable(pkg_file):
+            pkg_file = self._stream = _ForwardOnlyStream(pkg_file)
         self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
 
     def close(self):
@@ -153,4 +161,52 @@ class _ZipPkgWriter(PhysPkgWriter):
         Write *blob* to this zip package with the membername corresponding to
         *pack_uri*.
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        with span(
+                'write_member', membername=pack_uri.membername,
+                bytes=len(blob)) as write_span:
+            self._zipf.writestr(pack_uri.membername, blob)
+            if self._stream is not None:
+                self._stream.flush()
+            compressed_bytes = self._zipf.filelist[-1].compress_size
+            write_span.set(compressed_bytes=compressed_bytes)
+        count('members_written')
+        count('bytes_deflated', compressed_bytes)
+
+
+class _ForwardOnlyStream(object):
+    """
+    Write-only wrapper presenting a *sink* stream that cannot seek to
+    |ZipFile|. Only the current position is reported, so |ZipFile| writes the
+    size and checksum of each member in a data descriptor following its data
+    rather than seeking back to fill them into its local header. *sink* need
+    only have a `write()` method.
+    """
+    def __init__(self, sink):
+        super(_ForwardOnlyStream, self).__init__()
+        self._sink = sink
+        self._position = 0
+
+    def flush(self):
+        """
+        Flush *sink*, if it supports flushing.
+        """
+        flush = getattr(self._sink, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        self._sink.write(data)
+        self._position += len(data)
+        return len(data)
+
+
+def _is_seekable(stream):
+    """
+    Return |True| if file-like object *stream* supports random access.
+    """
+    if hasattr(stream, 'seekable'):
+        return stream.seekable()
+    return hasattr(stream, 'seek') and hasattr(stream, 'tell')
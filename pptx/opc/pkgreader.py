@@ -7,6 +7,7 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+from ..instrument import span
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
@@ -29,13 +30,17 @@ class PackageReader(object):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
         """
-        phys_reader = PhysPkgReader(pkg_file)
-        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
-        )
-        phys_reader.close()
+        with span('read_package') as read_span:
+            phys_reader = PhysPkgReader(pkg_file)
+            content_types = _ContentTypeMap.from_xml(
+                phys_reader.content_types_xml
+            )
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            sparts = PackageReader._load_serialized_parts(
+                phys_reader, pkg_srels, content_types
+            )
+            phys_reader.close()
+            read_span.set(parts=len(sparts))
         return PackageReader(content_types, pkg_srels, sparts)
 
     def iter_sparts(self):
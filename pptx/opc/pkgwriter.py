@@ -7,6 +7,7 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from ..instrument import span
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -41,9 +42,10 @@ class PackageWriter(object):
         Write ``[Content_Types].xml`` part to the physical package with an
         appropriate content type lookup target for each part in *parts*.
         """
-        content_types_blob = serialize_part_xml(
-            _ContentTypesItem.xml_for(parts)
-        )
+        with span('content_types'):
+            content_types_blob = serialize_part_xml(
+                _ContentTypesItem.xml_for(parts)
+            )
         phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
 
     @staticmethod
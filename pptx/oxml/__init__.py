@@ -347,6 +347,16 @@ register_element_cls('a:normAutofit', CT_TextNormalAutofit)
 register_element_cls('a:r',           CT_RegularTextRun)
 register_element_cls('a:p',           CT_TextParagraph)
 register_element_cls('a:pPr',         CT_TextParagraphProperties)
+register_element_cls('a:lvl1pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl2pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl3pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl4pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl5pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl6pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl7pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl8pPr',     CT_TextParagraphProperties)
+register_element_cls('a:lvl9pPr',     CT_TextParagraphProperties)
+register_element_cls('a:defPPr',      CT_TextParagraphProperties)
 register_element_cls('c:rich',        CT_TextBody)
 register_element_cls('a:rPr',         CT_TextCharacterProperties)
 register_element_cls('a:spcAft',      CT_TextSpacing)
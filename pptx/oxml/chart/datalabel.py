@@ -163,6 +163,33 @@ class CT_DLbls(BaseOxmlElement):
             return matches[0]
         return self._insert_dLbl_in_sequence(idx)
 
+    def get_or_add_dLbls_for_points(self, idxs):
+        """
+        Return a dict mapping each point index in *idxs* to the `c:dLbl`
+        element representing the label of that point, adding those not yet
+        present. All `c:dLbl` children are placed in ascending index order
+        in a single pass rather than by an ordered insert of each one.
+        """
+        dLbls = dict((dLbl.idx_val, dLbl) for dLbl in self.dLbl_lst)
+        for idx in idxs:
+            if idx in dLbls:
+                continue
+            dLbl = self._new_dLbl()
+            dLbl.idx.val = idx
+            dLbls[idx] = dLbl
+
+        for dLbl in self.dLbl_lst:
+            self.remove(dLbl)
+        prior = None
+        for idx in sorted(dLbls):
+            dLbl = dLbls[idx]
+            if prior is None:
+                self._insert_dLbl(dLbl)
+            else:
+                prior.addnext(dLbl)
+            prior = dLbl
+        return dict((idx, dLbls[idx]) for idx in idxs)
+
     @classmethod
     def new_dLbls(cls):
         """Return a newly created "loose" `c:dLbls` element."""
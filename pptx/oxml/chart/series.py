@@ -177,6 +177,34 @@ class CT_SeriesComposite(BaseOxmlElement):
         dPt.idx.val = idx
         return dPt
 
+    def get_or_add_dPts(self, idxs):
+        """
+        Return a dict mapping each point index in *idxs* to the `c:dPt` child
+        representing the visual properties of that data point, adding those
+        not yet present. All `c:dPt` children are placed in ascending index
+        order in a single pass, avoiding a search of the existing `c:dPt`
+        children for each point.
+        """
+        dPts = dict((dPt.idx.val, dPt) for dPt in self.dPt_lst)
+        for idx in idxs:
+            if idx in dPts:
+                continue
+            dPt = self._new_dPt()
+            dPt.idx.val = idx
+            dPts[idx] = dPt
+
+        for dPt in self.dPt_lst:
+            self.remove(dPt)
+        prior = None
+        for idx in sorted(dPts):
+            dPt = dPts[idx]
+            if prior is None:
+                self._insert_dPt(dPt)
+            else:
+                prior.addnext(dPt)
+            prior = dPt
+        return dict((idx, dPts[idx]) for idx in idxs)
+
     @property
     def xVal_ptCount_val(self):
         """
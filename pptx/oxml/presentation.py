@@ -43,12 +43,15 @@ class CT_SlideIdList(BaseOxmlElement):
     """
     sldId = ZeroOrMore('p:sldId')
 
-    def add_sldId(self, rId):
+    def add_sldId(self, rId, id=None):
         """
         Return a reference to a newly created <p:sldId> child element having
-        its r:id attribute set to *rId*.
+        its r:id attribute set to *rId*. Its id is *id*, or the next
+        available slide id when |None|.
         """
-        return self._add_sldId(id=self._next_id, rId=rId)
+        if id is None:
+            id = self._next_id
+        return self._add_sldId(id=id, rId=rId)
 
     @property
     def _next_id(self):
@@ -6,6 +6,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from lxml import etree
+
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import (
@@ -78,10 +80,12 @@ class BaseShapeElement(BaseOxmlElement):
         """
         The ``<p:ph>`` descendant element if there is one, None otherwise.
         """
-        ph_elms = self.xpath('./*[1]/p:nvPr/p:ph')
-        if len(ph_elms) == 0:
-            return None
-        return ph_elms[0]
+        # navigated directly rather than with XPath, as this is looked up
+        # for each shape when iterating shapes and resolving placeholders
+        for nvXxPr in self.iterchildren(tag=etree.Element):
+            nvPr = nvXxPr.find(_p_nvPr)
+            return None if nvPr is None else nvPr.find(_p_ph)
+        return None
 
     @property
     def ph_idx(self):
@@ -207,6 +211,10 @@ class BaseShapeElement(BaseOxmlElement):
         setattr(xfrm, name, value)
 
 
+_p_nvPr = qn('p:nvPr')
+_p_ph = qn('p:ph')
+
+
 class CT_ApplicationNonVisualDrawingProps(BaseOxmlElement):
     """
     ``<p:nvPr>`` element
@@ -9,9 +9,12 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from collections import defaultdict
+
 from .opc.constants import RELATIONSHIP_TYPE as RT
 from .opc.package import OpcPackage
-from .opc.packuri import PackURI
+from .opc.packuri import PACKAGE_URI, PackURI
+from .oxml import parse_xml
 from .parts.coreprops import CorePropertiesPart
 from .parts.image import Image, ImagePart
 from .parts.media import MediaPart
@@ -57,25 +60,31 @@ class Package(OpcPackage):
         """
         return self._media_parts.get_or_add_media_part(media)
 
+    def import_image_part(self, image_part):
+        """
+        Return an |ImagePart| object of this package containing the image in
+        *image_part*, an image part of another package. An image part of
+        this package containing the same image is reused, otherwise a copy
+        of *image_part* is added.
+        """
+        return self._image_parts.import_part(image_part)
+
+    def import_media_part(self, media_part):
+        """
+        Return a |MediaPart| object of this package containing the media in
+        *media_part*, a media part of another package. A media part of this
+        package containing the same media is reused, otherwise a copy of
+        *media_part* is added.
+        """
+        return self._media_parts.import_part(media_part)
+
     def next_image_partname(self, ext):
         """
         Return a |PackURI| instance representing the next available image
         partname, by sequence number. *ext* is used as the extention on the
         returned partname.
         """
-        def first_available_image_idx():
-            image_idxs = sorted([
-                part.partname.idx for part in self.iter_parts()
-                if part.partname.startswith('/ppt/media/image')
-                and part.partname.idx is not None
-            ])
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs)+1
-
-        idx = first_available_image_idx()
+        idx = self._partname_index.next_idx('/ppt/media/image')
         return PackURI('/ppt/media/image%d.%s' % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -85,20 +94,28 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-        def first_available_media_idx():
-            media_idxs = sorted([
-                part.partname.idx for part in self.iter_parts()
-                if part.partname.startswith('/ppt/media/media')
-            ])
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs)+1
-
-        idx = first_available_media_idx()
+        idx = self._partname_index.next_idx('/ppt/media/media')
         return PackURI('/ppt/media/media%d.%s' % (idx, ext))
 
+    @classmethod
+    def open(cls, pkg_file, slides=None):
+        """
+        Return a |Package| instance loaded with the contents of *pkg_file*.
+        When *slides* is not |None|, only the slides it selects are parsed
+        on load, along with the presentation, masters, layouts, and theme.
+        *slides* is a collection of zero-based slide indexes or a function
+        called with each slide index and returning |True| to select it. The
+        XML of other slides, and of the parts only they refer to, is parsed
+        only if accessed and otherwise saved unchanged.
+        """
+        if slides is None:
+            return super(Package, cls).open(pkg_file)
+
+        def deferred(pkg_reader):
+            return _partnames_outside_selection(pkg_reader, slides)
+
+        return super(Package, cls).open(pkg_file, deferred)
+
     @property
     def presentation_part(self):
         """
@@ -106,6 +123,17 @@ class Package(OpcPackage):
         """
         return self.main_document_part
 
+    def stats(self, compress=True):
+        """
+        Return a |PackageStats| object accounting for the size, compressed
+        size, and estimated memory of each part in this package and of the
+        parts owned by each slide. Compressed sizes are left |None| when
+        *compress* is |False|, avoiding the cost of deflating each part.
+        """
+        # imported here, as the stats module depends on this one
+        from .stats import package_stats
+        return package_stats(self, compress)
+
     @lazyproperty
     def _image_parts(self):
         """
@@ -159,18 +187,43 @@ class _ImageParts(object):
         image_part = self._find_by_sha1(image.sha1)
         if image_part is None:
             image_part = ImagePart.new(self._package, image)
+            self._parts_by_sha1[image.sha1] = image_part
         return image_part
 
+    def import_part(self, image_part):
+        """
+        Return an |ImagePart| object of this package containing the same
+        image as *image_part*, which belongs to another package. If this
+        package has no such image part, a copy of *image_part* is added.
+        """
+        sha1 = image_part.sha1
+        existing_part = self._find_by_sha1(sha1)
+        if existing_part is not None:
+            return existing_part
+        partname = self._package.next_image_partname(image_part.ext)
+        new_part = image_part.copy(partname, self._package)
+        self._parts_by_sha1[sha1] = new_part
+        return new_part
+
     def _find_by_sha1(self, sha1):
         """
         Return an |ImagePart| object belonging to this package or |None| if
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
+        return self._parts_by_sha1.get(sha1)
+
+    @lazyproperty
+    def _parts_by_sha1(self):
+        """
+        dict mapping the SHA1 hash of each image in this package to its image
+        part, built by a single traversal of the package and updated as image
+        parts are added through this object.
+        """
+        parts_by_sha1 = {}
         for image_part in self:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+            parts_by_sha1.setdefault(image_part.sha1, image_part)
+        return parts_by_sha1
 
 
 class _MediaParts(object):
@@ -211,8 +264,24 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            self._parts_by_sha1[media.sha1] = media_part
         return media_part
 
+    def import_part(self, media_part):
+        """Return a |MediaPart| object with the same media as *media_part*.
+
+        *media_part* belongs to another package. If this package has no media
+        part for the same bytestream, a copy of *media_part* is added.
+        """
+        sha1 = media_part.sha1
+        existing_part = self._find_by_sha1(sha1)
+        if existing_part is not None:
+            return existing_part
+        partname = self._package.next_media_partname(media_part.partname.ext)
+        new_part = media_part.copy(partname, self._package)
+        self._parts_by_sha1[sha1] = new_part
+        return new_part
+
     def _find_by_sha1(self, sha1):
         """Return |MediaPart| object having *sha1* hash or None if not found.
 
@@ -220,7 +289,59 @@ class _MediaParts(object):
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
+        return self._parts_by_sha1.get(sha1)
+
+    @lazyproperty
+    def _parts_by_sha1(self):
+        """Return dict mapping the SHA1 hash of each media part to the part.
+
+        The dict is built by a single traversal of the package and updated as
+        media parts are added through this object.
+        """
+        parts_by_sha1 = {}
         for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+            parts_by_sha1.setdefault(media_part.sha1, media_part)
+        return parts_by_sha1
+
+
+def _partnames_outside_selection(pkg_reader, slides):
+    """
+    Return the set of partnames in *pkg_reader* reachable only through the
+    slides not selected by *slides*, including those slides.
+    """
+    srels = defaultdict(list)
+    for source_uri, srel in pkg_reader.iter_srels():
+        if not srel.is_external:
+            srels[source_uri].append(srel)
+    blobs = dict(
+        (partname, blob) for partname, _, blob in pkg_reader.iter_sparts()
+    )
+
+    prs_partname = [
+        srel.target_partname for srel in srels[PACKAGE_URI]
+        if srel.reltype == RT.OFFICE_DOCUMENT
+    ][0]
+    partnames_by_rId = dict(
+        (srel.rId, srel.target_partname) for srel in srels[prs_partname]
+    )
+    sldIdLst = parse_xml(blobs[prs_partname]).sldIdLst
+    slide_partnames = (
+        [] if sldIdLst is None else
+        [partnames_by_rId[sldId.rId] for sldId in sldIdLst]
+    )
+    is_selected = slides if callable(slides) else set(slides).__contains__
+    unselected = set(
+        partname for idx, partname in enumerate(slide_partnames)
+        if not is_selected(idx)
+    )
+
+    reachable = set()
+    sources = [PACKAGE_URI]
+    while sources:
+        for srel in srels[sources.pop()]:
+            partname = srel.target_partname
+            if partname in reachable or partname in unselected:
+                continue
+            reachable.add(partname)
+            sources.append(partname)
+    return set(blobs) - reachable
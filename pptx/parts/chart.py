@@ -6,7 +6,7 @@ Chart part objects, including Chart and Charts
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ..chart.chart import Chart
+from ..chart.xlsx import WorksheetCellPatcher
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
@@ -26,10 +26,10 @@ class ChartPart(XmlPart):
         Return a new |ChartPart| instance added to *package* containing
         a chart of *chart_type* and depicting *chart_data*.
         """
-        chart_blob = chart_data.xml_bytes(chart_type)
+        chartSpace = chart_data.new_chartSpace(chart_type)
         partname = package.next_partname(cls.partname_template)
         content_type = CT.DML_CHART
-        chart_part = cls.load(partname, content_type, chart_blob, package)
+        chart_part = cls(partname, content_type, chartSpace, package)
         xlsx_blob = chart_data.xlsx_blob
         chart_part.chart_workbook.update_from_xlsx_blob(xlsx_blob)
         return chart_part
@@ -39,6 +39,8 @@ class ChartPart(XmlPart):
         """
         The |Chart| object representing the chart in this part.
         """
+        from ..chart.chart import Chart
+
         return Chart(self._element, self)
 
     @lazyproperty
@@ -49,6 +51,15 @@ class ChartPart(XmlPart):
         """
         return ChartWorkbook(self._element, self)
 
+    def spill(self):
+        """
+        Spill this part, also releasing its |Chart| and |ChartWorkbook|
+        proxies.
+        """
+        super(ChartPart, self).spill()
+        self.__dict__.pop('_chart', None)
+        self.__dict__.pop('_chart_workbook', None)
+
 
 class ChartWorkbook(object):
     """
@@ -60,6 +71,22 @@ class ChartWorkbook(object):
         self._chartSpace = chartSpace
         self._chart_part = chart_part
 
+    def update_cells(self, cells):
+        """
+        Overwrite the worksheet cells in *cells*, a sequence of `(row, col,
+        value)` 3-tuples, in the existing embedded workbook. Return |True| on
+        success or |False| if there is no embedded workbook or its worksheet
+        could not be located, in which case the workbook is unchanged.
+        """
+        xlsx_part = self.xlsx_part
+        if xlsx_part is None:
+            return False
+        xlsx_blob = WorksheetCellPatcher(xlsx_part.blob).patched_blob(cells)
+        if xlsx_blob is None:
+            return False
+        xlsx_part.blob = xlsx_blob
+        return True
+
     def update_from_xlsx_blob(self, xlsx_blob):
         """
         Replace the Excel spreadsheet in the related |EmbeddedXlsxPart| with
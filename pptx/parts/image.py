@@ -9,12 +9,8 @@ from __future__ import (
 import hashlib
 import os
 
-try:
-    from PIL import Image as PIL_Image
-except ImportError:
-    import Image as PIL_Image
-
 from ..compat import BytesIO, is_string
+from ..instrument import count, span
 from ..opc.package import Part
 from ..opc.spec import image_content_types
 from ..util import lazyproperty
@@ -104,7 +100,11 @@ class ImagePart(Part):
         The SHA1 hash digest for the image binary of this image part, like:
         ``'1be010ea47803b00e140b852765cdf84f491da47'``.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        blob = self._blob
+        with span('hash_blob', partname=self.partname, bytes=len(blob)):
+            sha1 = hashlib.sha1(blob).hexdigest()
+        count('blobs_hashed')
+        return sha1
 
     @property
     def _dpi(self):
@@ -255,7 +255,11 @@ class Image(object):
         """
         SHA1 hash digest of the image blob
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        blob = self._blob
+        with span('hash_blob', bytes=len(blob)):
+            sha1 = hashlib.sha1(blob).hexdigest()
+        count('blobs_hashed')
+        return sha1
 
     @lazyproperty
     def size(self):
@@ -278,6 +282,11 @@ class Image(object):
         A tuple containing useful image properties extracted from this image
         using Pillow (Python Imaging Library, or 'PIL').
         """
+        try:
+            from PIL import Image as PIL_Image
+        except ImportError:
+            import Image as PIL_Image
+
         stream = BytesIO(self._blob)
         pil_image = PIL_Image.open(stream)
         format = pil_image.format
@@ -8,6 +8,7 @@ from __future__ import (
 
 import hashlib
 
+from ..instrument import count, span
 from ..opc.package import Part
 from ..util import lazyproperty
 
@@ -34,4 +35,8 @@ class MediaPart(Part):
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        blob = self._blob
+        with span('hash_blob', partname=self.partname, bytes=len(blob)):
+            sha1 = hashlib.sha1(blob).hexdigest()
+        count('blobs_hashed')
+        return sha1
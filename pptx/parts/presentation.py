@@ -30,6 +30,17 @@ class PresentationPart(XmlPart):
         rId = self.relate_to(slide_part, RT.SLIDE)
         return rId, slide_part.slide
 
+    def add_sldId(self, rId):
+        """
+        Return a new `p:sldId` element appended to the slide id list,
+        referring to the slide part related by *rId* and having the next
+        available slide id.
+        """
+        sldIdLst = self._element.get_or_add_sldIdLst()
+        sldId = sldIdLst.add_sldId(rId, self._slide_ids.next_id)
+        self._slide_ids.add(sldId)
+        return sldId
+
     @property
     def core_properties(self):
         """
@@ -38,15 +49,25 @@ class PresentationPart(XmlPart):
         """
         return self.package.core_properties
 
+    def duplicate_slide(self, slide):
+        """
+        Return an (rId, slide) pair of a newly created copy of *slide*,
+        related to this presentation part.
+        """
+        partname = self._next_slide_partname
+        slide_part = slide.part.duplicate(partname)
+        rId = self.relate_to(slide_part, RT.SLIDE)
+        return rId, slide_part.slide
+
     def get_slide(self, slide_id):
         """
         Return the |Slide| object identified by *slide_id* (in this
         presentation), or |None| if not found.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_parts[sldId.rId].slide
-        return None
+        sldId = self._slide_ids.sldId_with_id(slide_id)
+        if sldId is None:
+            return None
+        return self.related_parts[sldId.rId].slide
 
     @lazyproperty
     def notes_master(self):
@@ -81,6 +102,19 @@ class PresentationPart(XmlPart):
         """
         return Presentation(self._element, self)
 
+    def import_slide(self, slide, slide_layout):
+        """
+        Return an (rId, slide) pair of a newly created copy of *slide*, a
+        slide of another presentation, inheriting appearance from
+        *slide_layout* of this presentation.
+        """
+        partname = self._next_slide_partname
+        slide_part = slide.part.copy_into(
+            self.package, partname, slide_layout.part
+        )
+        rId = self.relate_to(slide_part, RT.SLIDE)
+        return rId, slide_part.slide
+
     def related_slide(self, rId):
         """
         Return the |Slide| object for the related |SlidePart| corresponding
@@ -122,10 +156,26 @@ class PresentationPart(XmlPart):
         Return the slide identifier associated with *slide_part* in this
         presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if self.related_parts[sldId.rId] is slide_part:
-                return sldId.id
-        raise ValueError('matching slide_part not found')
+        sldId = self._slide_ids.sldId_of(slide_part)
+        if sldId is None:
+            raise ValueError('matching slide_part not found')
+        return sldId.id
+
+    def slide_idx(self, slide_part):
+        """
+        Return the zero-based position of *slide_part* in the slide sequence
+        of this presentation. Raises |ValueError| if *slide_part* is not
+        a slide of this presentation.
+
+        The `p:sldId` element of the slide is found without a scan, but its
+        position is counted in the slide id list, an O(n) walk of the
+        elements preceding it. Positions are not kept, as a slide moved by
+        editing the XML shifts those of the slides around it undetectably.
+        """
+        sldId = self._slide_ids.sldId_of(slide_part)
+        if sldId is None:
+            raise ValueError('matching slide_part not found')
+        return self._element.sldIdLst.index(sldId)
 
     @property
     def _next_slide_partname(self):
@@ -137,3 +187,124 @@ class PresentationPart(XmlPart):
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = '/ppt/slides/slide%d.xml' % (len(sldIdLst)+1)
         return PackURI(partname_str)
+
+    @lazyproperty
+    def _slide_ids(self):
+        """
+        |_SlideIdIndex| object finding the `p:sldId` element of a slide by
+        slide id or slide part.
+        """
+        return _SlideIdIndex(self)
+
+
+class _SlideIdIndex(object):
+    """
+    Maps the slide id and the slide part of each slide in the presentation
+    of *presentation_part* to the `p:sldId` element referring to it, so
+    a slide is found by either without scanning the slide id list, and
+    keeps the largest slide id in use.
+
+    A `p:sldId` element added through |PresentationPart| is recorded as it
+    is added. An entry found is checked against the slide id list before it
+    is used, and the maps are rebuilt when it no longer matches or nothing
+    is found, so slides moved, removed, or added by editing the XML directly
+    are accounted for. Looking up a slide that is not in the presentation
+    costs a rebuild.
+    """
+    def __init__(self, presentation_part):
+        super(_SlideIdIndex, self).__init__()
+        self._presentation_part = presentation_part
+        self._rebuild()
+
+    def add(self, sldId):
+        """
+        Record *sldId*, newly added to the slide id list.
+        """
+        slide_id = sldId.id
+        slide_part = self._presentation_part.related_parts.get(sldId.rId)
+        self._sldIds_by_id[slide_id] = sldId
+        self._sldIds_by_part[slide_part] = sldId
+        self._max_id = max(self._max_id, slide_id)
+        self._count += 1
+
+    @property
+    def next_id(self):
+        """
+        The next available slide id, one more than the largest in use or 256
+        when there are none, which minimizes the chance of reusing the id of
+        a deleted slide.
+        """
+        self._refresh()
+        # a slide added by editing the XML is appended, so checking the last
+        # id catches one added in place of a slide removed the same way
+        sldIdLst = self._sldIdLst
+        if sldIdLst is not None and len(sldIdLst):
+            if sldIdLst[-1].id > self._max_id:
+                self._rebuild()
+        return self._max_id + 1
+
+    def sldId_of(self, slide_part):
+        """
+        Return the `p:sldId` element referring to *slide_part*, or |None| if
+        it is not a slide of this presentation.
+        """
+        sldId = self._sldIds_by_part.get(slide_part)
+        if sldId is not None and self._refers_to(sldId, slide_part):
+            return sldId
+        self._rebuild()
+        return self._sldIds_by_part.get(slide_part)
+
+    def sldId_with_id(self, slide_id):
+        """
+        Return the `p:sldId` element having *slide_id*, or |None| if there is
+        no such slide.
+        """
+        sldId = self._sldIds_by_id.get(slide_id)
+        if sldId is not None and self._is_listed(sldId):
+            if sldId.id == slide_id:
+                return sldId
+        self._rebuild()
+        return self._sldIds_by_id.get(slide_id)
+
+    def _is_listed(self, sldId):
+        """
+        True if *sldId* is still a child of the slide id list.
+        """
+        sldIdLst = self._sldIdLst
+        return sldIdLst is not None and sldId.getparent() is sldIdLst
+
+    def _rebuild(self):
+        """
+        Record each `p:sldId` element in the slide id list afresh.
+        """
+        self._sldIds_by_id = {}
+        self._sldIds_by_part = {}
+        self._max_id = 255
+        self._count = 0
+        sldIdLst = self._sldIdLst
+        for sldId in () if sldIdLst is None else sldIdLst:
+            self.add(sldId)
+
+    def _refers_to(self, sldId, slide_part):
+        """
+        True if *sldId* is still in the slide id list and refers to
+        *slide_part*.
+        """
+        related_parts = self._presentation_part.related_parts
+        return (
+            self._is_listed(sldId) and
+            related_parts.get(sldId.rId) is slide_part
+        )
+
+    def _refresh(self):
+        """
+        Rebuild the maps if the slide id list has changed length since they
+        were built.
+        """
+        sldIdLst = self._sldIdLst
+        if (0 if sldIdLst is None else len(sldIdLst)) != self._count:
+            self._rebuild()
+
+    @property
+    def _sldIdLst(self):
+        return self._presentation_part._element.sldIdLst
@@ -8,7 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import re
+
 from .chart import ChartPart
+from .image import ImagePart
+from .media import MediaPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
@@ -133,6 +137,13 @@ class NotesSlidePart(BaseSlidePart):
         """
         return NotesSlide(self._element, self)
 
+    def spill(self):
+        """
+        Spill this part, also releasing its |NotesSlide| proxy.
+        """
+        super(NotesSlidePart, self).spill()
+        self.__dict__.pop('_notes_slide', None)
+
     @classmethod
     def _add_notes_slide_part(cls, package, slide_part, notes_master_part):
         """
@@ -175,6 +186,30 @@ class SlidePart(BaseSlidePart):
         rId = self.relate_to(chart_part, RT.CHART)
         return rId
 
+    def copy_into(self, package, partname, slide_layout_part):
+        """
+        Return a new |SlidePart| belonging to *package*, another package,
+        having *partname* and related to *slide_layout_part* of *package*.
+        It is a copy of this slide part, copied along with the parts it owns
+        like :meth:`duplicate` does. Images and media already present in
+        *package* are reused rather than copied, and the notes slide of the
+        copy is related to the notes master of *package*.
+        """
+        importer = _SlideImporter(package, slide_layout_part)
+        return importer.copy(self, partname)
+
+    def duplicate(self, partname):
+        """
+        Return a new |SlidePart| having *partname* that is a copy of this
+        slide part. Each relationship of the copy has the same rId as the
+        original, so the slide XML is copied unchanged. The slide layout,
+        images, media, and any slide linked to remain shared. The notes
+        slide, charts, and any other part belonging to this slide are copied
+        along with it, and a copy made before its XML is parsed defers its
+        parsing until first accessed.
+        """
+        return _PartCopier(self.package).copy(self, partname)
+
     def get_or_add_video_media_part(self, video):
         """Return rIds for media and video relationships to media part.
 
@@ -217,6 +252,17 @@ class SlidePart(BaseSlidePart):
             notes_slide_part = self._add_notes_slide_part()
         return notes_slide_part.notes_slide
 
+    def seal(self):
+        """
+        Spill this slide part and the parts reachable from it to the spill
+        file of the package, releasing the memory they occupy. The parts
+        sealed include its notes slide, charts, chart workbooks, and images,
+        but not other slides or any layout or master, which are not owned by
+        this slide.
+        """
+        for part in self._iter_owned_parts():
+            part.spill()
+
     @lazyproperty
     def slide(self):
         """
@@ -233,6 +279,15 @@ class SlidePart(BaseSlidePart):
         presentation_part = self.package.presentation_part
         return presentation_part.slide_id(self)
 
+    def spill(self):
+        """
+        Spill this part, also releasing its |Slide| and |NotesSlide|
+        proxies.
+        """
+        super(SlidePart, self).spill()
+        self.__dict__.pop('_slide', None)
+        self.__dict__.pop('_notes_slide', None)
+
     @property
     def slide_layout(self):
         """
@@ -251,6 +306,141 @@ class SlidePart(BaseSlidePart):
         self.relate_to(notes_slide_part, RT.NOTES_SLIDE)
         return notes_slide_part
 
+    def _iter_owned_parts(self):
+        """
+        Generate this part and each part reachable from it by following
+        relationships without passing through a slide, layout, or master
+        part. A notes slide belongs to its slide and is followed.
+        """
+        visited = set([self])
+        parts = [self]
+        while parts:
+            part = parts.pop()
+            yield part
+            for rel in part.rels.values():
+                if rel.is_external:
+                    continue
+                target = rel.target_part
+                if target in visited:
+                    continue
+                visited.add(target)
+                if isinstance(target, BaseSlidePart) and not isinstance(
+                        target, NotesSlidePart):
+                    continue
+                parts.append(target)
+
+
+class _PartCopier(object):
+    """
+    Copies a slide part and the parts it owns into *package*. A part owned
+    by more than one of the parts copied, or related back to, like a slide
+    by its notes slide, is copied only once. Relationships to parts not owned
+    are kept to the same part.
+    """
+    def __init__(self, package):
+        super(_PartCopier, self).__init__()
+        self._package = package
+        self._copies = {}  # part -> its copy
+
+    def copy(self, part, partname):
+        """
+        Return a copy of *part* having *partname*, with relationships to
+        copies of the parts it owns. Each relationship keeps its rId, so the
+        XML of the copy refers to the same relationships as the original.
+        """
+        copy = self._copies[part] = part.copy(partname, self._package)
+        for rel in part.rels.values():
+            if rel.is_external:
+                copy.load_rel(rel.reltype, rel.target_ref, rel.rId, True)
+                continue
+            target = self._copy_target(rel.target_part)
+            if target is None:
+                _remove_rId_references(copy, rel.rId)
+                continue
+            copy.load_rel(rel.reltype, target, rel.rId)
+        return copy
+
+    def _copy_target(self, part):
+        """
+        Return the part a copy is to be related to in place of *part*, or
+        |None| to drop the relationship.
+        """
+        if part in self._copies:
+            return self._copies[part]
+        if _is_owned(part):
+            partname = self._package.next_partname(
+                _partname_template(part.partname)
+            )
+            return self.copy(part, partname)
+        return self._shared_target(part)
+
+    def _shared_target(self, part):
+        """
+        Return the part a copy is to be related to in place of *part*, which
+        is not owned by the part being copied. Within a package, that is
+        *part* itself.
+        """
+        return part
+
+
+class _SlideImporter(_PartCopier):
+    """
+    Copies a slide part and the parts it owns from another package into
+    *package*, relating the copy to *slide_layout_part*. Images and media
+    are matched by hash against those already in *package* and are copied
+    only when not found. The notes master of *package* takes the place of
+    the source notes master. A relationship to a slide of the source
+    package, such as the target of a hyperlink, is dropped along with the
+    XML elements referring to it.
+    """
+    def __init__(self, package, slide_layout_part):
+        super(_SlideImporter, self).__init__(package)
+        self._slide_layout_part = slide_layout_part
+
+    def _shared_target(self, part):
+        if isinstance(part, ImagePart):
+            return self._package.import_image_part(part)
+        if isinstance(part, MediaPart):
+            return self._package.import_media_part(part)
+        if isinstance(part, SlideLayoutPart):
+            return self._slide_layout_part
+        if isinstance(part, NotesMasterPart):
+            return self._package.presentation_part.notes_master_part
+        return None
+
+
+def _is_owned(part):
+    """
+    Return |True| if *part* belongs to the slide related to it and is copied
+    with that slide. Images and media are never changed once added and are
+    shared, as are slides, layouts, and masters other than a notes slide.
+    """
+    if isinstance(part, (ImagePart, MediaPart)):
+        return False
+    if isinstance(part, BaseSlidePart):
+        return isinstance(part, NotesSlidePart)
+    return True
+
+
+def _remove_rId_references(part, rId):
+    """
+    Remove each element in the XML of *part* having an attribute in the
+    relationships namespace, like `r:id`, `r:embed`, `r:link`, or `r:pict`,
+    with value *rId*, such as the `a:hlinkClick` element of a hyperlink.
+    """
+    for elm in part._element.xpath('//*[@r:*="%s"]' % rId):
+        elm.getparent().remove(elm)
+
+
+def _partname_template(partname):
+    """
+    Return the partname template for parts numbered like *partname*, e.g.
+    ``'/ppt/charts/chart%d.xml'`` for ``'/ppt/charts/chart3.xml'``.
+    """
+    match = re.match(r'^(.*?)[0-9]*(\.[^./]*)?$', partname)
+    head, ext = match.group(1), match.group(2) or ''
+    return '%s%%d%s' % (head.replace('%', '%%'), ext.replace('%', '%%'))
+
 
 class SlideLayoutPart(BaseSlidePart):
     """
@@ -41,7 +41,9 @@ class Presentation(PartElementProxy):
     def save(self, file):
         """
         Save this presentation to *file*, where *file* can be either a path
-        to a file (a string) or a file-like object.
+        to a file (a string) or a file-like object. A file-like object that
+        cannot seek, such as a pipe, need only have a `write()` method; the
+        package is streamed to it a part at a time.
         """
         self.part.save(file)
 
@@ -12,6 +12,7 @@ from .base import BaseShape
 from ..dml.fill import FillFormat
 from ..dml.line import LineFormat
 from ..enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
+from ..shared import cached_proxy
 from ..spec import autoshape_types
 from ..text.text import TextFrame
 from ..util import lazyproperty
@@ -276,6 +277,9 @@ class Shape(BaseShape):
     that can appear in any of the slide-type parts (slide, slideLayout,
     slideMaster, notesPage, notesMaster, handoutMaster).
     """
+
+    __slots__ = ('_sp', '_adjustments', '_fill', '_line')
+
     def __init__(self, sp, parent):
         super(Shape, self).__init__(sp, parent)
         self._sp = sp
@@ -383,4 +387,4 @@ class Shape(BaseShape):
         and providing access to text formatting properties.
         """
         txBody = self._element.get_or_add_txBody()
-        return TextFrame(txBody, self)
+        return cached_proxy(txBody, self, TextFrame, self)
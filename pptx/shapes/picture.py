@@ -16,6 +16,8 @@ from ..util import lazyproperty
 class _BasePicture(BaseShape):
     """Base class for shapes based on a `p:pic` element."""
 
+    __slots__ = ('_pic', '_line')
+
     def __init__(self, pic, parent):
         super(_BasePicture, self).__init__(pic, parent)
         self._pic = pic
@@ -86,6 +88,8 @@ class Movie(_BasePicture):
     represents the video before it is played.
     """
 
+    __slots__ = ('_media_format',)
+
     @lazyproperty
     def media_format(self):
         """The |_MediaFormat| object for this movie.
@@ -131,6 +135,8 @@ class Picture(_BasePicture):
     Based on the `p:pic` element.
     """
 
+    __slots__ = ()
+
     @property
     def image(self):
         """
@@ -29,6 +29,9 @@ class _InheritsDimensions(object):
     by all subclasses to provide lookup of the appropriate base placeholder
     to inherit from.
     """
+
+    __slots__ = ()
+
     @property
     def height(self):
         """
@@ -129,6 +132,9 @@ class _BaseSlidePlaceholder(_InheritsDimensions, Shape):
     Base class for placeholders on slides. Provides common behaviors such as
     inherited dimensions.
     """
+
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -181,6 +187,9 @@ class BasePlaceholder(Shape):
     Base class for placeholder subclasses that differentiate the varying
     behaviors of placeholders on a master, layout, and slide.
     """
+
+    __slots__ = ()
+
     @property
     def idx(self):
         """
@@ -217,6 +226,9 @@ class LayoutPlaceholder(_InheritsDimensions, Shape):
     from the master placeholder having the same type, when a matching one
     exists.
     """
+
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -247,12 +259,17 @@ class MasterPlaceholder(BasePlaceholder):
     Placeholder shape on a slide master.
     """
 
+    __slots__ = ()
+
 
 class NotesSlidePlaceholder(_InheritsDimensions, Shape):
     """
     Placeholder shape on a notes slide. Inherits shape properties from the
     placeholder on the notes master that has the same type (e.g. 'body').
     """
+
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -271,11 +288,16 @@ class SlidePlaceholder(_BaseSlidePlaceholder):
     corresponding slide layout placeholder.
     """
 
+    __slots__ = ()
+
 
 class ChartPlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a chart.
     """
+
+    __slots__ = ()
+
     def insert_chart(self, chart_type, chart_data):
         """
         Return a |PlaceholderGraphicFrame| object containing a new chart of
@@ -310,6 +332,9 @@ class PicturePlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a picture.
     """
+
+    __slots__ = ()
+
     def insert_picture(self, image_file):
         """
         Return a |PlaceholderPicture| object depicting the image in
@@ -351,6 +376,9 @@ class PlaceholderGraphicFrame(GraphicFrame):
     """
     Placeholder shape populated with a table, chart, or smart art.
     """
+
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -364,6 +392,9 @@ class PlaceholderPicture(_InheritsDimensions, Picture):
     """
     Placeholder shape populated with a picture.
     """
+
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -377,6 +408,9 @@ class TablePlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a picture.
     """
+
+    __slots__ = ()
+
     def insert_table(self, rows, cols):
         """
         Return a |PlaceholderGraphicFrame| object containing a table of
@@ -6,6 +6,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from pptx.compat import BytesIO
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
@@ -25,7 +27,7 @@ from pptx.shapes.placeholder import (
     NotesSlidePlaceholder, PicturePlaceholder, PlaceholderGraphicFrame,
     PlaceholderPicture, SlidePlaceholder, TablePlaceholder
 )
-from pptx.shared import ParentedElementProxy
+from pptx.shared import cached_proxy, ParentedElementProxy
 from pptx.util import lazyproperty
 
 
@@ -58,24 +60,29 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree, parent):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
+        self._members = None
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
+        members = self._current_members()
         try:
-            shape_elm = shape_elms[idx]
+            position, shape_elm = members[idx]
         except IndexError:
             raise IndexError('shape index out of range')
-        return self._shape_factory(shape_elm)
+        # a shape moved without changing the child count is caught here
+        if self._spTree[position] is not shape_elm:
+            self._members = None
+            return self[idx]
+        return self._shape(shape_elm)
 
     def __iter__(self):
         """
         Generate a reference to each shape in the collection, in sequence.
         """
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield self._shape(shape_elm)
 
     def __len__(self):
         """
@@ -83,8 +90,7 @@ class _BaseShapes(ParentedElementProxy):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._current_members())
 
     def clone_placeholder(self, placeholder):
         """
@@ -131,6 +137,25 @@ class _BaseShapes(ParentedElementProxy):
         """
         return True
 
+    def _current_members(self):
+        """
+        Return a list of `(position, shape_elm)` pairs, one for each member
+        of this collection in sequence, *position* being the index of
+        *shape_elm* among the children of the ``<p:spTree>`` element. The
+        list is kept between calls and made afresh only when the number of
+        children has changed, so indexed access does not traverse the shape
+        tree.
+        """
+        child_count = len(self._spTree)
+        if self._members is None or self._members[0] != child_count:
+            members = [
+                (position, elm) for position, elm in enumerate(self._spTree)
+                if elm.tag in self._spTree._shape_tags and
+                self._is_member_elm(elm)
+            ]
+            self._members = (child_count, members)
+        return self._members[1]
+
     def _iter_member_elms(self):
         """
         Generate each child of the ``<p:spTree>`` element that corresponds to
@@ -182,6 +207,13 @@ class _BaseShapes(ParentedElementProxy):
             if n not in used_ids:
                 return n
 
+    def _shape(self, shape_elm):
+        """
+        Return the shape proxy for *shape_elm*, the one already in use when
+        there is one.
+        """
+        return cached_proxy(shape_elm, self, self._shape_factory)
+
     def _shape_factory(self, shape_elm):
         """
         Return an instance of the appropriate shape proxy class for
@@ -197,6 +229,10 @@ class BasePlaceholders(_BaseShapes):
     constructed using |BaseShapeFactory|. Subclasses should override
     :method:`_shape_factory` to use custom placeholder classes.
     """
+    def __init__(self, spTree, parent):
+        super(BasePlaceholders, self).__init__(spTree, parent)
+        self._ph_index = None
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -204,6 +240,39 @@ class BasePlaceholders(_BaseShapes):
         """
         return shape_elm.has_ph_elm
 
+    def _indexed_placeholder(self, key, default):
+        """
+        Return the first placeholder shape whose :meth:`_ph_key` is *key*,
+        or *default* if there is none. The placeholder shapes are indexed by
+        key when first looked up and again after the shape tree changes, so
+        a lookup costs a dict access rather than a scan of the placeholders,
+        and the same placeholder object is returned each time.
+        """
+        members = self._current_members()
+        if self._ph_index is None or self._ph_index[0] is not members:
+            placeholders_by_key = {}
+            for _, ph_elm in members:
+                key_ = self._ph_key(ph_elm)
+                if key_ not in placeholders_by_key:
+                    placeholders_by_key[key_] = self._shape(ph_elm)
+            self._ph_index = (members, placeholders_by_key)
+        placeholder = self._ph_index[1].get(key)
+        if placeholder is None:
+            return default
+        # a placeholder replaced without changing the child count
+        if placeholder.element.getparent() is not self._spTree:
+            self._members = None
+            return self._indexed_placeholder(key, default)
+        return placeholder
+
+    @staticmethod
+    def _ph_key(ph_elm):
+        """
+        Return the value placeholder element *ph_elm* is indexed by, its
+        `idx` unless overridden.
+        """
+        return ph_elm.ph_idx
+
 
 class LayoutPlaceholders(BasePlaceholders):
     """
@@ -215,10 +284,7 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        return self._indexed_placeholder(idx, default)
 
     def _shape_factory(self, shape_elm):
         """
@@ -264,10 +330,15 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        return self._indexed_placeholder(ph_type, default)
+
+    @staticmethod
+    def _ph_key(ph_elm):
+        """
+        Return the type of placeholder element *ph_elm*, by which master
+        placeholders are indexed.
+        """
+        return ph_elm.ph_type
 
     def _shape_factory(self, shape_elm):
         """
@@ -394,7 +465,7 @@ class SlidePlaceholders(ParentedElementProxy):
         """
         for e in self._element.iter_ph_elms():
             if e.ph_idx == idx:
-                return SlideShapeFactory(e, self)
+                return cached_proxy(e, self, SlideShapeFactory, self)
         raise KeyError('no placeholder on this slide with idx == %d' % idx)
 
     def __iter__(self):
@@ -404,7 +475,9 @@ class SlidePlaceholders(ParentedElementProxy):
         ph_elms = sorted(
             [e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx
         )
-        return (SlideShapeFactory(e, self) for e in ph_elms)
+        return (
+            cached_proxy(e, self, SlideShapeFactory, self) for e in ph_elms
+        )
 
     def __len__(self):
         """
@@ -564,7 +637,20 @@ class SlideShapes(_BaseShapes):
         Add placeholder shapes based on those in *slide_layout*. Z-order of
         placeholders is preserved. Latent placeholders (date, slide number,
         and footer) are not cloned.
+
+        When this shape tree is empty, having no shape elements, and id 1 is
+        the only id in use, as on a new slide, the placeholders are copies of
+        the prototypes built once by the layout, numbered from id 2.
+        Otherwise each is cloned in turn, taking the next available shape id.
         """
+        is_new_slide = (
+            next(self._spTree.iter_shape_elms(), None) is None and
+            self._next_shape_id == 2
+        )
+        if is_new_slide:
+            for sp in slide_layout.placeholder_prototypes():
+                self._spTree.insert_element_before(deepcopy(sp), 'p:extLst')
+            return
         for placeholder in slide_layout.iter_cloneable_placeholders():
             self.clone_placeholder(placeholder)
 
@@ -8,6 +8,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from weakref import WeakValueDictionary
+
 
 class ElementProxy(object):
     """
@@ -95,3 +97,51 @@ class PartElementProxy(ElementProxy):
         The package part containing this object
         """
         return self._part
+
+
+def cache_proxies(enabled=True):
+    """
+    Turn on, or off when *enabled* is |False|, the reuse of the shape, text
+    frame, paragraph, and run objects still in use when the same shape or
+    text is accessed again. Off by default.
+
+    With caching on, ``shapes[i]`` returns the shape object already obtained
+    for that shape when it is still referenced, sparing its creation and the
+    type checks choosing its class, which helps code keeping shapes around
+    while repeatedly accessing them. Code that drops each object as soon as
+    it has used it gains nothing and pays a little for the bookkeeping.
+    Caching is global and is best set once, before loading presentations.
+    """
+    global _proxies
+    if not enabled:
+        _proxies = None
+    elif _proxies is None:
+        _proxies = WeakValueDictionary()
+
+
+def cached_proxy(element, owner, factory, *args):
+    """
+    Return the proxy object for *element* in *owner*, the collection or
+    other object producing it, calling `factory(element, *args)` to create
+    it unless proxy caching is on and one is cached.
+
+    Cached proxies are kept in an identity map keyed on the element and
+    owner and held weakly, so the same proxy is returned for an element for
+    as long as it is referenced elsewhere. Proxies are value objects, so
+    reusing one is observable only by its identity.
+    """
+    proxies = _proxies
+    if proxies is None:
+        return factory(element, *args)
+    key = (element, id(owner))
+    proxy = proxies.get(key)
+    if proxy is None:
+        proxy = factory(element, *args)
+        proxies[key] = proxy
+    return proxy
+
+
+# identity map of cached proxies, |None| while caching is off. A proxy refers
+# to its owner, so an owner id cannot be reused while a proxy keyed on it is
+# alive.
+_proxies = None
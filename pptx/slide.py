@@ -9,6 +9,7 @@ from __future__ import (
 )
 
 from .enum.shapes import PP_PLACEHOLDER
+from .oxml.slide import CT_Slide
 from .shapes.shapetree import (
     LayoutPlaceholders, LayoutShapes, MasterPlaceholders, MasterShapes,
     NotesSlidePlaceholders, NotesSlideShapes, SlidePlaceholders, SlideShapes
@@ -185,6 +186,22 @@ class Slide(_BaseSlide):
         """
         return SlidePlaceholders(self._element.spTree, self)
 
+    def seal(self):
+        """
+        Release the memory held by this finished slide when building a large
+        presentation. The XML of the slide and of its notes slide and charts
+        is serialized, and it and the slide's images and chart workbooks are
+        moved to a temporary file from which they are read back when the
+        presentation is saved. Memory used while generating a deck then stays
+        proportional to the slide being built rather than the whole deck.
+
+        This slide object and any object obtained from it, such as a shape,
+        must not be used after sealing. The slide can still be changed by
+        getting it again from :attr:`.Presentation.slides`, at the cost of
+        parsing it again.
+        """
+        self.part.seal()
+
     @lazyproperty
     def shapes(self):
         """
@@ -250,9 +267,20 @@ class Slides(ParentedElementProxy):
         """
         rId, slide = self.part.add_slide(slide_layout)
         slide.shapes.clone_layout_placeholders(slide_layout)
-        self._sldIdLst.add_sldId(rId)
+        self.part.add_sldId(rId)
         return slide
 
+    def duplicate(self, slide):
+        """
+        Return a copy of *slide*, a slide in this presentation, newly added
+        as the last slide. The copy has the same slide layout and shapes,
+        and a copy of any notes slide and charts. Images and media are
+        shared rather than copied.
+        """
+        rId, new_slide = self.part.duplicate_slide(slide)
+        self.part.add_sldId(rId)
+        return new_slide
+
     def get(self, slide_id, default=None):
         """
         Return the slide identified by integer *slide_id* in this
@@ -263,15 +291,55 @@ class Slides(ParentedElementProxy):
             return default
         return slide
 
+    def import_slide(self, slide, layout_mapping=None):
+        """
+        Return a copy of *slide*, a slide of another presentation, newly added
+        as the last slide. The copy has the same shapes and a copy of any
+        notes slide and charts. An image or media file is reused when this
+        presentation already contains the same one, so importing many slides
+        that share an image stores it only once.
+
+        The copy inherits from the slide layout of this presentation named
+        by *layout_mapping*, a mapping of layout name to |SlideLayout|, for
+        the name of the layout of *slide*. When that name is not in
+        *layout_mapping*, the first layout of this presentation having the
+        same name is used. |ValueError| is raised if there is no such
+        layout. Slide layouts and masters are never copied. A hyperlink to
+        another slide is removed, that slide not being part of this
+        presentation.
+        """
+        slide_layout = self._matching_layout(
+            slide.slide_layout, layout_mapping
+        )
+        rId, new_slide = self.part.import_slide(slide, slide_layout)
+        self.part.add_sldId(rId)
+        return new_slide
+
     def index(self, slide):
         """
         Map *slide* to an integer representing its zero-based position in
         this slide collection. Raises |ValueError| on *slide* not present.
+        Finding the position walks the slide id list, so it is O(n) in the
+        number of slides.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
-                return idx
-        raise ValueError('%s is not in slide collection' % slide)
+        try:
+            return self.part.slide_idx(slide.part)
+        except ValueError:
+            raise ValueError('%s is not in slide collection' % slide)
+
+    def _matching_layout(self, slide_layout, layout_mapping):
+        """
+        Return the slide layout of this presentation to be used in place of
+        *slide_layout*, the layout of a slide being imported.
+        """
+        name = slide_layout.name
+        if layout_mapping is not None and name in layout_mapping:
+            return layout_mapping[name]
+        for slide_master in self.part.presentation.slide_masters:
+            for layout in slide_master.slide_layouts:
+                if layout.name == name:
+                    return layout
+        raise ValueError("no slide layout named '%s' in presentation" % name)
 
 
 class SlideLayout(_BaseSlide):
@@ -280,7 +348,11 @@ class SlideLayout(_BaseSlide):
     slide layout-level properties.
     """
 
-    __slots__ = ('_placeholders', '_shapes')
+    __slots__ = ('_placeholders', '_shapes', '_ph_prototypes')
+
+    def __init__(self, sldLayout, part):
+        super(SlideLayout, self).__init__(sldLayout, part)
+        self._ph_prototypes = None
 
     def iter_cloneable_placeholders(self):
         """
@@ -304,6 +376,34 @@ class SlideLayout(_BaseSlide):
         """
         return LayoutPlaceholders(self._element.spTree, self)
 
+    def placeholder_prototypes(self):
+        """
+        Return a sequence of the `p:sp` elements cloned from this layout to
+        a new slide, as :meth:`SlideShapes.clone_layout_placeholders` adds
+        them to an empty shape tree. The elements are built once and rebuilt
+        only after the shape tree of this layout or one of its placeholders
+        changes. They are shared, so each must be copied before use.
+        """
+        spTree = self._element.spTree
+        if self._ph_prototypes is not None:
+            children, ph_attrs, prototypes = self._ph_prototypes
+            if tuple(spTree) == children and all(
+                    dict(ph.attrib) == attrs for ph, attrs in ph_attrs):
+                return prototypes
+
+        slide_spTree = CT_Slide.new().cSld.spTree
+        slide_shapes = SlideShapes(slide_spTree, None)
+        for placeholder in self.iter_cloneable_placeholders():
+            slide_shapes.clone_placeholder(placeholder)
+        ph_attrs = tuple(
+            (ph, dict(ph.attrib)) for ph in (
+                sp.ph for sp in spTree.iter_shape_elms()
+            ) if ph is not None
+        )
+        prototypes = tuple(slide_spTree.iter_shape_elms())
+        self._ph_prototypes = (tuple(spTree), ph_attrs, prototypes)
+        return prototypes
+
     @lazyproperty
     def shapes(self):
         """
@@ -0,0 +1,359 @@
+# encoding: utf-8
+
+"""
+Size and memory accounting for the parts of a presentation package, to find
+out what makes a deck large on disk or in memory.
+
+:meth:`Package.stats` returns a |PackageStats| object recording, for each
+part, its size serialized and compressed as it would be saved, the number of
+elements in its XML when parsed, an estimate of the memory it occupies, and
+the number of relationships referring to it. The parts each slide owns are
+totalled too, so a slide carrying a large video stands out::
+
+    stats = prs.part.package.stats()
+    print(stats.report())
+
+Also usable from the command line; ``python -m pptx.stats --help`` describes
+the arguments.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import argparse
+import json
+import sys
+import zlib
+
+from collections import namedtuple
+
+from .api import Presentation
+from .opc.package import _DeferredXml, XmlPart
+
+
+#: Approximate memory in bytes occupied by an element of a parsed XML part,
+#: including its attributes and text, as measured for slide XML with lxml.
+ELEMENT_BYTES = 225
+
+#: The accounting of a single part. *size* is the length in bytes of its
+#: blob as it would be saved and *compressed_size* that of the blob once
+#: deflated as in the saved package, or |None| when not computed.
+#: *element_count* is the number of elements in the XML of a parsed part,
+#: |None| for a binary part or one whose XML has not been parsed. *memory*
+#: estimates the bytes held in memory by the part, and *ref_count* is the
+#: number of relationships in the package targeting it.
+PartStats = namedtuple('PartStats', (
+    'partname', 'content_type', 'size', 'compressed_size', 'element_count',
+    'memory', 'ref_count'
+))
+
+#: The accounting of the parts owned by a slide, those reached from it
+#: without passing through another slide, a layout, or a master, such as its
+#: notes, charts, images, and media. *slide_index* is the zero-based
+#: position of the slide in the presentation. *size*, *compressed_size*, and
+#: *memory* are totals over the *part_count* parts it owns, including the
+#: slide part itself. *unshared_size* totals only those owned by no other
+#: slide, the size saved by deleting the slide.
+SlideStats = namedtuple('SlideStats', (
+    'slide_index', 'partname', 'part_count', 'size', 'compressed_size',
+    'memory', 'unshared_size'
+))
+
+
+def package_stats(package, compress=True):
+    """
+    Return a |PackageStats| object for *package*, a |Package| object. The
+    compressed size of each part is left |None| when *compress* is |False|,
+    saving the cost of deflating every blob.
+
+    Computing the stats serializes each parsed XML part, as saving does, but
+    changes nothing; a part not yet parsed is not parsed. The slides are
+    found from the slide id list of the presentation part, so no |Slide|
+    object is built.
+    """
+    ref_counts = {}
+    for rel in package.iter_rels():
+        if rel.is_external:
+            continue
+        part = rel.target_part
+        ref_counts[part] = ref_counts.get(part, 0) + 1
+
+    stats_by_part = dict(
+        (part, _part_stats(part, ref_counts.get(part, 0), compress))
+        for part in package.iter_parts()
+    )
+
+    presentation_part = package.presentation_part
+    sldIdLst = presentation_part._element.sldIdLst
+    owned_parts = [
+        list(presentation_part.related_parts[sldId.rId]._iter_owned_parts())
+        for sldId in (() if sldIdLst is None else sldIdLst)
+    ]
+    owner_counts = {}
+    for parts in owned_parts:
+        for part in parts:
+            owner_counts[part] = owner_counts.get(part, 0) + 1
+
+    slides = [
+        _slide_stats(
+            slide_idx, [stats_by_part[part] for part in parts],
+            [stats_by_part[part] for part in parts if owner_counts[part] == 1]
+        )
+        for slide_idx, parts in enumerate(owned_parts)
+    ]
+    parts = sorted(stats_by_part.values(), key=lambda s: s.partname)
+    return PackageStats(parts, slides)
+
+
+class PackageStats(object):
+    """
+    The accounting of a package, having a |PartStats| object for each part
+    in *parts* and a |SlideStats| object for each slide in *slides*.
+    """
+    def __init__(self, parts, slides):
+        super(PackageStats, self).__init__()
+        self.parts = parts
+        self.slides = slides
+
+    @property
+    def compressed_size(self):
+        """
+        Total compressed size of the parts in bytes, or |None| when not
+        computed. The saved package is a little larger, adding the zip
+        headers and the content types and relationships items.
+        """
+        return _total(s.compressed_size for s in self.parts)
+
+    def content_type_totals(self):
+        """
+        Return a dict mapping each content type to a `(part_count, size,
+        compressed_size, memory)` 4-tuple totalling the parts of that type.
+        """
+        stats_by_content_type = {}
+        for stats in self.parts:
+            stats_by_content_type.setdefault(
+                stats.content_type, []
+            ).append(stats)
+        return dict(
+            (content_type, (
+                len(stats_list),
+                _total(s.size for s in stats_list),
+                _total(s.compressed_size for s in stats_list),
+                _total(s.memory for s in stats_list),
+            ))
+            for content_type, stats_list in stats_by_content_type.items()
+        )
+
+    @property
+    def memory(self):
+        """
+        Estimated total memory in bytes held by the parts.
+        """
+        return _total(s.memory for s in self.parts)
+
+    def report(self, top=10):
+        """
+        Return a text report of the package totals, the totals for each
+        content type, largest first, and the *top* largest parts and slides.
+        """
+        lines = [
+            'parts: %d  size: %s  compressed: %s  memory: %s' % (
+                len(self.parts), _fmt_bytes(self.size),
+                _fmt_bytes(self.compressed_size), _fmt_bytes(self.memory)
+            ),
+            '',
+            '%-48s %6s %10s %10s %10s' % (
+                'content type', 'parts', 'size', 'compressed', 'memory'
+            ),
+        ]
+        for content_type, (part_count, size, compressed_size, memory) in (
+                sorted(self.content_type_totals().items(),
+                       key=lambda item: -item[1][1])):
+            lines.append('%-48s %6d %10s %10s %10s' % (
+                _short_content_type(content_type), part_count,
+                _fmt_bytes(size), _fmt_bytes(compressed_size),
+                _fmt_bytes(memory)
+            ))
+
+        lines.append('')
+        lines.append('%-44s %10s %10s %10s %8s %5s' % (
+            'part', 'size', 'compressed', 'memory', 'elements', 'refs'
+        ))
+        for stats in sorted(self.parts, key=lambda s: -s.size)[:top]:
+            lines.append('%-44s %10s %10s %10s %8s %5d' % (
+                stats.partname[-44:], _fmt_bytes(stats.size),
+                _fmt_bytes(stats.compressed_size), _fmt_bytes(stats.memory),
+                '-' if stats.element_count is None else stats.element_count,
+                stats.ref_count
+            ))
+
+        if self.slides:
+            lines.append('')
+            lines.append('%-5s %-30s %6s %10s %10s %10s %10s' % (
+                'slide', 'partname', 'parts', 'size', 'unshared',
+                'compressed', 'memory'
+            ))
+            for stats in sorted(self.slides, key=lambda s: -s.size)[:top]:
+                lines.append('%-5d %-30s %6d %10s %10s %10s %10s' % (
+                    stats.slide_index + 1, stats.partname[-30:],
+                    stats.part_count, _fmt_bytes(stats.size),
+                    _fmt_bytes(stats.unshared_size),
+                    _fmt_bytes(stats.compressed_size),
+                    _fmt_bytes(stats.memory)
+                ))
+        return '\n'.join(lines)
+
+    @property
+    def size(self):
+        """
+        Total uncompressed size of the parts in bytes.
+        """
+        return _total(s.size for s in self.parts)
+
+    def to_dict(self):
+        """
+        Return the stats as a dict of lists of dicts, suitable for
+        serializing as JSON.
+        """
+        return {
+            'parts': [dict(s._asdict()) for s in self.parts],
+            'slides': [dict(s._asdict()) for s in self.slides],
+        }
+
+
+def main(argv=None):
+    """
+    Command-line entry point, printing the report for a .pptx file, or the
+    stats as JSON.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m pptx.stats',
+        description='Report the size and memory use of the parts of a deck.'
+    )
+    parser.add_argument('pptx', help='.pptx file to report on')
+    parser.add_argument(
+        '-n', '--top', type=int, default=10,
+        help='number of largest parts and slides listed (default: 10)'
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='print the stats as JSON'
+    )
+    parser.add_argument(
+        '--no-compress', action='store_true',
+        help='skip computing compressed sizes'
+    )
+    args = parser.parse_args(argv)
+
+    package = Presentation(args.pptx).part.package
+    stats = package_stats(package, compress=not args.no_compress)
+    if args.json:
+        print(json.dumps(stats.to_dict(), indent=2))
+    else:
+        print(stats.report(args.top))
+    return 0
+
+
+def _compressed_size(blob):
+    """
+    Return the length of *blob* deflated as a zip member is on save.
+    """
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+    )
+    return len(compressor.compress(blob)) + len(compressor.flush())
+
+
+def _fmt_bytes(value):
+    """
+    Return *value*, a number of bytes, formatted briefly for a report.
+    """
+    if value is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB'):
+        if value < 1024:
+            return ('%d %s' if unit == 'B' else '%.1f %s') % (value, unit)
+        value /= 1024
+    return '%.1f GB' % value
+
+
+def _memory(part, element_count):
+    """
+    Return the estimated memory in bytes held by *part*. A parsed XML part
+    is estimated by its element count, and an unparsed one by its blob when
+    the part keeps it. A spilled part, or one sharing the blob of
+    a |PackageTemplate|, holds nothing of its own.
+    """
+    if element_count is not None:
+        return element_count * ELEMENT_BYTES
+    if isinstance(part, XmlPart):
+        xml_source = part.__dict__.get('_xml_source')
+        if isinstance(xml_source, _DeferredXml):
+            return len(xml_source.blob)
+        return 0
+    blob = part.__dict__.get('_blob')
+    return 0 if blob is None else len(blob)
+
+
+def _part_stats(part, ref_count, compress):
+    """
+    Return a |PartStats| object for *part*.
+    """
+    blob = part.blob
+    element = part.__dict__.get('_element')
+    element_count = (
+        None if element is None else sum(1 for _ in element.iter())
+    )
+    return PartStats(
+        part.partname, part.content_type, len(blob),
+        _compressed_size(blob) if compress else None, element_count,
+        _memory(part, element_count), ref_count
+    )
+
+
+def _short_content_type(content_type):
+    """
+    Return *content_type* without the vendor prefix shared by most Office
+    content types, for a report.
+    """
+    for prefix in _content_type_prefixes:
+        if content_type.startswith(prefix):
+            return content_type[len(prefix):]
+    return content_type
+
+
+_content_type_prefixes = (
+    'application/vnd.openxmlformats-officedocument.',
+    'application/vnd.openxmlformats-',
+)
+
+
+def _slide_stats(slide_idx, owned, unshared):
+    """
+    Return a |SlideStats| object for the slide at *slide_idx*, owning the
+    parts of the |PartStats| objects in *owned*, of which those in
+    *unshared* are owned by no other slide.
+    """
+    return SlideStats(
+        slide_idx, owned[0].partname, len(owned),
+        _total(s.size for s in owned),
+        _total(s.compressed_size for s in owned),
+        _total(s.memory for s in owned),
+        _total(s.size for s in unshared)
+    )
+
+
+def _total(values):
+    """
+    Return the sum of *values*, or |None| when any of them is |None|.
+    """
+    total = 0
+    for value in values:
+        if value is None:
+            return None
+        total += value
+    return total
+
+
+if __name__ == '__main__':
+    sys.exit(main())
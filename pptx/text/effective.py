@@ -0,0 +1,447 @@
+# encoding: utf-8
+
+"""
+Effective text formatting, the font and paragraph settings a run or
+paragraph actually renders with once those it inherits are taken into
+account.
+
+A |Font| or |_Paragraph| object reports only what is set directly on its
+run or paragraph, |None| meaning "inherited". A |TextFormatResolver| looks
+up what that |None| stands for, walking the same chain PowerPoint does:
+
+* the run properties (`a:rPr`) or paragraph properties (`a:pPr`),
+* the list style (`a:lstStyle`) of the shape, at the paragraph's level,
+* for a placeholder, the list style of the layout placeholder it inherits
+  from, then that of the master placeholder, then the title, body, or other
+  text style of the master (`p:txStyles`),
+* the default text style of the presentation (`p:defaultTextStyle`).
+
+Theme fonts like ``+mn-lt`` and theme colors are resolved through the theme
+and color map of the slide master. What a shape, layout, and master
+contribute is worked out once for each shape and each placeholder of a part
+and reused, so a bulk audit of every run in a deck costs little more than
+reading its runs::
+
+    resolver = TextFormatResolver()
+    for slide in prs.slides:
+        for shape, run, font in resolver.iter_run_fonts(slide):
+            if font.size is not None and font.size < Pt(10):
+                print(slide.slide_id, shape.name, run.text)
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from collections import namedtuple
+
+from ..dml.color import RGBColor
+from ..enum.shapes import PP_PLACEHOLDER
+from ..enum.text import MSO_UNDERLINE
+from ..opc.constants import RELATIONSHIP_TYPE as RT
+from ..oxml import parse_xml
+from ..oxml.ns import qn
+from ..parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
+from ..util import Centipoints
+
+
+#: The effective font of a run. *name* is the typeface, with a theme font
+#: like ``'+mj-lt'`` replaced by the typeface the theme assigns it. *size*
+#: is a |Length|, before any shrinking by auto-fit. *bold* and *italic* are
+#: |True| or |False|. *underline* is |True|, |False|, or a member of
+#: :ref:`MsoTextUnderlineType`, as for |Font|. *color* is an |RGBColor|,
+#: the base color of a theme color without any brightness adjustment. Each
+#: is |None| when set nowhere in the inheritance chain.
+EffectiveFont = namedtuple('EffectiveFont', (
+    'name', 'size', 'bold', 'italic', 'underline', 'color'
+))
+
+#: The effective formatting of a paragraph, with the same meaning for each
+#: field as the like-named property of |_Paragraph|. Each is |None| when set
+#: nowhere in the inheritance chain.
+EffectiveParagraphFormat = namedtuple('EffectiveParagraphFormat', (
+    'alignment', 'line_spacing', 'space_before', 'space_after'
+))
+
+
+class TextFormatResolver(object):
+    """
+    Resolves the |EffectiveFont| of runs and |EffectiveParagraphFormat| of
+    paragraphs in slides, layouts, and masters.
+
+    What a layout, master, and the presentation contribute to each kind of
+    placeholder is cached on first use and shared by all the slides using
+    that layout, and what each shape inherits is cached with it, for the
+    lifetime of the resolver. Formatting set on a run or paragraph is always
+    read afresh, but a resolver does not see later changes to the list style
+    of a shape it has resolved, or to a layout, master, or theme; create
+    a new one after making such changes.
+    """
+    def __init__(self):
+        super(TextFormatResolver, self).__init__()
+        self._scopes = {}  # part -> (role, layout, master, presentation)
+        self._inherited = {}  # scope + (ph_type, ph_idx, lvl) -> style
+        self._shape_styles = {}  # (txBody, level) -> (run_values, pPrs)
+        self._themes = {}  # master part -> _Theme
+
+    def font(self, run):
+        """
+        Return the |EffectiveFont| of *run*, a |_Run| object.
+        """
+        r = run._r
+        return self._font(r, r.getparent(), self._scope(run.part))
+
+    def iter_run_fonts(self, slide):
+        """
+        Generate a `(shape, run, font)` 3-tuple for each run in the shapes
+        of *slide*, a slide, layout, or master, *font* being the
+        |EffectiveFont| of *run*. Shapes without a text frame, like tables
+        and group shapes, are skipped.
+        """
+        scope = self._scope(slide.part)
+        for shape in slide.shapes:
+            if not shape.has_text_frame:
+                continue
+            for paragraph in shape.text_frame.paragraphs:
+                p = paragraph._p
+                for run in paragraph.runs:
+                    yield shape, run, self._font(run._r, p, scope)
+
+    def paragraph_format(self, paragraph):
+        """
+        Return the |EffectiveParagraphFormat| of *paragraph*, a |_Paragraph|
+        object.
+        """
+        p = paragraph._p
+        pPr = p.pPr
+        level = 0 if pPr is None else pPr.lvl
+        scope = self._scope(paragraph.part)
+        pPrs = self._shape_style(p.getparent(), level, scope)[1]
+        if pPr is not None:
+            pPrs = (pPr,) + pPrs
+        return EffectiveParagraphFormat(
+            _first(pPr.algn for pPr in pPrs),
+            _first(pPr.line_spacing for pPr in pPrs),
+            _first(pPr.space_before for pPr in pPrs),
+            _first(pPr.space_after for pPr in pPrs),
+        )
+
+    def _font(self, r, p, scope):
+        """
+        Return the |EffectiveFont| of the `a:r` element *r* in `a:p` element
+        *p*, in a part having inheritance *scope*.
+        """
+        pPr = p.pPr
+        level = 0 if pPr is None else pPr.lvl
+        values = self._shape_style(p.getparent(), level, scope)[0]
+        rPr = r.rPr
+        if rPr is not None:
+            run_values = self._rPr_values(rPr, scope[2])
+            if run_values:
+                values = dict(values, **run_values)
+        return EffectiveFont(
+            values.get('name'), values.get('size'), values.get('bold'),
+            values.get('italic'), values.get('underline'),
+            values.get('color'),
+        )
+
+    def _inherited_style(self, sp, level, scope):
+        """
+        Return a `(run_values, pPrs)` pair like :meth:`_shape_style` for
+        what shape *sp* inherits at *level* from outside itself, from its
+        layout placeholder, master placeholder, master text styles, and the
+        presentation defaults. Cached for each kind of placeholder in
+        *scope*.
+        """
+        ph = sp.ph if sp.tag == _p_sp else None
+        ph_type, ph_idx = (
+            (None, None) if ph is None else (ph.type, ph.idx)
+        )
+        key = scope + (ph_type, ph_idx, level)
+        style = self._inherited.get(key)
+        if style is None:
+            pPrs = tuple(
+                self._iter_inherited_pPrs(ph_type, ph_idx, level, scope)
+            )
+            style = self._inherited[key] = (
+                self._run_values(pPrs, scope[2]), pPrs
+            )
+        return style
+
+    def _iter_inherited_pPrs(self, ph_type, ph_idx, level, scope):
+        """
+        Generate the level paragraph properties elements present in each
+        place in the chain a shape inherits from, as described for
+        :meth:`_inherited_style`.
+        """
+        role, layout_part, master_part, presentation_part = scope
+        if ph_type is not None and master_part is not None:
+            if role == 'slide':
+                layout_ph = layout_part.slide_layout.placeholders.get(ph_idx)
+                if layout_ph is not None:
+                    ph_type = layout_ph.element.ph_type
+                    for pPr in _lvl_pPrs(_lstStyle(layout_ph.element), level):
+                        yield pPr
+            if role != 'master':
+                master_ph = master_part.slide_master.placeholders.get(
+                    _master_ph_type(ph_type)
+                )
+                if master_ph is not None:
+                    for pPr in _lvl_pPrs(_lstStyle(master_ph.element), level):
+                        yield pPr
+            txStyles = master_part._element.find(_p_txStyles)
+            if txStyles is not None:
+                style = txStyles.find(_txStyle_tag(ph_type))
+                for pPr in _lvl_pPrs(style, level):
+                    yield pPr
+        defaultTextStyle = presentation_part._element.find(
+            _p_defaultTextStyle
+        )
+        for pPr in _lvl_pPrs(defaultTextStyle, level):
+            yield pPr
+
+    def _rPr_values(self, rPr, master_part):
+        """
+        Return a dict of the font settings present in *rPr*, an `a:rPr` or
+        `a:defRPr` element, with theme fonts and colors resolved using the
+        theme of *master_part*.
+        """
+        values = {}
+        if rPr.sz is not None:
+            values['size'] = Centipoints(rPr.sz)
+        if rPr.b is not None:
+            values['bold'] = rPr.b
+        if rPr.i is not None:
+            values['italic'] = rPr.i
+        u = rPr.u
+        if u is not None:
+            values['underline'] = (
+                False if u is MSO_UNDERLINE.NONE else
+                True if u is MSO_UNDERLINE.SINGLE_LINE else u
+            )
+        latin = rPr.latin
+        if latin is not None:
+            values['name'] = self._theme(master_part).typeface(
+                latin.typeface
+            )
+        solidFill = rPr.find(_a_solidFill)
+        if solidFill is not None and len(solidFill):
+            values['color'] = self._theme(master_part).color(solidFill[0])
+        return values
+
+    def _run_values(self, pPrs, master_part):
+        """
+        Return a dict of the font settings a run inherits from the
+        `a:defRPr` children of *pPrs*, the most specific first.
+        """
+        values = {}
+        for pPr in reversed(pPrs):
+            defRPr = pPr.defRPr
+            if defRPr is not None:
+                values.update(self._rPr_values(defRPr, master_part))
+        return values
+
+    def _scope(self, part):
+        """
+        Return a `(role, layout_part, master_part, presentation_part)` tuple
+        describing where the shapes of *part* inherit from. *role* is
+        ``'slide'``, ``'layout'``, or ``'master'`` for a part of that kind,
+        whose layout and master parts are the ones it uses, or is, and
+        |None| for any other part, having neither.
+        """
+        scope = self._scopes.get(part)
+        if scope is None:
+            presentation_part = part.package.presentation_part
+            if isinstance(part, SlidePart):
+                layout_part = part.part_related_by(RT.SLIDE_LAYOUT)
+                scope = (
+                    'slide', layout_part,
+                    layout_part.part_related_by(RT.SLIDE_MASTER),
+                    presentation_part
+                )
+            elif isinstance(part, SlideLayoutPart):
+                scope = (
+                    'layout', part, part.part_related_by(RT.SLIDE_MASTER),
+                    presentation_part
+                )
+            elif isinstance(part, SlideMasterPart):
+                scope = ('master', None, part, presentation_part)
+            else:
+                scope = (None, None, None, presentation_part)
+            self._scopes[part] = scope
+        return scope
+
+    def _shape_style(self, txBody, level, scope):
+        """
+        Return a `(run_values, pPrs)` pair for the paragraphs at *level* in
+        *txBody*, the text body of a shape in a part having inheritance
+        *scope*. *run_values* is a dict of the font settings a run inherits,
+        and *pPrs* the tuple of paragraph properties elements a paragraph
+        inherits from, most specific first.
+        """
+        key = (txBody, level)
+        style = self._shape_styles.get(key)
+        if style is None:
+            style = self._inherited_style(txBody.getparent(), level, scope)
+            own_pPrs = tuple(_lvl_pPrs(txBody.find(_a_lstStyle), level))
+            if own_pPrs:
+                run_values, pPrs = style
+                style = (
+                    dict(run_values, **self._run_values(own_pPrs, scope[2])),
+                    own_pPrs + pPrs
+                )
+            self._shape_styles[key] = style
+        return style
+
+    def _theme(self, master_part):
+        """
+        Return the |_Theme| object for *master_part*.
+        """
+        theme = self._themes.get(master_part)
+        if theme is None:
+            theme = self._themes[master_part] = _Theme(master_part)
+        return theme
+
+
+class _Theme(object):
+    """
+    The fonts and colors of the theme of *master_part*, a slide master part,
+    as mapped by the color map of that master. An empty theme when
+    *master_part* is |None|.
+    """
+    def __init__(self, master_part):
+        super(_Theme, self).__init__()
+        self._typefaces = {}
+        self._colors = {}
+        if master_part is None:
+            return
+        theme = parse_xml(master_part.part_related_by(RT.THEME).blob)
+        themeElements = theme.find(qn('a:themeElements'))
+        fontScheme = themeElements.find(qn('a:fontScheme'))
+        for prefix, tag in (('+mj-', 'a:majorFont'), ('+mn-', 'a:minorFont')):
+            font = fontScheme.find(qn(tag))
+            for script, script_tag in _script_tags:
+                typeface = font.find(qn(script_tag))
+                if typeface is not None:
+                    self._typefaces[prefix + script] = typeface.get(
+                        'typeface'
+                    )
+        scheme_colors = dict(
+            (_localname(clr.tag), self._rgb(clr[0]))
+            for clr in themeElements.find(qn('a:clrScheme'))
+            if len(clr)
+        )
+        self._colors.update(scheme_colors)
+        clrMap = master_part._element.find(qn('p:clrMap'))
+        if clrMap is not None:
+            for name, mapped_name in clrMap.attrib.items():
+                if mapped_name in scheme_colors:
+                    self._colors[name] = scheme_colors[mapped_name]
+
+    def color(self, color_elm):
+        """
+        Return the |RGBColor| of *color_elm*, a color choice element like
+        `a:srgbClr` or `a:schemeClr`, or |None| if it cannot be resolved.
+        """
+        if color_elm.tag == _a_schemeClr:
+            return self._colors.get(color_elm.get('val'))
+        return self._rgb(color_elm)
+
+    def typeface(self, typeface):
+        """
+        Return *typeface*, or the typeface of the theme font it names, like
+        ``'+mj-lt'``.
+        """
+        return self._typefaces.get(typeface, typeface)
+
+    @staticmethod
+    def _rgb(color_elm):
+        """
+        Return the |RGBColor| of an `a:srgbClr` or `a:sysClr` element, or
+        |None| for any other color choice element.
+        """
+        if color_elm.tag == _a_srgbClr:
+            return RGBColor.from_string(color_elm.get('val'))
+        if color_elm.tag == _a_sysClr and color_elm.get('lastClr'):
+            return RGBColor.from_string(color_elm.get('lastClr'))
+        return None
+
+
+_a_defPPr = qn('a:defPPr')
+_a_lstStyle = qn('a:lstStyle')
+_a_lvl_pPrs = tuple(qn('a:lvl%dpPr' % n) for n in range(1, 10))
+_a_schemeClr = qn('a:schemeClr')
+_a_solidFill = qn('a:solidFill')
+_a_srgbClr = qn('a:srgbClr')
+_a_sysClr = qn('a:sysClr')
+_p_defaultTextStyle = qn('p:defaultTextStyle')
+_p_sp = qn('p:sp')
+_p_txBody = qn('p:txBody')
+_p_txStyles = qn('p:txStyles')
+_script_tags = (('lt', 'a:latin'), ('ea', 'a:ea'), ('cs', 'a:cs'))
+
+
+def _first(values):
+    """
+    Return the first of *values* that is not |None|, or |None|.
+    """
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _lstStyle(sp):
+    """
+    Return the `a:lstStyle` element of placeholder shape *sp*, or |None|.
+    """
+    txBody = sp.find(_p_txBody)
+    return None if txBody is None else txBody.find(_a_lstStyle)
+
+
+def _localname(tag):
+    """
+    Return the local part of Clark-notation *tag*, like ``'dk1'`` for
+    ``'{http://...}dk1'``.
+    """
+    return tag.rpartition('}')[2]
+
+
+def _lvl_pPrs(style, level):
+    """
+    Generate the paragraph properties element for *level* in *style*, a list
+    style element like `a:lstStyle` or `p:bodyStyle`, then its `a:defPPr`
+    element, each only when present. Nothing is generated when *style* is
+    |None|.
+    """
+    if style is None:
+        return
+    for tag in (_a_lvl_pPrs[level], _a_defPPr):
+        pPr = style.find(tag)
+        if pPr is not None:
+            yield pPr
+
+
+def _master_ph_type(ph_type):
+    """
+    Return the type of the master placeholder a layout placeholder of
+    *ph_type* inherits from.
+    """
+    if ph_type in (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE):
+        return PP_PLACEHOLDER.TITLE
+    if ph_type in (
+            PP_PLACEHOLDER.DATE, PP_PLACEHOLDER.FOOTER,
+            PP_PLACEHOLDER.SLIDE_NUMBER):
+        return ph_type
+    return PP_PLACEHOLDER.BODY
+
+
+def _txStyle_tag(ph_type):
+    """
+    Return the tag of the master text style a placeholder of *ph_type* takes
+    its text formatting from.
+    """
+    master_ph_type = _master_ph_type(ph_type)
+    if master_ph_type == PP_PLACEHOLDER.TITLE:
+        return qn('p:titleStyle')
+    if master_ph_type == PP_PLACEHOLDER.BODY:
+        return qn('p:bodyStyle')
+    return qn('p:otherStyle')
@@ -6,8 +6,6 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
-from PIL import ImageFont
-
 
 class TextFitter(tuple):
     """
@@ -291,6 +289,8 @@ class _Fonts(object):
 
     @classmethod
     def font(cls, font_path, point_size):
+        from PIL import ImageFont
+
         if (font_path, point_size) not in cls.fonts:
             cls.fonts[(font_path, point_size)] = ImageFont.truetype(
                 font_path, point_size
@@ -0,0 +1,215 @@
+# encoding: utf-8
+
+"""
+Deck-wide replacement of placeholder tokens like ``{{name}}`` in slide text,
+working directly on the `a:t` elements of each slide rather than through the
+shape and text object model.
+
+PowerPoint often splits what looks like a single word across several runs,
+for example when part of it was edited or spell-checked separately, so
+a token is matched against the text of a whole paragraph and its replacement
+written back across the runs it spans. The replacement text takes on the
+formatting of the run in which the token starts.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from bisect import bisect_right
+
+from ..compat import is_string, to_unicode, Unicode
+from ..oxml.ns import qn
+
+
+#: Default token pattern, matching names like ``{{name}}`` or
+#: ``{{ order.total }}``. The first group of a token pattern is the token
+#: name used as the key into the replacements mapping.
+DEFAULT_TOKEN_PATTERN = r'\{\{\s*([\w.\-]+)\s*\}\}'
+
+
+def replace_tokens(prs, replacements, pattern=DEFAULT_TOKEN_PATTERN):
+    """
+    Replace each token matching *pattern* in the slides of presentation
+    *prs* whose name is a key in *replacements* with the corresponding
+    value, converted to text if it is not a string. Tokens not in
+    *replacements* are left unchanged. Returns the number of tokens
+    replaced.
+
+    Each slide is traversed once. Use a |TokenIndex| to repeat the same
+    replacement on many presentations created from one template.
+    """
+    pattern = re.compile(pattern)
+    replacements = _text_replacements(replacements)
+    count = 0
+    for slide in prs.slides:
+        for p in slide._element.iter(_a_p):
+            count += _replace_in_paragraph(p, pattern, replacements)
+    return count
+
+
+class TokenIndex(object):
+    """
+    The location of each token matching *pattern* in the slides of
+    presentation *prs*, found in a single pass over their text.
+
+    The index can be applied by :meth:`replace` to *prs* itself or to any
+    other presentation having the same slides, such as those created from
+    the same |PresentationTemplate|. Only the paragraphs known to contain
+    a token are then visited. Locations are recorded by position, so the
+    index must be applied before slides are added to or removed from the
+    presentation, or text is added to them.
+    """
+    def __init__(self, prs, pattern=DEFAULT_TOKEN_PATTERN):
+        super(TokenIndex, self).__init__()
+        self._pattern = re.compile(pattern)
+        self._locations = {}  # token -> [(slide_idx, p_idx), ...]
+        self._tokens_at = {}  # slide_idx -> {p_idx: frozenset(tokens)}
+        for slide_idx, slide in enumerate(prs.slides):
+            for p_idx, p in enumerate(slide._element.iter(_a_p)):
+                tokens = self._paragraph_tokens(p)
+                if not tokens:
+                    continue
+                self._tokens_at.setdefault(slide_idx, {})[p_idx] = tokens
+                for token in tokens:
+                    self._locations.setdefault(token, []).append(
+                        (slide_idx, p_idx)
+                    )
+
+    def locations(self, token):
+        """
+        Return a list of `(slide_idx, paragraph_idx)` pairs, one for each
+        paragraph containing *token*, in document order. *paragraph_idx* is
+        the position of the `a:p` element among all those in the slide,
+        including those in tables and grouped shapes.
+        """
+        return list(self._locations.get(token, ()))
+
+    def replace(self, prs, replacements):
+        """
+        Replace the indexed tokens in *prs* whose name is a key in
+        *replacements* with the corresponding value, as
+        :func:`replace_tokens` does. Slides and paragraphs containing none
+        of those tokens are not visited. Returns the number of tokens
+        replaced.
+        """
+        replacements = _text_replacements(replacements)
+        names = frozenset(replacements)
+        count = 0
+        slides = prs.slides
+        for slide_idx in sorted(self._tokens_at):
+            p_idxs = [
+                p_idx for p_idx, tokens in self._tokens_at[slide_idx].items()
+                if not tokens.isdisjoint(names)
+            ]
+            if not p_idxs:
+                continue
+            ps = list(slides[slide_idx]._element.iter(_a_p))
+            for p_idx in p_idxs:
+                count += _replace_in_paragraph(
+                    ps[p_idx], self._pattern, replacements
+                )
+        return count
+
+    @property
+    def tokens(self):
+        """
+        Set of the names of the tokens found in the slides.
+        """
+        return frozenset(self._locations)
+
+    def _paragraph_tokens(self, p):
+        """
+        Return the set of names of the tokens in `a:p` element *p*.
+        """
+        tokens = set()
+        for t_elms in _line_t_elms(p):
+            text = ''.join(t.text or '' for t in t_elms)
+            tokens.update(m.group(1) for m in self._pattern.finditer(text))
+        return frozenset(tokens)
+
+
+_a_br = qn('a:br')
+_a_p = qn('a:p')
+_a_t = qn('a:t')
+
+
+def _line_t_elms(p):
+    """
+    Generate a list of the `a:t` elements of each line of `a:p` element *p*,
+    lines being separated by `a:br` elements. A token never spans a line
+    break.
+    """
+    t_elms = []
+    for elm in p.iter(_a_t, _a_br):
+        if elm.tag == _a_br:
+            yield t_elms
+            t_elms = []
+            continue
+        t_elms.append(elm)
+    yield t_elms
+
+
+def _replace_in_line(t_elms, pattern, replacements):
+    """
+    Replace the tokens in the text of *t_elms*, the `a:t` elements of one
+    line of a paragraph, and return the number replaced. The replacement
+    text is placed in the element where its token starts, and the rest of
+    the token is removed from the elements it extends into.
+    """
+    texts = [t.text or '' for t in t_elms]
+    text = ''.join(texts)
+    matches = [
+        match for match in pattern.finditer(text)
+        if match.group(1) in replacements
+    ]
+    if not matches:
+        return 0
+
+    offsets = []
+    offset = 0
+    for t_text in texts:
+        offsets.append(offset)
+        offset += len(t_text)
+
+    # working from the last match back keeps the offsets of earlier ones valid
+    changed = set()
+    for match in reversed(matches):
+        start, end = match.span()
+        first = bisect_right(offsets, start) - 1
+        last = bisect_right(offsets, end - 1) - 1
+        replacement = replacements[match.group(1)]
+        head = texts[first][:start - offsets[first]]
+        tail = texts[last][end - offsets[last]:]
+        if first == last:
+            texts[first] = head + replacement + tail
+        else:
+            texts[first] = head + replacement
+            for idx in range(first + 1, last):
+                texts[idx] = ''
+            texts[last] = tail
+        changed.update(range(first, last + 1))
+
+    for idx in changed:
+        t_elms[idx].text = texts[idx] or None
+    return len(matches)
+
+
+def _replace_in_paragraph(p, pattern, replacements):
+    """
+    Replace the tokens in `a:p` element *p* and return the number replaced.
+    """
+    return sum(
+        _replace_in_line(t_elms, pattern, replacements)
+        for t_elms in _line_t_elms(p)
+    )
+
+
+def _text_replacements(replacements):
+    """
+    Return a dict like *replacements* with each value converted to text.
+    """
+    return dict(
+        (name, to_unicode(value) if is_string(value) else Unicode(value))
+        for name, value in replacements.items()
+    )
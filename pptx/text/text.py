@@ -15,6 +15,7 @@ from .fonts import FontFiles
 from .layout import TextFitter
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..oxml.simpletypes import ST_TextWrappingType
+from ..shared import cached_proxy
 from ..shapes import Subshape
 from ..util import Centipoints, Emu, lazyproperty, Pt
 
@@ -25,6 +26,9 @@ class TextFrame(Subshape):
     frame. Corresponds to the ``<p:txBody>`` element that can appear as a
     child element of ``<p:sp>``. Not intended to be constructed directly.
     """
+
+    __slots__ = ('_element', '_txBody')
+
     def __init__(self, txBody, parent):
         super(TextFrame, self).__init__(parent)
         self._element = self._txBody = txBody
@@ -35,7 +39,7 @@ class TextFrame(Subshape):
         paragraphs contained in this text frame.
         """
         p = self._txBody.add_p()
-        return _Paragraph(p, self)
+        return cached_proxy(p, self, _Paragraph, self)
 
     @property
     def auto_size(self):
@@ -133,7 +137,10 @@ class TextFrame(Subshape):
         paragraphs in this text frame. A text frame always contains at least
         one paragraph.
         """
-        return tuple([_Paragraph(p, self) for p in self._txBody.p_lst])
+        return tuple([
+            cached_proxy(p, self, _Paragraph, self)
+            for p in self._txBody.p_lst
+        ])
 
     @property
     def text(self):
@@ -266,6 +273,9 @@ class Font(object):
     appears as ``<a:defRPr>`` and ``<a:endParaRPr>`` in paragraph and
     ``<a:defRPr>`` in list style elements.
     """
+
+    __slots__ = ('_element', '_rPr', '_color', '_fill')
+
     def __init__(self, rPr):
         super(Font, self).__init__()
         self._element = self._rPr = rPr
@@ -420,6 +430,9 @@ class _Hyperlink(Subshape):
     Text run hyperlink object. Corresponds to ``<a:hlinkClick>`` child
     element of the run's properties element (``<a:rPr>``).
     """
+
+    __slots__ = ('_rPr',)
+
     def __init__(self, rPr, parent):
         super(_Hyperlink, self).__init__(parent)
         self._rPr = rPr
@@ -460,6 +473,9 @@ class _Paragraph(Subshape):
     """
     Paragraph object. Not intended to be constructed directly.
     """
+
+    __slots__ = ('_element', '_p')
+
     def __init__(self, p, parent):
         super(_Paragraph, self).__init__(parent)
         self._element = self._p = p
@@ -469,7 +485,7 @@ class _Paragraph(Subshape):
         Return a new run appended to the runs in this paragraph.
         """
         r = self._p.add_r()
-        return _Run(r, self)
+        return cached_proxy(r, self, _Run, self)
 
     @property
     def alignment(self):
@@ -548,7 +564,9 @@ class _Paragraph(Subshape):
         Immutable sequence of |_Run| objects corresponding to the runs in
         this paragraph.
         """
-        return tuple(_Run(r, self) for r in self._element.r_lst)
+        return tuple(
+            cached_proxy(r, self, _Run, self) for r in self._element.r_lst
+        )
 
     @property
     def space_after(self):
@@ -633,6 +651,9 @@ class _Run(Subshape):
     """
     Text run object. Corresponds to ``<a:r>`` child element in a paragraph.
     """
+
+    __slots__ = ('_r', '_hyperlink')
+
     def __init__(self, r, parent):
         super(_Run, self).__init__(parent)
         self._r = r
@@ -39,9 +39,10 @@ AUTHOR = 'Steve Canny'
 AUTHOR_EMAIL = 'python-pptx@googlegroups.com'
 URL = 'http://github.com/scanny/python-pptx'
 LICENSE = license
-PACKAGES = find_packages(exclude=['tests', 'tests.*'])
+PACKAGES = find_packages(exclude=['benchmarks', 'tests', 'tests.*'])
 PACKAGE_DATA = {'pptx': ['templates/*']}
 
+ENTRY_POINTS = {'console_scripts': ['pptx-batch = pptx.batch:main']}
 INSTALL_REQUIRES = ['lxml>=3.1.0', 'Pillow>=2.6.1', 'XlsxWriter>=0.5.7']
 TEST_SUITE = 'tests'
 TESTS_REQUIRE = ['behave', 'mock', 'pyparsing>=2.0.1', 'pytest']
@@ -78,6 +79,7 @@ params = {
     'license':          LICENSE,
     'packages':         PACKAGES,
     'package_data':     PACKAGE_DATA,
+    'entry_points':     ENTRY_POINTS,
     'install_requires': INSTALL_REQUIRES,
     'tests_require':    TESTS_REQUIRE,
     'test_suite':       TEST_SUITE,
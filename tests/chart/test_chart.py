@@ -6,14 +6,19 @@ Test suite for pptx.chart.chart module
 
 from __future__ import absolute_import, print_function
 
+import zipfile
+
 import pytest
 
+from pptx.api import Presentation
+
 from pptx.chart.axis import CategoryAxis, DateAxis, ValueAxis
 from pptx.chart.chart import Chart, ChartTitle, Legend, _Plots
-from pptx.chart.data import ChartData
+from pptx.chart.data import ChartData, XyChartData
 from pptx.chart.plot import _BasePlot
 from pptx.chart.series import SeriesCollection
 from pptx.chart.xmlwriter import _BaseSeriesXmlRewriter
+from pptx.compat import BytesIO
 from pptx.dml.chtfmt import ChartFormat
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.parts.chart import ChartWorkbook
@@ -120,8 +125,85 @@ class DescribeChart(object):
         rewriter_.replace_series_data.assert_called_once_with(chartSpace)
         workbook_.update_from_xlsx_blob.assert_called_once_with(xlsx_blob)
 
+    def it_can_replace_the_chart_data_incrementally(self, incr_fixture):
+        (chart, chart_data_, rewriter_, chartSpace, workbook_,
+         update_cells_calls, update_blob_calls) = incr_fixture
+
+        chart.replace_data(chart_data_, incremental=True)
+
+        rewriter_.update_series_data.assert_called_once_with(chartSpace)
+        assert workbook_.update_cells.call_args_list == update_cells_calls
+        assert (
+            workbook_.update_from_xlsx_blob.call_args_list ==
+            update_blob_calls
+        )
+
+    def it_rewrites_the_full_resolution_worksheet_incrementally(self):
+        def chart_data(factor):
+            chart_data = XyChartData()
+            series = chart_data.add_series('Series 1')
+            for x in range(200):
+                series.add_data_point(x, x * factor % 17)
+            chart_data.downsample(20, keep_full_resolution=True)
+            return chart_data
+
+        def full_resolution_sheet(xlsx_blob):
+            with zipfile.ZipFile(BytesIO(xlsx_blob)) as zipf:
+                return zipf.read('xl/worksheets/sheet2.xml')
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chart = slide.shapes.add_chart(
+            XL_CHART_TYPE.XY_SCATTER_LINES, 0, 0, 100, 100, chart_data(1)
+        ).chart
+        new_chart_data = chart_data(3)
+
+        chart.replace_data(new_chart_data, incremental=True)
+
+        xlsx_blob = chart.part.chart_workbook.xlsx_part.blob
+        assert full_resolution_sheet(xlsx_blob) == (
+            full_resolution_sheet(new_chart_data.xlsx_blob)
+        )
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        # --- nothing changed, workbook is left alone ---
+        ([], True, True, False, False, None),
+        # --- changed series are patched into workbook ---
+        (['s1'], True, True, True, False, None),
+        # --- patch fails, workbook is regenerated ---
+        (['s1'], True, False, True, True, None),
+        # --- layout changed, workbook is regenerated ---
+        (['s1'], False, True, False, True, None),
+        ([], False, True, False, True, None),
+        # --- full resolution worksheet, workbook is regenerated ---
+        (['s1'], True, True, False, True, 'full'),
+        ([], True, True, False, True, 'full'),
+    ])
+    def incr_fixture(
+            self, request, chart_data_, SeriesXmlRewriterFactory_,
+            series_rewriter_, workbook_, workbook_prop_):
+        (changed, layout_unchanged, patched, update_cells, update_blob,
+         full_resolution_data) = request.param
+        chartSpace = element('c:chartSpace/c:chart/c:plotArea/c:pieChart')
+        chart = Chart(chartSpace, None)
+        series_rewriter_.update_series_data.return_value = (
+            changed, layout_unchanged
+        )
+        chart_data_.series_cells.side_effect = lambda s: [(0, 1, s)]
+        chart_data_.xlsx_blob = 'fooblob'
+        chart_data_.full_resolution_data = full_resolution_data
+        workbook_.update_cells.return_value = patched
+        update_cells_calls = (
+            [call([(0, 1, s) for s in changed])] if update_cells else []
+        )
+        update_blob_calls = [call('fooblob')] if update_blob else []
+        return (
+            chart, chart_data_, series_rewriter_, chartSpace, workbook_,
+            update_cells_calls, update_blob_calls
+        )
+
     @pytest.fixture(params=['c:catAx', 'c:dateAx', 'c:valAx'])
     def category_axis_fixture(self, request, CategoryAxis_, DateAxis_,
                               ValueAxis_):
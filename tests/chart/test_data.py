@@ -175,6 +175,49 @@ class DescribeCategoryChartData(object):
         assert categories_.add_category.call_args_list == calls
         assert chart_data._categories is categories_
 
+    def it_can_downsample_its_series(self):
+        chart_data = CategoryChartData(number_format='0.0')
+        chart_data.categories = ['c%d' % idx for idx in range(100)]
+        chart_data.add_series('S1', [float(idx % 7) for idx in range(100)])
+        chart_data.add_series('S2', [float(idx % 5) for idx in range(100)])
+
+        chart_data.downsample(10, keep_full_resolution=True)
+
+        categories = chart_data.categories
+        assert 10 <= len(categories) <= 20
+        assert categories[0].label == 'c0'
+        assert categories[-1].label == 'c99'
+        for series in chart_data:
+            assert len(series) == len(categories)
+            assert series.values == list(
+                float(int(c.label[1:]) % (7 if series.name == 'S1' else 5))
+                for c in categories
+            )
+        full_data = chart_data.full_resolution_data
+        assert len(full_data.categories) == 100
+        assert [len(s) for s in full_data] == [100, 100]
+        assert full_data.number_format == '0.0'
+
+    def it_leaves_short_series_alone_on_downsample(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ['a', 'b', 'c']
+        chart_data.add_series('S1', (1, 2, 3))
+
+        chart_data.downsample(3)
+
+        assert len(chart_data.categories) == 3
+        assert chart_data[0].values == [1, 2, 3]
+        assert chart_data.full_resolution_data is None
+
+    def it_cannot_downsample_multi_level_categories(self):
+        chart_data = CategoryChartData()
+        for name in ('a', 'b', 'c', 'd'):
+            category = chart_data.add_category(name)
+            category.add_sub_category(name + '1')
+        chart_data.add_series('S1', (1, 2, 3, 4))
+        with pytest.raises(ValueError):
+            chart_data.downsample(3)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -771,6 +814,24 @@ class DescribeXyChartData(object):
         assert chart_data[-1] is series_data_
         assert series_data is series_data_
 
+    def it_can_downsample_each_series(self):
+        chart_data = XyChartData()
+        long_series = chart_data.add_series('S1')
+        for idx in range(50):
+            long_series.add_data_point(idx, idx % 9)
+        short_series = chart_data.add_series('S2')
+        for idx in range(4):
+            short_series.add_data_point(idx, idx)
+
+        chart_data.downsample(8, method='min_max', keep_full_resolution=True)
+
+        assert len(long_series) == 8
+        assert long_series.x_values[0] == 0
+        assert len(short_series) == 4
+        full_data = chart_data.full_resolution_data
+        assert isinstance(full_data, XyChartData)
+        assert [len(s) for s in full_data] == [50, 4]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,108 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.chart.downsample module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import math
+
+import pytest
+
+from pptx.chart.downsample import (
+    LTTB, MIN_MAX, downsample_indices, lttb_indices, min_max_indices
+)
+
+
+class DescribeDownsampleIndices(object):
+
+    def it_keeps_every_point_when_under_the_limit(self):
+        assert downsample_indices([1, 2, 3], [4, 5, 6], 3) == [0, 1, 2]
+
+    def it_never_selects_a_point_having_no_value(self):
+        ys = [1.0, None, 3.0, None, 2.0, 8.0, None, 1.0, 4.0, 2.0]
+        xs = list(range(len(ys)))
+        indices = downsample_indices(xs, ys, 4)
+        assert len(indices) == 4
+        assert all(ys[idx] is not None for idx in indices)
+
+    def it_raises_on_an_unknown_method(self):
+        with pytest.raises(ValueError):
+            downsample_indices([1, 2, 3, 4], [1, 2, 3, 4], 3, 'foobar')
+
+    def it_raises_when_max_points_is_too_small(self):
+        with pytest.raises(ValueError):
+            downsample_indices([1, 2, 3, 4], [1, 2, 3, 4], 2)
+
+    def it_dispatches_on_method(self, method_fixture):
+        method, expected_value = method_fixture
+        ys = [0, 1, 0, 9, 0, 1, 0, 1]
+        xs = list(range(len(ys)))
+        assert downsample_indices(xs, ys, 4, method) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (LTTB, [0, 3, 4, 7]),
+        (MIN_MAX, [0, 3, 4, 5]),
+    ])
+    def method_fixture(self, request):
+        return request.param
+
+
+class DescribeLttbIndices(object):
+
+    def it_keeps_the_end_points_and_one_point_per_bucket(self):
+        ys = [math.sin(x / 10.0) for x in range(200)]
+        xs = list(range(200))
+        indices = lttb_indices(xs, ys, 20)
+        assert len(indices) == 20
+        assert indices[0] == 0
+        assert indices[-1] == 199
+        assert indices == sorted(set(indices))
+
+    def it_keeps_a_spike(self):
+        ys = [0.0] * 100
+        ys[42] = 100.0
+        indices = lttb_indices(list(range(100)), ys, 10)
+        assert 42 in indices
+
+    def it_selects_the_largest_triangle_in_each_bucket(self, with_numpy):
+        # buckets of candidates [1, 2], [3, 4, 5], and [6, 7, 8], each
+        # averaging the next: 1 then 4 then 8 span the largest triangles
+        ys = [0, 5, 1, 0, 8, 0, 1, 0, 6, 0]
+        xs = list(range(len(ys)))
+        assert lttb_indices(xs, ys, 5) == [0, 1, 4, 8, 9]
+
+
+class DescribeMinMaxIndices(object):
+
+    def it_keeps_the_low_and_high_point_of_each_bucket(self):
+        ys = [5, 1, 9, 5, 5, 0, 5, 7]
+        assert min_max_indices(ys, 4) == [1, 2, 5, 7]
+
+    def it_selects_the_first_low_and_high_point(self, with_numpy):
+        # buckets [3, 7, 2], [4, 4, 4], and [6, 1, 8]; a flat bucket
+        # contributes its first point once
+        ys = [3, 7, 2, 4, 4, 4, 6, 1, 8]
+        assert min_max_indices(ys, 6) == [1, 2, 3, 7, 8]
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture(params=[True, False])
+def with_numpy(request):
+    # each test runs once using numpy, when installed, and once without
+    import pptx.chart.downsample as downsample
+    if request.param:
+        if downsample.numpy is None:
+            pytest.skip('numpy not installed')
+        return
+    numpy = downsample.numpy
+
+    def restore():
+        downsample.numpy = numpy
+
+    downsample.numpy = None
+    request.addfinalizer(restore)
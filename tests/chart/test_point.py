@@ -14,6 +14,9 @@ from pptx.chart.datalabel import DataLabel
 from pptx.chart.marker import Marker
 from pptx.chart.point import BubblePoints, CategoryPoints, Point, XyPoints
 from pptx.dml.chtfmt import ChartFormat
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_MARKER_STYLE
+from pptx.enum.dml import MSO_THEME_COLOR
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import class_mock, instance_mock
@@ -37,8 +40,65 @@ class Describe_BasePoints(object):
         with pytest.raises(IndexError):
             points[3]
 
+    def it_can_format_many_points_at_once(self, format_points_fixture):
+        points, kwargs, expected_xml = format_points_fixture
+        points.format_points(**kwargs)
+        assert points._ser.xml == expected_xml
+
+    def it_can_label_many_points_at_once(self):
+        points = CategoryPoints(element(
+            'c:ser{a:b=c}/(c:dLbls/c:dLbl/(c:idx{val=2},c:showVal{val=1}),'
+            'c:cat/c:numRef/c:numCache/c:ptCount{val=4})'
+        ))
+        new_dLbl_tmpl = (
+            'c:dLbl/(c:idx{val=%d},c:tx/c:rich/(a:bodyPr,a:lstStyle,'
+            'a:p/a:r/a:t"%s"),c:showLegendKey{val=0},c:showVal{val=1},'
+            'c:showCatName{val=0},c:showSerName{val=0},c:showPercent{val=0},'
+            'c:showBubbleSize{val=0})'
+        )
+
+        points.format_points(labels={3: 'foo', 0: 'bar'})
+
+        assert points._ser.xml == xml(
+            'c:ser{a:b=c}/(c:dLbls/(%s,c:dLbl/(c:idx{val=2},'
+            'c:showVal{val=1}),%s),c:cat/c:numRef/c:numCache/'
+            'c:ptCount{val=4})' % (
+                new_dLbl_tmpl % (0, 'bar'), new_dLbl_tmpl % (3, 'foo')
+            )
+        )
+
+    def it_raises_on_format_points_index_out_of_range(self):
+        points = CategoryPoints(element(
+            'c:ser/c:cat/c:numRef/c:numCache/c:ptCount{val=3}'
+        ))
+        with pytest.raises(IndexError):
+            points.format_points(fills={3: RGBColor(1, 2, 3)})
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ({'fills': {2: RGBColor(0x12, 0x34, 0x56)}},
+         'c:ser{a:b=c}/(c:dPt/(c:idx{val=0},c:marker),c:dPt/(c:idx{val=2},c'
+         ':spPr/a:solidFill/a:srgbClr{val=123456}),c:cat/c:numRef/c:numCach'
+         'e/c:ptCount{val=4})'),
+        ({'fills': [None, MSO_THEME_COLOR.ACCENT_1]},
+         'c:ser{a:b=c}/(c:dPt/(c:idx{val=0},c:marker),c:dPt/(c:idx{val=1},c'
+         ':spPr/a:solidFill/a:schemeClr{val=accent1}),c:cat/c:numRef/c:numC'
+         'ache/c:ptCount{val=4})'),
+        ({'markers': {3: XL_MARKER_STYLE.CIRCLE, 1: XL_MARKER_STYLE.NONE}},
+         'c:ser{a:b=c}/(c:dPt/(c:idx{val=0},c:marker),c:dPt/(c:idx{val=1},c'
+         ':marker/c:symbol{val=none}),c:dPt/(c:idx{val=3},c:marker/c:symbol'
+         '{val=circle}),c:cat/c:numRef/c:numCache/c:ptCount{val=4})'),
+    ])
+    def format_points_fixture(self, request):
+        kwargs, expected_cxml = request.param
+        points = CategoryPoints(element(
+            'c:ser{a:b=c}/(c:dPt/(c:idx{val=0},c:marker),c:cat/c:numRef/c:nu'
+            'mCache/c:ptCount{val=4})'
+        ))
+        expected_xml = xml(expected_cxml)
+        return points, kwargs, expected_xml
+
     @pytest.fixture
     def getitem_fixture(self, request, Point_, point_):
         ser = element(
@@ -6,8 +6,11 @@ Test suite for pptx.chart.xlsx module
 
 from __future__ import absolute_import, print_function
 
+from zipfile import ZipFile
+
 import pytest
 
+from lxml import etree
 from xlsxwriter import Workbook
 from xlsxwriter.worksheet import Worksheet
 
@@ -17,7 +20,7 @@ from pptx.chart.data import (
 )
 from pptx.chart.xlsx import (
     _BaseWorkbookWriter, BubbleWorkbookWriter, CategoryWorkbookWriter,
-    XyWorkbookWriter
+    WorksheetCellPatcher, XyWorkbookWriter
 )
 from pptx.compat import BytesIO
 
@@ -53,6 +56,20 @@ class Describe_BaseWorkbookWriter(object):
         with pytest.raises(NotImplementedError):
             workbook_writer._populate_worksheet(None, None)
 
+    def it_writes_full_resolution_data_to_a_second_sheet(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = range(10)
+        chart_data.add_series('S1', range(10))
+        chart_data.downsample(4, keep_full_resolution=True)
+
+        xlsx_blob = CategoryWorkbookWriter(chart_data).xlsx_blob
+
+        zipf = ZipFile(BytesIO(xlsx_blob))
+        workbook_xml = zipf.read('xl/workbook.xml').decode('utf-8')
+        assert 'name="Full Resolution"' in workbook_xml
+        sheet2_xml = zipf.read('xl/worksheets/sheet2.xml').decode('utf-8')
+        assert 'r="B11"' in sheet2_xml
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -70,7 +87,10 @@ class Describe_BaseWorkbookWriter(object):
     def xlsx_blob_fixture(
             self, request, xlsx_file_, workbook_, worksheet_,
             _populate_worksheet_, _open_worksheet_, BytesIO_):
-        workbook_writer = _BaseWorkbookWriter(None)
+        chart_data_ = instance_mock(
+            request, CategoryChartData, full_resolution_data=None
+        )
+        workbook_writer = _BaseWorkbookWriter(chart_data_)
         xlsx_blob = 'fooblob'
         BytesIO_.return_value = xlsx_file_
         # to make context manager behavior work
@@ -102,7 +122,7 @@ class Describe_BaseWorkbookWriter(object):
     @pytest.fixture
     def Workbook_(self, request, workbook_):
         return class_mock(
-            request, 'pptx.chart.xlsx.Workbook', return_value=workbook_
+            request, 'xlsxwriter.Workbook', return_value=workbook_
         )
 
     @pytest.fixture
@@ -421,7 +441,10 @@ class DescribeXyWorkbookWriter(object):
     def xlsx_blob_fixture(
             self, request, xlsx_file_, BytesIO_, _open_worksheet_, workbook_,
             worksheet_, _populate_worksheet_, xlsx_blob_):
-        workbook_writer = XyWorkbookWriter(None)
+        chart_data_ = instance_mock(
+            request, XyChartData, full_resolution_data=None
+        )
+        workbook_writer = XyWorkbookWriter(chart_data_)
         return (
             workbook_writer, _open_worksheet_, xlsx_file_,
             _populate_worksheet_, workbook_, worksheet_, xlsx_blob_
@@ -467,3 +490,76 @@ class DescribeXyWorkbookWriter(object):
         xlsx_file_ = instance_mock(request, BytesIO)
         xlsx_file_.getvalue.return_value = xlsx_blob_
         return xlsx_file_
+
+
+class DescribeWorkbookSeriesCells(object):
+
+    def it_knows_the_cells_of_a_category_series(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ('a', 'b')
+        chart_data.add_series('S1', (1, 2))
+        series = chart_data.add_series('S2', (3, None))
+        cells = CategoryWorkbookWriter(chart_data).series_cells(series)
+        assert cells == [(0, 2, 'S2'), (1, 2, 3), (2, 2, None)]
+
+    def it_knows_the_cells_of_an_XY_series(self):
+        chart_data = XyChartData()
+        series = chart_data.add_series('S1')
+        series.add_data_point(1, 2)
+        series = chart_data.add_series('S2')
+        series.add_data_point(3, 4)
+        cells = XyWorkbookWriter(chart_data).series_cells(series)
+        assert cells == [(3, 1, 'S2'), (4, 0, 3), (4, 1, 4)]
+
+    def it_knows_the_cells_of_a_bubble_series(self):
+        chart_data = BubbleChartData()
+        series = chart_data.add_series('S1')
+        series.add_data_point(1, 2, 3)
+        cells = BubbleWorkbookWriter(chart_data).series_cells(series)
+        assert cells == [(0, 1, 'S1'), (1, 0, 1), (1, 1, 2), (1, 2, 3)]
+
+
+class DescribeWorksheetCellPatcher(object):
+
+    def it_overwrites_cells_in_an_existing_workbook(self, patch_fixture):
+        xlsx_blob, cells, expected_cells = patch_fixture
+        patcher = WorksheetCellPatcher(xlsx_blob)
+
+        new_blob = patcher.patched_blob(cells)
+
+        zipf = ZipFile(BytesIO(new_blob))
+        sheet = etree.fromstring(zipf.read('xl/worksheets/sheet1.xml'))
+        nsmap = WorksheetCellPatcher._nsmap
+        for ref, expected_text in expected_cells:
+            c = sheet.xpath('//s:c[@r="%s"]' % ref, namespaces=nsmap)[0]
+            assert c.xpath('string(.)') == expected_text
+        old_names = ZipFile(BytesIO(xlsx_blob)).namelist()
+        assert zipf.namelist() == old_names
+
+    def it_knows_a_cell_reference_from_its_offsets(self, ref_fixture):
+        row, col, expected_value = ref_fixture
+        assert WorksheetCellPatcher._cell_ref(row, col) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def patch_fixture(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ('a', 'b')
+        chart_data.add_series('S1', (1, 2))
+        xlsx_blob = chart_data.xlsx_blob
+        cells = [(0, 1, 'Foo'), (1, 1, 4.5), (2, 1, None), (3, 3, 7)]
+        expected_cells = [
+            ('B1', 'Foo'), ('B2', '4.5'), ('B3', ''), ('D4', '7'),
+            ('A2', '0'),
+        ]
+        return xlsx_blob, cells, expected_cells
+
+    @pytest.fixture(params=[
+        (0, 0, 'A1'),
+        (9, 25, 'Z10'),
+        (0, 26, 'AA1'),
+        (41, 730, 'ABC42'),
+    ])
+    def ref_fixture(self, request):
+        return request.param
@@ -6,6 +6,7 @@ Test suite for pptx.chart.xmlwriter module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from collections import OrderedDict
 from datetime import date
 from itertools import islice
 
@@ -16,7 +17,8 @@ from pptx.chart.data import (
     CategorySeriesData, XyChartData
 )
 from pptx.chart.xmlwriter import (
-    _AreaChartXmlWriter, _BarChartXmlWriter, _BaseSeriesXmlRewriter,
+    _AreaChartXmlWriter, _BarChartXmlWriter, _BaseChartXmlWriter,
+    _BaseSeriesXmlRewriter,
     _BubbleChartXmlWriter, _BubbleSeriesXmlRewriter, _BubbleSeriesXmlWriter,
     _CategorySeriesXmlRewriter, _CategorySeriesXmlWriter, ChartXmlWriter,
     _DoughnutChartXmlWriter, _LineChartXmlWriter, _PieChartXmlWriter,
@@ -90,6 +92,70 @@ class DescribeChartXmlWriter(object):
         return instance_mock(request, tuple)
 
 
+class Describe_BaseChartXmlWriter(object):
+
+    def it_builds_chartSpace_from_a_cached_skeleton(self, chartSpace_fixture):
+        xml_writer, expected_xml = chartSpace_fixture
+
+        chartSpace = xml_writer.chartSpace
+        chartSpace_2 = xml_writer.chartSpace
+
+        assert chartSpace.xml == expected_xml
+        assert chartSpace_2.xml == expected_xml
+        assert chartSpace_2 is not chartSpace
+        assert len(xml_writer._skeleton.xpath('.//c:ser')) == 0
+        assert xml_writer._skeleton is xml_writer._skeleton
+
+    def it_keeps_only_the_most_recently_used_skeletons(self, monkeypatch):
+        monkeypatch.setattr(_BaseChartXmlWriter, '_skeletons', OrderedDict())
+        monkeypatch.setattr(_BaseChartXmlWriter, '_max_skeletons', 2)
+        chart_data = CategoryChartData()
+        chart_data.categories = ('Foo', 'Bar')
+        chart_data.add_series('Series 1', (1, 2))
+        area, bar, line = (
+            ChartXmlWriter(chart_type, chart_data) for chart_type in (
+                XL_CHART_TYPE.AREA, XL_CHART_TYPE.BAR_CLUSTERED,
+                XL_CHART_TYPE.LINE
+            )
+        )
+        area_skeleton = area._skeleton
+        bar._skeleton
+        area._skeleton
+        line._skeleton
+
+        assert len(_BaseChartXmlWriter._skeletons) == 2
+        assert area._skeleton is area_skeleton
+        assert len(_BaseChartXmlWriter._skeletons) == 2
+        assert bar._chartSpace_xml('') not in _BaseChartXmlWriter._skeletons
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        'AREA', 'BAR_CLUSTERED', 'BUBBLE', 'DOUGHNUT', 'LINE_MARKERS',
+        'PIE', 'RADAR', 'XY_SCATTER',
+    ])
+    def chartSpace_fixture(self, request):
+        chart_type = getattr(XL_CHART_TYPE, request.param)
+        if request.param == 'BUBBLE':
+            chart_data = BubbleChartData()
+            series_data = chart_data.add_series('Series 1')
+            series_data.add_data_point(1, 2, 3)
+            series_data.add_data_point(4, 5, 6)
+        elif request.param == 'XY_SCATTER':
+            chart_data = XyChartData()
+            series_data = chart_data.add_series('Series 1')
+            series_data.add_data_point(1, 2)
+            series_data.add_data_point(4, 5)
+        else:
+            chart_data = CategoryChartData()
+            chart_data.categories = ('Foo', 'Bar')
+            chart_data.add_series('Series 1', (1, 2))
+            chart_data.add_series('Series 2', (3, 4))
+        xml_writer = ChartXmlWriter(chart_type, chart_data)
+        expected_xml = parse_xml(chart_data.xml_bytes(chart_type)).xml
+        return xml_writer, expected_xml
+
+
 class DescribeSeriesXmlRewriterFactory(object):
 
     def it_contructs_an_xml_rewriter_for_a_chart_type(self, call_fixture):
@@ -643,6 +709,52 @@ class Describe_CategorySeriesXmlRewriter(object):
         return rewriter, ser, series_data, expected_xml
 
 
+class DescribeSeriesXmlRewriterUpdate(object):
+
+    def it_rewrites_only_the_changed_series(self, update_fixture):
+        rewriter, chartSpace, expected_changed, expected_layout = (
+            update_fixture
+        )
+        vals_before = chartSpace.xpath('.//c:ser/c:val')
+
+        changed, layout_unchanged = rewriter.update_series_data(chartSpace)
+
+        assert [s.name for s in changed] == expected_changed
+        assert layout_unchanged is expected_layout
+        vals_after = chartSpace.xpath('.//c:ser/c:val')
+        assert [
+            before is after for before, after in zip(vals_before, vals_after)
+        ] == [name not in expected_changed for name in ('S1', 'S2')]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (('a', 'b'), (3, 4), [], True),
+        (('a', 'b'), (3, 5), ['S2'], True),
+        (('a', 'b'), (3, None), ['S2'], True),
+        (('a', 'b', 'c'), (3, 4, 5), ['S1', 'S2'], False),
+        (('a', 'x'), (3, 4), ['S1', 'S2'], False),
+    ])
+    def update_fixture(self, request):
+        categories, values, expected_changed, expected_layout = (
+            request.param
+        )
+        chart_data = CategoryChartData()
+        chart_data.categories = ('a', 'b')
+        chart_data.add_series('S1', (1, 2))
+        chart_data.add_series('S2', (3, 4))
+        chartSpace = parse_xml(
+            chart_data.xml_bytes(XL_CHART_TYPE.COLUMN_CLUSTERED)
+        )
+
+        new_chart_data = CategoryChartData()
+        new_chart_data.categories = categories
+        new_chart_data.add_series('S1', (1, 2, 3)[:len(categories)])
+        new_chart_data.add_series('S2', values)
+        rewriter = _CategorySeriesXmlRewriter(new_chart_data)
+        return rewriter, chartSpace, expected_changed, expected_layout
+
+
 class Describe_XySeriesXmlRewriter(object):
 
     def it_can_rewrite_a_ser_element(self, rewrite_fixture):
@@ -11,10 +11,12 @@ import pytest
 from pptx.opc.oxml import CT_Relationships
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
-    OpcPackage, Part, PartFactory, _Relationship, RelationshipCollection,
-    Unmarshaller, XmlPart
+    _DeferringPartFactory, _DeferredXml, OpcPackage, PackageTemplate, Part,
+    PartFactory, _Relationship, RelationshipCollection, _SharedXml,
+    _SpilledBlob, _SpillFile, Unmarshaller, XmlPart
 )
 from pptx.opc.pkgreader import PackageReader
+from pptx.oxml import parse_xml
 from pptx.oxml.xmlchemy import BaseOxmlElement
 from pptx.package import Package
 
@@ -40,6 +42,22 @@ class DescribeOpcPackage(object):
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
 
+    def it_can_open_a_pkg_file_deferring_some_parts(
+            self, request, PackageReader_, Unmarshaller_):
+        _DeferringPartFactory_ = class_mock(
+            request, 'pptx.opc.package._DeferringPartFactory'
+        )
+        pkg_reader = PackageReader_.from_file.return_value
+        deferred_ = Mock(name='deferred', return_value={'/foo.xml'})
+
+        pkg = OpcPackage.open('foo.pptx', deferred_)
+
+        deferred_.assert_called_once_with(pkg_reader)
+        _DeferringPartFactory_.assert_called_once_with({'/foo.xml'})
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, _DeferringPartFactory_.return_value
+        )
+
     def it_initializes_its_rels_collection_on_first_reference(
             self, RelationshipCollection_):
         pkg = OpcPackage()
@@ -95,6 +113,17 @@ class DescribeOpcPackage(object):
         assert isinstance(partname, PackURI)
         assert partname == expected_partname
 
+    def it_traverses_the_package_once_per_partname_template(
+            self, iter_parts_):
+        package = OpcPackage()
+        iter_parts_.return_value = iter([])
+        tmpl = '/foo/bar/baz%d.xml'
+
+        partnames = [package.next_partname(tmpl) for _ in range(3)]
+
+        assert partnames == [tmpl % 1, tmpl % 2, tmpl % 3]
+        assert iter_parts_.call_count == 1
+
     def it_can_save_to_a_pkg_file(
             self, pkg_file_, PackageWriter_, parts, parts_):
         pkg = OpcPackage()
@@ -108,6 +137,13 @@ class DescribeOpcPackage(object):
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
         pkg.after_unmarshal()
 
+    def it_creates_its_spill_file_on_first_use(self):
+        pkg = OpcPackage()
+        spill_file = pkg.spill_file
+        assert isinstance(spill_file, _SpillFile)
+        assert pkg.spill_file is spill_file
+        spill_file.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -323,8 +359,59 @@ class DescribePart(object):
         part.blob = new_blob
         assert part.blob == new_blob
 
+    def it_can_spill_its_blob(self, spill_fixture):
+        part, spill_file = spill_fixture
+
+        part.spill()
+
+        assert '_blob' not in part.__dict__
+        assert part.blob == b'blob'
+        assert part.blob == b'blob'
+        part.spill()
+        assert spill_file.read(0, 8) == b'blob'
+
+    def it_can_change_its_blob_after_spilling(self, spill_fixture):
+        part, _ = spill_fixture
+        part.spill()
+        part.blob = b'foobar'
+        assert part.blob == b'foobar'
+
+    def it_can_copy_itself(self):
+        blob = b'blob'
+        part = Part(PackURI('/foo'), 'content/type', blob, 'package')
+        part.load_rel('reltype', 'target', 'rId1')
+
+        copy = part.copy(PackURI('/bar'))
+
+        assert type(copy) is Part
+        assert copy.partname == '/bar'
+        assert copy.content_type == 'content/type'
+        assert copy.blob is blob
+        assert copy.package == 'package'
+        assert len(copy.rels) == 0
+
+    def it_shares_its_spilled_blob_with_a_copy(self, spill_fixture):
+        part, _ = spill_fixture
+        part.spill()
+
+        copy = part.copy('/bar')
+
+        assert '_blob' not in copy.__dict__
+        assert copy.blob == b'blob'
+
+    def it_raises_on_access_to_an_unknown_attribute(self, part):
+        with pytest.raises(AttributeError):
+            part.foobar
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def spill_fixture(self, request):
+        package = OpcPackage()
+        request.addfinalizer(package.spill_file.close)
+        part = Part(None, None, b'blob', package)
+        return part, package.spill_file
+
     @pytest.fixture
     def blob_fixture(self, blob_):
         part = Part(None, None, blob_, None)
@@ -570,6 +657,79 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_can_be_loaded_with_a_shared_element_tree(self):
+        shared_xml = _SharedXml(b'<foo><bar/></foo>')
+        xml_part = XmlPart.load_shared(None, None, shared_xml, None)
+
+        assert xml_part.blob is shared_xml.blob
+        element = xml_part._element
+        assert element.tag == 'foo'
+        assert element is not shared_xml.element
+        assert xml_part._element is element
+
+        element.remove(element[0])
+        assert xml_part.blob.endswith(b'<foo/>')
+        assert len(shared_xml.element) == 1
+
+    def it_raises_on_access_to_an_unknown_attribute(self, part_fixture):
+        xml_part = part_fixture
+        with pytest.raises(AttributeError):
+            xml_part.foobar
+
+    def it_can_spill_its_xml(self, request):
+        package = OpcPackage()
+        request.addfinalizer(package.spill_file.close)
+        xml_part = XmlPart(
+            None, None, parse_xml(b'<foo><bar/></foo>'), package
+        )
+        blob = xml_part.blob
+
+        xml_part.spill()
+
+        assert '_element' not in xml_part.__dict__
+        assert xml_part.blob == blob
+        element_ = xml_part._element
+        assert element_.tag == 'foo'
+        assert xml_part._element is element_
+        element_.remove(element_[0])
+        assert xml_part.blob.endswith(b'<foo/>')
+
+    def it_can_be_loaded_with_its_parsing_deferred(self):
+        blob = b'<foo><bar/></foo>'
+        xml_part = XmlPart.load_deferred(None, None, blob, None)
+
+        assert xml_part.blob is blob
+        element_ = xml_part._element
+        assert element_.tag == 'foo'
+        assert xml_part._element is element_
+        assert '_xml_source' not in xml_part.__dict__
+
+    def it_can_copy_itself(self):
+        xml_part = XmlPart('/foo', 'content/type', parse_xml(b'<foo/>'), None)
+
+        copy = xml_part.copy('/bar')
+
+        assert type(copy) is XmlPart
+        assert copy.partname == '/bar'
+        assert copy.content_type == 'content/type'
+        assert copy._element is not xml_part._element
+        assert copy.blob == xml_part.blob
+
+    def it_shares_its_xml_source_with_a_copy(self):
+        shared_xml = _SharedXml(b'<foo/>')
+        xml_part = XmlPart.load_shared(None, None, shared_xml, None)
+
+        copy = xml_part.copy('/bar')
+
+        assert copy._xml_source is shared_xml
+        assert copy._element is not xml_part._element
+
+    def it_does_not_spill_xml_it_does_not_own(self):
+        shared_xml = _SharedXml(b'<foo/>')
+        xml_part = XmlPart.load_shared(None, None, shared_xml, None)
+        xml_part.spill()
+        assert xml_part.blob is shared_xml.blob
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -629,6 +789,129 @@ class DescribeXmlPart(object):
         )
 
 
+class DescribePackageTemplate(object):
+
+    def it_can_open_a_pkg_file(self, request):
+        PackageReader_ = class_mock(request, 'pptx.opc.package.PackageReader')
+        pkg_reader_ = PackageReader_.from_file.return_value
+
+        template = PackageTemplate.open('foo.pptx')
+
+        PackageReader_.from_file.assert_called_once_with('foo.pptx')
+        assert isinstance(template, PackageTemplate)
+        assert template._pkg_reader is pkg_reader_
+
+    def it_can_fork_a_package(self, request):
+        unmarshal_ = method_mock(request, Unmarshaller, 'unmarshal')
+        pkg_reader_ = instance_mock(request, PackageReader)
+        template = PackageTemplate(pkg_reader_)
+
+        package = template.fork(Package)
+
+        unmarshal_.assert_called_once_with(
+            pkg_reader_, package, template._load_part
+        )
+        assert isinstance(package, Package)
+
+    def it_shares_the_xml_of_each_part_between_forks(self, request):
+        load_shared_ = method_mock(request, XmlPart, 'load_shared')
+        part_cls_for_ = method_mock(request, PartFactory, '_part_cls_for')
+        part_cls_for_.return_value = XmlPart
+        template = PackageTemplate(None)
+        partname = PackURI('/foo.xml')
+
+        template._load_part(partname, 'ct', b'<foo/>', 'pkg_1')
+        template._load_part(partname, 'ct', b'<foo/>', 'pkg_2')
+
+        shared_xml = template._shared_xml[partname]
+        assert shared_xml.blob == b'<foo/>'
+        assert load_shared_.call_args_list == [
+            call(partname, 'ct', shared_xml, 'pkg_1'),
+            call(partname, 'ct', shared_xml, 'pkg_2'),
+        ]
+
+    def it_loads_a_binary_part_as_usual(self, request):
+        load_ = method_mock(request, Part, 'load')
+        part_cls_for_ = method_mock(request, PartFactory, '_part_cls_for')
+        part_cls_for_.return_value = Part
+        template = PackageTemplate(None)
+
+        part = template._load_part('/foo.png', 'ct', b'blob', 'pkg')
+
+        load_.assert_called_once_with('/foo.png', 'ct', b'blob', 'pkg')
+        assert part is load_.return_value
+        assert template._shared_xml == {}
+
+
+class Describe_DeferringPartFactory(object):
+
+    def it_defers_parsing_the_xml_parts_it_is_given(self, request):
+        part_cls_for_ = method_mock(request, PartFactory, '_part_cls_for')
+        part_cls_for_.return_value = XmlPart
+        load_deferred_ = method_mock(request, XmlPart, 'load_deferred')
+        part_factory = _DeferringPartFactory({'/foo.xml'})
+
+        part = part_factory('/foo.xml', 'ct', b'<foo/>', 'pkg')
+
+        part_cls_for_.assert_called_once_with('ct')
+        load_deferred_.assert_called_once_with(
+            '/foo.xml', 'ct', b'<foo/>', 'pkg'
+        )
+        assert part is load_deferred_.return_value
+
+    def it_loads_other_parts_as_usual(self, request):
+        part_cls_for_ = method_mock(request, PartFactory, '_part_cls_for')
+        xml_part_load_ = method_mock(request, XmlPart, 'load')
+        load_ = method_mock(request, Part, 'load')
+        part_cls_for_.side_effect = [XmlPart, Part]
+        part_factory = _DeferringPartFactory({'/foo.png'})
+
+        xml_part = part_factory('/bar.xml', 'ct', b'<bar/>', 'pkg')
+        part = part_factory('/foo.png', 'ct', b'png', 'pkg')
+
+        xml_part_load_.assert_called_once_with(
+            '/bar.xml', 'ct', b'<bar/>', 'pkg'
+        )
+        load_.assert_called_once_with('/foo.png', 'ct', b'png', 'pkg')
+        assert xml_part is xml_part_load_.return_value
+        assert part is load_.return_value
+
+
+class Describe_DeferredXml(object):
+
+    def it_can_parse_its_element(self):
+        deferred_xml = _DeferredXml(b'<foo><bar/></foo>')
+        assert deferred_xml.copy_element().tag == 'foo'
+
+
+class Describe_SpillFile(object):
+
+    def it_can_append_and_read_back_blobs(self, request):
+        spill_file = _SpillFile()
+        request.addfinalizer(spill_file.close)
+
+        foo = spill_file.append(b'foo')
+        barbaz = spill_file.append(b'barbaz')
+
+        assert isinstance(foo, _SpilledBlob)
+        assert barbaz.blob == b'barbaz'
+        assert foo.blob == b'foo'
+        assert spill_file.read(1, 4) == b'ooba'
+
+
+class Describe_SpilledBlob(object):
+
+    def it_can_parse_a_new_copy_of_its_element(self, request):
+        spill_file = _SpillFile()
+        request.addfinalizer(spill_file.close)
+        spilled_blob = spill_file.append(b'<foo><bar/></foo>')
+
+        element_ = spilled_blob.copy_element()
+
+        assert element_.tag == 'foo'
+        assert spilled_blob.copy_element() is not element_
+
+
 class DescribePartFactory(object):
 
     def it_constructs_custom_part_type_for_registered_content_types(
@@ -775,6 +1058,25 @@ class DescribeRelationshipCollection(object):
         assert _rId == rId
         assert len(rels) == 1
 
+    def it_can_remove_a_relationship(self):
+        rels = RelationshipCollection('/baseURI')
+        part = Mock(name='part')
+        rels.add_relationship('http://rt-image', part, 'rId1')
+        del rels['rId1']
+        assert 'rId1' not in rels
+        assert 'rId1' not in rels.related_parts
+        assert rels.get_or_add('http://rt-image', part).rId == 'rId1'
+
+    def it_fills_gaps_in_rId_numbering(self):
+        rels = RelationshipCollection('/baseURI')
+        for n in range(1, 5):
+            rels.add_relationship('http://rt-image', Mock(), 'rId%d' % n)
+        assert rels._next_rId == 'rId5'
+        del rels['rId2']
+        assert rels._next_rId == 'rId2'
+        rels.get_or_add('http://rt-image', Mock())
+        assert rels._next_rId == 'rId5'
+
     def it_can_compose_rels_xml(self, rels, rels_elm):
         # exercise ---------------------
         rels.xml
@@ -19,7 +19,8 @@ from zipfile import ZIP_DEFLATED, ZipFile
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _DirPkgReader, _ForwardOnlyStream, _is_seekable, PhysPkgReader,
+    PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
@@ -174,6 +175,19 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_write_to_a_sink_that_cannot_seek(self, sink):
+        blobs = [b'<foo/>', b'<bar>' + b'x' * 5000 + b'</bar>']
+        pkg_writer = PhysPkgWriter(sink)
+        pkg_writer.write(PackURI('/foo.xml'), blobs[0])
+        assert b'foo.xml' in sink.getvalue()
+        assert sink.flush_count == 1
+        pkg_writer.write(PackURI('/bar.xml'), blobs[1])
+        pkg_writer.close()
+
+        zipf = ZipFile(BytesIO(sink.getvalue()), 'r')
+        assert [i.flag_bits & 0x08 for i in zipf.infolist()] == [8, 8]
+        assert [zipf.read(n) for n in ('foo.xml', 'bar.xml')] == blobs
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -182,9 +196,81 @@ class DescribeZipPkgWriter(object):
         request.addfinalizer(pkg_file.close)
         return pkg_file
 
+    @pytest.fixture
+    def sink(self):
+        return _WriteOnlySink()
+
+
+class DescribeForwardOnlyStream(object):
+
+    def it_writes_through_to_its_sink(self):
+        sink = _WriteOnlySink()
+        stream = _ForwardOnlyStream(sink)
+        stream.write(b'abc')
+        stream.write(b'de')
+        assert sink.getvalue() == b'abcde'
+
+    def it_knows_its_position(self):
+        stream = _ForwardOnlyStream(_WriteOnlySink())
+        assert stream.tell() == 0
+        stream.write(b'abc')
+        assert stream.tell() == 3
+
+    def it_flushes_its_sink_when_the_sink_can_flush(self):
+        sink = _WriteOnlySink()
+        _ForwardOnlyStream(sink).flush()
+        _ForwardOnlyStream(object()).flush()
+        assert sink.flush_count == 1
+
+    def it_cannot_seek(self):
+        assert not hasattr(_ForwardOnlyStream(None), 'seek')
+
+
+class Describe_is_seekable(object):
+
+    def it_knows_whether_a_stream_can_seek(self, seekable_fixture):
+        stream, expected_value = seekable_fixture
+        assert _is_seekable(stream) is expected_value
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        ('bytes_io', True),
+        ('seek_tell', True),
+        ('not_seekable', False),
+        ('write_only', False),
+    ])
+    def seekable_fixture(self, request):
+        kind, expected_value = request.param
+        stream = {
+            'bytes_io': BytesIO(),
+            'seek_tell': Mock(spec=['seek', 'tell', 'write']),
+            'not_seekable': Mock(seekable=Mock(return_value=False)),
+            'write_only': _WriteOnlySink(),
+        }[kind]
+        return stream, expected_value
+
 
 # fixtures -------------------------------------------------
 
+class _WriteOnlySink(object):
+    """
+    Stand-in for a forward-only sink such as a pipe or an HTTP response.
+    """
+    def __init__(self):
+        self._chunks = []
+        self.flush_count = 0
+
+    def flush(self):
+        self.flush_count += 1
+
+    def getvalue(self):
+        return b''.join(self._chunks)
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+
+
 @pytest.fixture
 def tmp_pptx_path(tmpdir):
     return str(tmpdir.join('test_python-pptx.pptx'))
@@ -12,7 +12,7 @@ from pptx.chart.chart import Chart
 from pptx.chart.data import ChartData
 from pptx.enum.base import EnumValue
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
-from pptx.opc.package import OpcPackage
+from pptx.opc.package import OpcPackage, XmlPart
 from pptx.opc.packuri import PackURI
 from pptx.oxml.chart.chart import CT_ChartSpace
 from pptx.parts.chart import ChartPart, ChartWorkbook
@@ -28,21 +28,21 @@ class DescribeChartPart(object):
 
     def it_can_construct_from_chart_type_and_data(self, new_fixture):
         chart_type_, chart_data_, package_ = new_fixture[:3]
-        partname_template, load_, partname_ = new_fixture[3:6]
-        content_type, chart_blob_, chart_part_, xlsx_blob_ = new_fixture[6:]
+        partname_template, partname_, content_type = new_fixture[3:6]
+        chartSpace_, chart_workbook_, xlsx_blob_ = new_fixture[6:]
 
         chart_part = ChartPart.new(chart_type_, chart_data_, package_)
 
-        chart_data_.xml_bytes.assert_called_once_with(chart_type_)
+        chart_data_.new_chartSpace.assert_called_once_with(chart_type_)
         package_.next_partname.assert_called_once_with(partname_template)
-        load_.assert_called_once_with(
-            partname_, content_type, chart_blob_, package_
-        )
-        chart_workbook_ = chart_part_.chart_workbook
+        assert isinstance(chart_part, ChartPart)
+        assert chart_part.partname is partname_
+        assert chart_part.content_type == content_type
+        assert chart_part._element is chartSpace_
+        assert chart_part.package is package_
         chart_workbook_.update_from_xlsx_blob.assert_called_once_with(
             xlsx_blob_
         )
-        assert chart_part is chart_part_
 
     def it_provides_access_to_the_chart_object(self, chart_fixture):
         chart_part, chart_, Chart_ = chart_fixture
@@ -58,6 +58,18 @@ class DescribeChartPart(object):
         ChartWorkbook_.assert_called_once_with(chartSpace_, chart_part)
         assert chart_workbook is chart_workbook_
 
+    def it_releases_its_proxies_when_spilled(self, request):
+        spill_ = method_mock(request, XmlPart, 'spill')
+        chart_part = ChartPart(None, None, None, None)
+        chart_part._chart = 'chart'
+        chart_part._chart_workbook = 'chart_workbook'
+
+        chart_part.spill()
+
+        spill_.assert_called_once_with()
+        assert '_chart' not in chart_part.__dict__
+        assert '_chart_workbook' not in chart_part.__dict__
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -67,13 +79,13 @@ class DescribeChartPart(object):
 
     @pytest.fixture
     def new_fixture(
-            self, chart_type_, chart_data_, package_, load_, partname_,
-            chart_blob_, chart_part_, xlsx_blob_):
+            self, chart_type_, chart_data_, package_, partname_, chartSpace_,
+            ChartWorkbook_, chart_workbook_, xlsx_blob_):
         partname_template = '/ppt/charts/chart%d.xml'
         content_type = CT.DML_CHART
         return (
-            chart_type_, chart_data_, package_, partname_template, load_,
-            partname_, content_type, chart_blob_, chart_part_, xlsx_blob_
+            chart_type_, chart_data_, package_, partname_template, partname_,
+            content_type, chartSpace_, chart_workbook_, xlsx_blob_
         )
 
     @pytest.fixture
@@ -93,7 +105,7 @@ class DescribeChartPart(object):
     @pytest.fixture
     def Chart_(self, request, chart_):
         return class_mock(
-            request, 'pptx.parts.chart.Chart', return_value=chart_
+            request, 'pptx.chart.chart.Chart', return_value=chart_
         )
 
     @pytest.fixture
@@ -105,22 +117,12 @@ class DescribeChartPart(object):
         return instance_mock(request, Chart)
 
     @pytest.fixture
-    def chart_blob_(self, request):
-        return instance_mock(request, bytes)
-
-    @pytest.fixture
-    def chart_data_(self, request, chart_blob_, xlsx_blob_):
+    def chart_data_(self, request, chartSpace_, xlsx_blob_):
         chart_data_ = instance_mock(request, ChartData)
-        chart_data_.xml_bytes.return_value = chart_blob_
+        chart_data_.new_chartSpace.return_value = chartSpace_
         chart_data_.xlsx_blob = xlsx_blob_
         return chart_data_
 
-    @pytest.fixture
-    def chart_part_(self, request, chart_workbook_):
-        chart_part_ = instance_mock(request, ChartPart)
-        chart_part_.chart_workbook = chart_workbook_
-        return chart_part_
-
     @pytest.fixture
     def chart_type_(self, request):
         return instance_mock(request, EnumValue)
@@ -129,12 +131,6 @@ class DescribeChartPart(object):
     def chart_workbook_(self, request):
         return instance_mock(request, ChartWorkbook)
 
-    @pytest.fixture
-    def load_(self, request, chart_part_):
-        return method_mock(
-            request, ChartPart, 'load', return_value=chart_part_
-        )
-
     @pytest.fixture
     def package_(self, request, partname_):
         package_ = instance_mock(request, OpcPackage)
@@ -178,8 +174,43 @@ class DescribeChartWorkbook(object):
         chart_data.update_from_xlsx_blob(xlsx_blob_)
         assert chart_data.xlsx_part.blob is xlsx_blob_
 
+    def it_can_update_cells_of_the_workbook(self, update_cells_fixture):
+        chart_data, cells, WorksheetCellPatcher_, patcher_ = (
+            update_cells_fixture[:4]
+        )
+        xlsx_part_, expected_value, expected_blob = update_cells_fixture[4:]
+
+        result = chart_data.update_cells(cells)
+
+        assert result is expected_value
+        if xlsx_part_ is not None:
+            patcher_.patched_blob.assert_called_once_with(cells)
+        assert getattr(xlsx_part_, 'blob', None) == expected_blob
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        (True, b'new', True, b'new'),
+        (True, None, False, b'old'),
+        (False, None, False, None),
+    ])
+    def update_cells_fixture(self, request, xlsx_part_, xlsx_part_prop_):
+        has_part, new_blob, expected_value, expected_blob = request.param
+        chart_data = ChartWorkbook(None, None)
+        cells = [(0, 1, 'foo')]
+        xlsx_part_.blob = b'old'
+        xlsx_part_prop_.return_value = xlsx_part_ if has_part else None
+        WorksheetCellPatcher_ = class_mock(
+            request, 'pptx.parts.chart.WorksheetCellPatcher'
+        )
+        patcher_ = WorksheetCellPatcher_.return_value
+        patcher_.patched_blob.return_value = new_blob
+        xlsx_part = xlsx_part_ if has_part else None
+        return (
+            chart_data, cells, WorksheetCellPatcher_, patcher_, xlsx_part,
+            expected_value, expected_blob
+        )
+
     @pytest.fixture
     def add_part_fixture(
             self, request, chart_part_, xlsx_blob_, EmbeddedXlsxPart_,
@@ -8,6 +8,8 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+import pptx
+
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.packuri import PackURI
 from pptx.package import Package
@@ -110,6 +112,46 @@ class DescribePresentationPart(object):
         assert rId is rId_
         assert slide is slide_
 
+    def it_can_duplicate_a_slide(
+            self, request, slide_, slide_part_, _next_slide_partname_prop_,
+            relate_to_):
+        prs_part = PresentationPart(None, None, None, None)
+        partname = _next_slide_partname_prop_.return_value
+        new_slide_part_ = instance_mock(request, SlidePart)
+        slide_.part = slide_part_
+        slide_part_.duplicate.return_value = new_slide_part_
+        relate_to_.return_value = 'rId42'
+
+        rId, slide = prs_part.duplicate_slide(slide_)
+
+        slide_part_.duplicate.assert_called_once_with(partname)
+        prs_part.relate_to.assert_called_once_with(
+            prs_part, new_slide_part_, RT.SLIDE
+        )
+        assert rId == 'rId42'
+        assert slide is new_slide_part_.slide
+
+    def it_can_import_a_slide(
+            self, request, package_, slide_, slide_part_, slide_layout_,
+            _next_slide_partname_prop_, relate_to_):
+        prs_part = PresentationPart(None, None, None, package_)
+        partname = _next_slide_partname_prop_.return_value
+        new_slide_part_ = instance_mock(request, SlidePart)
+        slide_.part = slide_part_
+        slide_part_.copy_into.return_value = new_slide_part_
+        relate_to_.return_value = 'rId42'
+
+        rId, slide = prs_part.import_slide(slide_, slide_layout_)
+
+        slide_part_.copy_into.assert_called_once_with(
+            package_, partname, slide_layout_.part
+        )
+        prs_part.relate_to.assert_called_once_with(
+            prs_part, new_slide_part_, RT.SLIDE
+        )
+        assert rId == 'rId42'
+        assert slide is new_slide_part_.slide
+
     def it_finds_the_slide_id_of_a_slide_part(self, slide_id_fixture):
         prs_part, slide_part_, expected_value = slide_id_fixture
         _slide_id = prs_part.slide_id(slide_part_)
@@ -125,6 +167,32 @@ class DescribePresentationPart(object):
         slide = prs_part.get_slide(slide_id)
         assert slide == expected_value
 
+    def it_can_add_a_slide_id_for_a_slide(self, related_parts_prop_):
+        prs_elm = element(
+            'p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id='
+            'b,id=300})'
+        )
+        prs_part = PresentationPart(None, None, prs_elm)
+        related_parts_prop_.return_value = {'a': 1, 'b': 2, 'c': 3}
+
+        sldId = prs_part.add_sldId('c')
+
+        assert prs_elm.sldIdLst[-1] is sldId
+        assert (sldId.rId, sldId.id) == ('c', 301)
+        assert prs_part.slide_id(3) == 301
+
+    def it_finds_the_position_of_a_slide_part(self, related_parts_prop_):
+        prs_elm = element(
+            'p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id='
+            'b,id=257},p:sldId{r:id=c,id=258})'
+        )
+        prs_part = PresentationPart(None, None, prs_elm)
+        related_parts_prop_.return_value = {'a': 1, 'b': 2, 'c': 3}
+
+        assert prs_part.slide_idx(3) == 2
+        with pytest.raises(ValueError):
+            prs_part.slide_idx(4)
+
     def it_knows_the_next_slide_partname_to_help(self, next_fixture):
         prs_part, partname = next_fixture
         assert prs_part._next_slide_partname == partname
@@ -348,3 +416,48 @@ class DescribePresentationPart(object):
     @pytest.fixture
     def SlidePart_(self, request):
         return class_mock(request, 'pptx.parts.presentation.SlidePart')
+
+
+class Describe_SlideIdIndex(object):
+
+    def it_finds_slides_added_through_the_presentation(self, prs):
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(3)]
+        prs_part = prs.part
+
+        assert [prs_part.slide_idx(s.part) for s in slides] == [0, 1, 2]
+        assert [prs_part.get_slide(s.slide_id) for s in slides] == slides
+        assert [s.slide_id for s in slides] == [256, 257, 258]
+
+    def it_accounts_for_slides_moved_in_the_xml(self, prs):
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(3)]
+        sldIdLst = prs.part._element.sldIdLst
+        sldIdLst.append(sldIdLst[0])
+
+        assert [prs.slides.index(s) for s in slides] == [2, 0, 1]
+        assert prs.part.get_slide(256) == slides[0]
+
+    def it_accounts_for_slides_removed_in_the_xml(self, prs):
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(3)]
+        sldIdLst = prs.part._element.sldIdLst
+        sldIdLst.remove(sldIdLst[2])
+
+        assert prs.part.get_slide(258) is None
+        with pytest.raises(ValueError):
+            prs.slides.index(slides[2])
+        assert prs.slides.add_slide(prs.slide_layouts[6]).slide_id == 258
+
+    def it_accounts_for_slides_added_in_the_xml(self, prs):
+        slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(2)]
+        sldIdLst = prs.part._element.sldIdLst
+        rId = sldIdLst[1].rId
+        sldIdLst.remove(sldIdLst[1])
+        sldIdLst.add_sldId(rId, 300)
+
+        assert prs.part.get_slide(300) == slides[1]
+        assert prs.slides.add_slide(prs.slide_layouts[6]).slide_id == 301
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def prs(self):
+        return pptx.Presentation()
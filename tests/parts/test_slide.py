@@ -14,7 +14,7 @@ from pptx.chart.data import ChartData
 from pptx.enum.base import EnumValue
 from pptx.media import Video
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part
+from pptx.opc.package import Part, XmlPart
 from pptx.opc.packuri import PackURI
 from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
@@ -24,8 +24,8 @@ from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import (
-    BaseSlidePart, NotesMasterPart, NotesSlidePart, SlideLayoutPart,
-    SlideMasterPart, SlidePart
+    _remove_rId_references, BaseSlidePart, NotesMasterPart, NotesSlidePart,
+    SlideLayoutPart, SlideMasterPart, SlidePart
 )
 from pptx.slide import (
     NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
@@ -299,6 +299,16 @@ class DescribeNotesSlidePart(object):
         NotesSlide_.assert_called_once_with(notes, notes_slide_part)
         assert notes_slide is notes_slide_
 
+    def it_releases_its_notes_slide_when_spilled(self, request):
+        spill_ = method_mock(request, XmlPart, 'spill')
+        notes_slide_part = NotesSlidePart(None, None, None, None)
+        notes_slide_part._notes_slide = 'notes_slide'
+
+        notes_slide_part.spill()
+
+        spill_.assert_called_once_with()
+        assert '_notes_slide' not in notes_slide_part.__dict__
+
     def it_adds_a_notes_slide_part_to_help(self, add_fixture):
         package_, slide_part_, notes_master_part_ = add_fixture[:3]
         notes_slide_part_, NotesSlidePart_, partname = add_fixture[3:6]
@@ -521,6 +531,87 @@ class DescribeSlidePart(object):
             notes_slide_part, RT.NOTES_SLIDE
         )
 
+    def it_can_seal_itself(self, request):
+        parts_ = [instance_mock(request, Part) for _ in range(3)]
+        method_mock(
+            request, SlidePart, '_iter_owned_parts', return_value=parts_
+        )
+        slide_part = SlidePart(None, None, None, None)
+
+        slide_part.seal()
+
+        for part_ in parts_:
+            part_.spill.assert_called_once_with()
+
+    def it_can_copy_itself_into_another_package(self, copy_into_fixture):
+        slide_part, package, layout_part, image_part = copy_into_fixture[:4]
+        notes_master_part, existing_image_part = copy_into_fixture[4:]
+
+        copy = slide_part.copy_into(
+            package, PackURI('/ppt/slides/slide1.xml'), layout_part
+        )
+
+        assert copy.package is package
+        assert copy.partname == '/ppt/slides/slide1.xml'
+        assert copy.rels['rId1'].target_part is layout_part
+        assert copy.rels['rId2'].target_part is existing_image_part
+        new_image_part = copy.rels['rId3'].target_part
+        assert new_image_part.package is package
+        assert new_image_part.partname == '/ppt/media/image2.png'
+        assert new_image_part.blob is image_part.blob
+        assert 'rId4' not in copy.rels
+        assert copy._element.xpath('//a:hlinkClick') == []
+        notes_copy = copy.rels['rId5'].target_part
+        assert notes_copy.package is package
+        assert notes_copy.part_related_by(RT.NOTES_MASTER) is (
+            notes_master_part
+        )
+        assert notes_copy.part_related_by(RT.SLIDE) is copy
+
+    def it_can_duplicate_itself(self, duplicate_fixture):
+        slide_part, parts = duplicate_fixture
+        notes_part, chart_part, xlsx_part, image_part, layout_part = parts
+
+        copy = slide_part.duplicate(PackURI('/ppt/slides/slide2.xml'))
+
+        assert type(copy) is SlidePart
+        assert copy.partname == '/ppt/slides/slide2.xml'
+        assert copy._element is not slide_part._element
+        assert copy._element.xml == slide_part._element.xml
+        assert sorted(copy.rels) == sorted(slide_part.rels)
+        assert copy.rels['rId1'].target_part is layout_part
+        assert copy.rels['rId3'].target_part is image_part
+        assert copy.rels['rId4'].target_ref == 'http://foo'
+
+        notes_copy = copy.rels['rId2'].target_part
+        assert type(notes_copy) is NotesSlidePart
+        assert notes_copy.partname == '/ppt/notesSlides/notesSlide2.xml'
+        assert notes_copy.part_related_by(RT.SLIDE) is copy
+
+        chart_copy = copy.rels['rId5'].target_part
+        assert chart_copy.partname == '/ppt/charts/chart2.xml'
+        xlsx_copy = chart_copy.part_related_by(RT.PACKAGE)
+        assert xlsx_copy is not xlsx_part
+        assert xlsx_copy.partname == '/ppt/embeddings/sheet2.xlsx'
+        assert xlsx_copy.blob is xlsx_part.blob
+
+    def it_knows_which_parts_it_owns(self, owned_parts_fixture):
+        slide_part, expected_parts = owned_parts_fixture
+        parts = list(slide_part._iter_owned_parts())
+        assert parts[0] is slide_part
+        assert sorted(parts, key=id) == sorted(expected_parts, key=id)
+
+    def it_releases_its_proxies_when_spilled(self, request):
+        spill_ = method_mock(request, XmlPart, 'spill')
+        slide_part = SlidePart(None, None, None, None)
+        slide_part._slide, slide_part._notes_slide = 'slide', 'notes_slide'
+
+        slide_part.spill()
+
+        spill_.assert_called_once_with()
+        assert '_slide' not in slide_part.__dict__
+        assert '_notes_slide' not in slide_part.__dict__
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -535,6 +626,125 @@ class DescribeSlidePart(object):
             package_, rId
         )
 
+    @pytest.fixture
+    def copy_into_fixture(self, request):
+        source_package, package = Package(), Package()
+
+        def part(cls, name, content, package=source_package):
+            return cls(PackURI('/ppt/%s' % name), None, content, package)
+
+        slide_part = part(SlidePart, 'slides/slide3.xml', element(
+            'p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=1,name=foo}/a:hli'
+            'nkClick{r:id=rId4}'
+        ))
+        notes_part = part(
+            NotesSlidePart, 'notesSlides/notesSlide3.xml', element('p:notes')
+        )
+        shared_image_part = part(ImagePart, 'media/image1.png', b'shared')
+        image_part = part(ImagePart, 'media/image2.png', b'unshared')
+        other_slide_part = part(SlidePart, 'slides/slide4.xml', None)
+        source_package.relate_to(slide_part, RT.SLIDE)
+        slide_part.relate_to(
+            part(SlideLayoutPart, 'slideLayouts/slideLayout1.xml', None),
+            RT.SLIDE_LAYOUT
+        )
+        slide_part.relate_to(shared_image_part, RT.IMAGE)
+        slide_part.relate_to(image_part, RT.IMAGE)
+        slide_part.relate_to(other_slide_part, RT.SLIDE)
+        slide_part.relate_to(notes_part, RT.NOTES_SLIDE)
+        notes_part.relate_to(slide_part, RT.SLIDE)
+        notes_part.relate_to(
+            part(NotesMasterPart, 'notesMasters/notesMaster1.xml', None),
+            RT.NOTES_MASTER
+        )
+
+        layout_part = part(
+            SlideLayoutPart, 'slideLayouts/l1.xml', None, package
+        )
+        notes_master_part = part(
+            NotesMasterPart, 'notesMasters/notesMaster1.xml', None, package
+        )
+        prs_part_ = instance_mock(
+            request, PresentationPart, notes_master_part=notes_master_part
+        )
+        property_mock(
+            request, Package, 'presentation_part', return_value=prs_part_
+        )
+        existing_image_part = part(
+            ImagePart, 'media/image1.jpeg', b'shared', package
+        )
+        package.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        layout_part.relate_to(existing_image_part, RT.IMAGE)
+
+        return (
+            slide_part, package, layout_part, image_part, notes_master_part,
+            existing_image_part
+        )
+
+    @pytest.fixture
+    def duplicate_fixture(self):
+        package = Package()
+
+        def part(cls, name, content):
+            return cls(PackURI('/ppt/%s' % name), None, content, package)
+
+        slide_part = part(SlidePart, 'slides/slide1.xml', element('p:sld'))
+        layout_part = part(
+            SlideLayoutPart, 'slideLayouts/slideLayout1.xml',
+            element('p:sldLayout')
+        )
+        notes_part = part(
+            NotesSlidePart, 'notesSlides/notesSlide1.xml', element('p:notes')
+        )
+        chart_part = part(
+            ChartPart, 'charts/chart1.xml', element('c:chartSpace')
+        )
+        xlsx_part = part(Part, 'embeddings/sheet1.xlsx', b'xlsx-blob')
+        image_part = part(ImagePart, 'media/image1.png', b'png-blob')
+
+        package.relate_to(slide_part, RT.SLIDE)
+        slide_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        slide_part.relate_to(notes_part, RT.NOTES_SLIDE)
+        slide_part.relate_to(image_part, RT.IMAGE)
+        slide_part.relate_to('http://foo', RT.HYPERLINK, is_external=True)
+        slide_part.relate_to(chart_part, RT.CHART)
+        notes_part.relate_to(slide_part, RT.SLIDE)
+        chart_part.relate_to(xlsx_part, RT.PACKAGE)
+
+        parts = notes_part, chart_part, xlsx_part, image_part, layout_part
+        return slide_part, parts
+
+    @pytest.fixture
+    def owned_parts_fixture(self):
+        def part(cls, name):
+            return cls(PackURI('/ppt/%s.xml' % name), None, None, None)
+
+        slide_part = part(SlidePart, 'slides/slide1')
+        layout_part = part(SlideLayoutPart, 'slideLayouts/slideLayout1')
+        notes_part = part(NotesSlidePart, 'notesSlides/notesSlide1')
+        notes_master_part = part(NotesMasterPart, 'notesMasters/nm1')
+        other_slide_part = part(SlidePart, 'slides/slide2')
+        chart_part = part(ChartPart, 'charts/chart1')
+        xlsx_part = part(Part, 'embeddings/sheet1')
+        image_part = part(Part, 'media/image1')
+
+        slide_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        slide_part.relate_to(notes_part, RT.NOTES_SLIDE)
+        slide_part.relate_to(other_slide_part, RT.SLIDE)
+        slide_part.relate_to(chart_part, RT.CHART)
+        slide_part.relate_to(image_part, RT.IMAGE)
+        slide_part.relate_to('http://foo', RT.HYPERLINK, is_external=True)
+        notes_part.relate_to(notes_master_part, RT.NOTES_MASTER)
+        notes_part.relate_to(slide_part, RT.SLIDE)
+        chart_part.relate_to(xlsx_part, RT.PACKAGE)
+        layout_part.relate_to(part(Part, 'media/image2'), RT.IMAGE)
+        other_slide_part.relate_to(image_part, RT.IMAGE)
+
+        expected_parts = [
+            slide_part, notes_part, chart_part, xlsx_part, image_part
+        ]
+        return slide_part, expected_parts
+
     @pytest.fixture
     def add_notes_part_fixture(self, package_, NotesSlidePart_,
                                notes_slide_part_, relate_to_):
@@ -814,3 +1024,23 @@ class DescribeSlideMasterPart(object):
     @pytest.fixture
     def slide_master_(self, request):
         return instance_mock(request, SlideMaster)
+
+
+class Describe_remove_rId_references(object):
+
+    def it_removes_each_element_referring_to_the_rId(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/('
+            'a:hlinkClick{r:id=rId2},'
+            'a:blip{r:embed=rId2},'
+            'a:videoFile{r:link=rId2},'
+            'p:oleObj{r:pict=rId2},'
+            'a:blip{r:embed=rId3})'
+        )
+        part = SlidePart(None, None, sld)
+
+        _remove_rId_references(part, 'rId2')
+
+        assert [elm.tag.rpartition('}')[2] for elm in sld.iter()] == [
+            'sld', 'cSld', 'spTree', 'blip'
+        ]
@@ -113,6 +113,18 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
+    def it_keeps_indexed_access_current_with_the_shape_tree(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr,p:sp,p:pic,p:cxnSp)')
+        sp, pic, cxnSp = spTree[1:]
+        shapes = _BaseShapes(spTree, None)
+        assert [shapes[i]._element for i in (0, 1, -1)] == [sp, pic, cxnSp]
+
+        spTree.append(sp)
+        assert [shapes[i]._element for i in range(3)] == [pic, cxnSp, sp]
+        spTree.remove(pic)
+        assert len(shapes) == 2
+        assert shapes[0]._element is cxnSp
+
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
@@ -678,6 +690,38 @@ class DescribeSlideShapes(object):
         shapes.clone_layout_placeholders(slide_layout_)
         assert shapes.clone_placeholder.call_args_list == calls
 
+    def it_copies_the_layout_placeholder_prototypes_to_a_new_slide(
+            self, slide_layout_):
+        spTree = element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:grpSpPr,p:extLst)'
+        )
+        prototype = element('p:sp/p:nvSpPr/p:cNvPr{id=2,name=Title 1}')
+        slide_layout_.placeholder_prototypes.return_value = (prototype,)
+        shapes = SlideShapes(spTree, None)
+
+        shapes.clone_layout_placeholders(slide_layout_)
+
+        sp = spTree[2]
+        assert sp.xml == prototype.xml
+        assert sp is not prototype
+        assert spTree[3].tag.endswith('}extLst')
+        assert slide_layout_.iter_cloneable_placeholders.call_count == 0
+
+    def but_it_clones_each_placeholder_when_id_2_is_in_use(
+            self, slide_layout_, clone_placeholder_, placeholder_):
+        spTree = element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{id=2},p:grpSpPr,p:extLst)'
+        )
+        slide_layout_.iter_cloneable_placeholders.return_value = (
+            iter([placeholder_])
+        )
+        shapes = SlideShapes(spTree, None)
+
+        shapes.clone_layout_placeholders(slide_layout_)
+
+        assert slide_layout_.placeholder_prototypes.call_count == 0
+        clone_placeholder_.assert_called_once_with(shapes, placeholder_)
+
     def it_knows_the_index_of_each_shape(self, index_fixture):
         shapes, shape_, expected_value = index_fixture
         assert shapes.index(shape_) == expected_value
@@ -836,7 +880,10 @@ class DescribeSlideShapes(object):
 
     @pytest.fixture
     def clone_fixture(self, slide_layout_, clone_placeholder_, placeholder_):
-        shapes = SlideShapes(None, None)
+        shapes = SlideShapes(
+            element('p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr'
+                    '{id=2})'), None
+        )
         calls = [call(shapes, placeholder_)]
         slide_layout_.iter_cloneable_placeholders.return_value = (
             iter([placeholder_])
@@ -1213,18 +1260,34 @@ class DescribeLayoutPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+        placeholders, idx, sp = get_fixture
+        placeholder = placeholders.get(idx)
+        assert isinstance(placeholder, LayoutPlaceholder)
+        assert placeholder.element is sp
+        assert placeholders.get(idx) is placeholder
 
     def it_returns_default_on_ph_idx_not_found(self, default_fixture):
         placeholders, default = default_fixture
         assert placeholders.get(42, default) is default
 
+    def it_keeps_its_idx_index_current(self, get_fixture):
+        placeholders, _, _ = get_fixture
+        spTree = placeholders._element
+        sp = placeholders.get(1).element
+        new_sp = element('p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}')
+        sp.addprevious(new_sp)
+        spTree.remove(sp)
+        assert placeholders.get(1).element is new_sp
+        spTree.append(element('p:sp/p:nvSpPr/p:nvPr/p:ph{idx=7}'))
+        assert placeholders.get(7).element is spTree[-1]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+    def default_fixture(self):
+        placeholders = LayoutPlaceholders(
+            element('p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}'), None
+        )
         default = 'barfoo'
         return placeholders, default
 
@@ -1235,22 +1298,18 @@ class DescribeLayoutPlaceholders(object):
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
     @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    def get_fixture(self, request):
         idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp,p:sp/p:nvS'
+            'pPr/p:nvPr/p:ph{idx=1})'
+        )
+        layout_placeholders = LayoutPlaceholders(spTree, None)
+        sp = (spTree[0], spTree[2])[idx]
+        return layout_placeholders, idx, sp
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, LayoutPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1266,10 +1325,6 @@ class DescribeLayoutPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
-
 
 class Describe_MasterShapeFactory(object):
 
@@ -1371,8 +1426,10 @@ class DescribeMasterPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_type(self, get_fixture):
-        placeholders, ph_type, placeholder_ = get_fixture
-        assert placeholders.get(ph_type) is placeholder_
+        placeholders, ph_type, sp = get_fixture
+        placeholder = placeholders.get(ph_type)
+        assert isinstance(placeholder, MasterPlaceholder)
+        assert placeholder.element is sp
 
     def it_returns_default_on_ph_type_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1381,8 +1438,10 @@ class DescribeMasterPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
+    def default_fixture(self):
+        placeholders = MasterPlaceholders(
+            element('p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{type=title}'), None
+        )
         default = 'barfoo'
         return placeholders, default
 
@@ -1392,24 +1451,22 @@ class DescribeMasterPlaceholders(object):
         sp = element('p:sp')
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
-    @pytest.fixture(params=['title', 'body'])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    @pytest.fixture(params=[PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.BODY])
+    def get_fixture(self, request):
         ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
-        _placeholder_ = {
-            'title': placeholder_, 'body': placeholder_2_
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p'
+            ':nvPr/p:ph{type=body,idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{type=body'
+            ',idx=2})'
+        )
+        placeholders = MasterPlaceholders(spTree, None)
+        sp = {
+            PP_PLACEHOLDER.TITLE: spTree[0], PP_PLACEHOLDER.BODY: spTree[1]
         }[ph_type]
-        return placeholders, ph_type, _placeholder_
+        return placeholders, ph_type, sp
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, MasterPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1419,11 +1476,7 @@ class DescribeMasterPlaceholders(object):
 
     @pytest.fixture
     def placeholder_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type='title')
-
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type='body')
+        return instance_mock(request, MasterPlaceholder)
 
 
 class Describe_MoviePicElementCreator(object):
@@ -13,6 +13,7 @@ import pytest
 from pptx.action import ActionSetting, Hyperlink
 from pptx.enum.action import PP_ACTION
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.slide import Slide
 
 from .unitutil.cxml import element, xml
 from .unitutil.mock import call, class_mock, instance_mock, property_mock
@@ -37,6 +38,15 @@ class DescribeActionSetting(object):
         target_slide = action_setting.target_slide
         assert target_slide == expected_value
 
+    def it_can_change_its_slide_jump_target(self, target_slide_set_fixture):
+        action_setting, slide_, part_, expected_xml = target_slide_set_fixture
+        action_setting.target_slide = slide_
+        if slide_ is None:
+            assert not part_.relate_to.called
+        else:
+            part_.relate_to.assert_called_once_with(slide_.part, RT.SLIDE)
+        assert action_setting._element.xml == expected_xml
+
     def it_raises_on_no_next_prev_slide(self, tgt_sld_raise_fixture):
         action_setting = tgt_sld_raise_fixture
         with pytest.raises(ValueError):
@@ -138,6 +148,29 @@ class DescribeActionSetting(object):
         related_parts_.__getitem__.return_value.slide = 4
         return action_setting, expected_value
 
+    @pytest.fixture(params=[
+        ('p:cNvPr{a:a=a,r:r=r}', False, True,
+         'p:cNvPr{a:a=a,r:r=r}/a:hlinkClick{r:id=rId2,action=ppaction://hlink'
+         'sldjump}'),
+        ('p:cNvPr{a:a=a,r:r=r}/a:hlinkClick{r:id=rId6}', False, True,
+         'p:cNvPr{a:a=a,r:r=r}/a:hlinkClick{r:id=rId2,action=ppaction://hlink'
+         'sldjump}'),
+        ('p:cNvPr{a:a=a,r:r=r}', True, True,
+         'p:cNvPr{a:a=a,r:r=r}/a:hlinkHover{r:id=rId2,action=ppaction://hlink'
+         'sldjump}'),
+        ('p:cNvPr{a:a=a,r:r=r}/a:hlinkClick{r:id=rId6}', False, False,
+         'p:cNvPr{a:a=a,r:r=r}'),
+    ])
+    def target_slide_set_fixture(self, request, part_prop_, slide_):
+        cNvPr_cxml, hover, has_slide, expected_cxml = request.param
+        action_setting = ActionSetting(element(cNvPr_cxml), None, hover)
+        part_ = part_prop_.return_value
+        part_.relate_to.return_value = 'rId2'
+        part_._rel_ref_count.return_value = 1
+        slide = slide_ if has_slide else None
+        expected_xml = xml(expected_cxml)
+        return action_setting, slide, part_, expected_xml
+
     @pytest.fixture(params=[
         (PP_ACTION.NEXT_SLIDE,     2),
         (PP_ACTION.PREVIOUS_SLIDE, 0),
@@ -172,6 +205,10 @@ class DescribeActionSetting(object):
     def part_prop_(self, request):
         return property_mock(request, ActionSetting, 'part')
 
+    @pytest.fixture
+    def slide_(self, request):
+        return instance_mock(request, Slide)
+
     @pytest.fixture
     def _slide_index_prop_(self, request):
         return property_mock(request, ActionSetting, '_slide_index')
@@ -0,0 +1,86 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.aio module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 5):
+    pytest.skip('requires Python 3.5 or later', allow_module_level=True)
+
+import asyncio  # noqa: E402
+
+from pptx.aio import open_async, save_async  # noqa: E402
+from pptx.api import Presentation  # noqa: E402
+from pptx.compat import BytesIO  # noqa: E402
+
+from .unitutil.aio import AsyncSink, AsyncSource  # noqa: E402
+from .unitutil.file import absjoin, test_file_dir  # noqa: E402
+
+
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+
+
+class DescribeOpenAsync(object):
+
+    def it_opens_a_presentation_from_a_path(self, loop):
+        prs = loop.run_until_complete(open_async(test_pptx_path))
+        assert len(prs.slides) == len(Presentation(test_pptx_path).slides)
+
+    def it_opens_a_presentation_from_an_async_source(self, loop):
+        with open(test_pptx_path, 'rb') as f:
+            source = AsyncSource(f.read())
+        prs = loop.run_until_complete(open_async(source))
+        assert len(prs.slides) == len(Presentation(test_pptx_path).slides)
+
+
+class DescribeSaveAsync(object):
+
+    def it_streams_the_package_to_an_async_sink_in_chunks(self, loop):
+        prs = Presentation(test_pptx_path)
+        sink = AsyncSink(loop)
+
+        loop.run_until_complete(save_async(prs, sink, chunk_size=4096))
+
+        assert len(sink.chunks) > 1
+        assert all(len(chunk) == 4096 for chunk in sink.chunks[:-1])
+        saved = Presentation(BytesIO(b''.join(sink.chunks)))
+        assert len(saved.slides) == len(prs.slides)
+
+    def it_accepts_a_sink_whose_write_is_synchronous(self, loop):
+        stream = BytesIO()
+        loop.run_until_complete(save_async(Presentation(), stream))
+        assert len(Presentation(BytesIO(stream.getvalue())).slides) == 0
+
+    def it_raises_the_exception_of_a_failed_save(self, loop):
+        prs = Presentation()
+        prs.part.package.save = None
+        with pytest.raises(TypeError):
+            loop.run_until_complete(save_async(prs, AsyncSink(loop)))
+
+    def it_stops_serializing_when_cancelled(self, loop):
+        prs = Presentation(test_pptx_path)
+        sink = AsyncSink(loop, block=True)
+        task = loop.create_task(save_async(prs, sink, chunk_size=1024))
+        loop.run_until_complete(sink.first_write)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(task)
+        assert len(sink.chunks) == 1
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def loop(request):
+    loop = asyncio.new_event_loop()
+    request.addfinalizer(loop.close)
+    return loop
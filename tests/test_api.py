@@ -12,41 +12,127 @@ import os
 
 import pytest
 
-from pptx.api import Presentation
+import pptx.api
+
+from pptx.api import Presentation, PresentationTemplate
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.package import PackageTemplate
+from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
 
-from .unitutil.mock import class_mock, instance_mock
+from .unitutil.mock import class_mock, function_mock, instance_mock
 
 
 class DescribePresentation(object):
 
-    def it_opens_default_template_on_no_path_provided(self, call_fixture):
-        Package_, path, prs_ = call_fixture
+    def it_opens_default_template_on_no_path_provided(self, default_fixture):
+        template_, prs_ = default_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        template_.new_presentation.assert_called_once_with()
+        assert prs is prs_
+
+    def it_opens_the_file_at_path_when_provided(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(path)
+        Package_.open.assert_called_once_with(path, None)
+        assert prs is prs_
+
+    def it_can_open_only_selected_slides(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(path, slides=[0, 4])
+        Package_.open.assert_called_once_with(path, [0, 4])
         assert prs is prs_
 
+    def it_raises_on_a_package_that_is_not_a_presentation(
+            self, call_fixture, prs_part_):
+        Package_, path, prs_ = call_fixture
+        prs_part_.content_type = CT.WML_DOCUMENT_MAIN
+        with pytest.raises(ValueError):
+            Presentation(path)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def call_fixture(self, Package_, prs_, prs_part_):
+        path = 'foo.pptx'
+        Package_.open.return_value.main_document_part = prs_part_
+        prs_part_.content_type = CT.PML_PRESENTATION_MAIN
+        prs_part_.presentation = prs_
+        return Package_, path, prs_
+
+    @pytest.fixture
+    def default_fixture(self, request, prs_):
+        template_ = instance_mock(request, PresentationTemplate)
+        template_.new_presentation.return_value = prs_
+        function_mock(
+            request, 'pptx.api._default_template', return_value=template_
+        )
+        return template_, prs_
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def Package_(self, request):
+        return class_mock(request, 'pptx.api.Package')
+
+    @pytest.fixture
+    def prs_(self, request):
+        return instance_mock(request, Presentation)
+
+    @pytest.fixture
+    def prs_part_(self, request):
+        return instance_mock(request, PresentationPart)
+
+
+class DescribePresentationTemplate(object):
+
+    def it_opens_the_default_template_on_no_path_provided(
+            self, PackageTemplate_):
         path = os.path.abspath(
             os.path.join(
                 os.path.split(__file__)[0], '../pptx/templates',
                 'default.pptx'
             )
         )
-        Package_.open.return_value.main_document_part = prs_part_
+        PresentationTemplate()
+        PackageTemplate_.open.assert_called_once_with(path)
+
+    def it_can_create_a_new_presentation(
+            self, PackageTemplate_, prs_part_, prs_):
+        package_template_ = PackageTemplate_.open.return_value
+        package_template_.fork.return_value.main_document_part = prs_part_
         prs_part_.content_type = CT.PML_PRESENTATION_MAIN
         prs_part_.presentation = prs_
-        return Package_, path, prs_
+        template = PresentationTemplate('foo.pptx')
+
+        prs = template.new_presentation()
+
+        package_template_.fork.assert_called_once_with(Package)
+        assert prs is prs_
+
+    def it_creates_independent_presentations(self):
+        template = PresentationTemplate()
+        prs_a = template.new_presentation()
+        prs_b = template.new_presentation()
+
+        prs_a.slides.add_slide(prs_a.slide_layouts[0])
+
+        assert len(prs_a.slides) == 1
+        assert len(prs_b.slides) == 0
+        assert len(template.new_presentation().slides) == 0
+
+    def it_caches_the_default_template(self):
+        assert pptx.api._default_template() is pptx.api._default_template()
 
     # fixture components ---------------------------------------------
 
     @pytest.fixture
-    def Package_(self, request):
-        return class_mock(request, 'pptx.api.Package')
+    def PackageTemplate_(self, request):
+        PackageTemplate_ = class_mock(request, 'pptx.api.PackageTemplate')
+        PackageTemplate_.open.return_value = instance_mock(
+            request, PackageTemplate
+        )
+        return PackageTemplate_
 
     @pytest.fixture
     def prs_(self, request):
@@ -0,0 +1,149 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.batch module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import json
+import os
+import threading
+import zipfile
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.batch import _bounded_feed, BatchResult, generate_decks, main
+from pptx.exceptions import PackageNotFoundError
+
+
+def render_title(prs, record):
+    if record.get('fail'):
+        raise ValueError('bad record %s' % record['title'])
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = record['title']
+
+
+class DescribeGenerateDecks(object):
+
+    def it_writes_a_deck_for_each_record_to_a_directory(self, tmpdir):
+        output = str(tmpdir.join('decks'))
+        records = [{'title': 'foo'}, {'title': 'bar'}]
+
+        result = generate_decks(None, render_title, records, output, 0)
+
+        assert sorted(os.listdir(output)) == [
+            'deck-000001.pptx', 'deck-000002.pptx'
+        ]
+        prs = Presentation(os.path.join(output, 'deck-000002.pptx'))
+        assert prs.slides[0].shapes.title.text == 'bar'
+        assert result.succeeded == 2
+        assert result.failures == []
+
+    def it_isolates_the_failure_of_a_record(self, tmpdir):
+        output = str(tmpdir)
+        records = [
+            {'title': 'a'}, {'title': 'b', 'fail': True}, {'title': 'c'}
+        ]
+
+        result = generate_decks(None, render_title, records, output, 0)
+
+        assert result.succeeded == 2
+        assert result.failed == 1
+        idx, record, error = result.failures[0]
+        assert (idx, record) == (1, records[1])
+        assert 'ValueError: bad record b' in error
+        assert sorted(os.listdir(output)) == [
+            'deck-000001.pptx', 'deck-000003.pptx'
+        ]
+
+    def it_can_write_decks_to_a_zip_using_a_process_pool(self, tmpdir):
+        output = str(tmpdir.join('decks.zip'))
+        records = ({'title': 'deck %d' % idx} for idx in range(4))
+
+        def name(record, idx):
+            return '%s.pptx' % record['title']
+
+        result = generate_decks(None, render_title, records, output, 2, name)
+
+        with zipfile.ZipFile(output) as zipf:
+            assert sorted(zipf.namelist()) == [
+                'deck 0.pptx', 'deck 1.pptx', 'deck 2.pptx', 'deck 3.pptx'
+            ]
+        assert result.succeeded == 4
+        assert result.bytes_written > 0
+
+    def it_raises_on_a_template_it_cannot_load(self, tmpdir):
+        template = str(tmpdir.join('missing.pptx'))
+        output = str(tmpdir.join('decks'))
+        records = [{'title': 'foo'}]
+
+        with pytest.raises(PackageNotFoundError):
+            generate_decks(template, render_title, records, output, 2)
+
+
+class Describe_bounded_feed(object):
+
+    def it_feeds_no_more_items_than_there_are_slots(self):
+        slots, stopped = threading.Semaphore(2), threading.Event()
+        feed = _bounded_feed(iter(range(5)), slots, stopped)
+
+        assert [next(feed), next(feed)] == [0, 1]
+        assert slots.acquire(False) is False
+        slots.release()
+        assert next(feed) == 2
+
+    def it_stops_feeding_once_stopped(self):
+        slots, stopped = threading.Semaphore(1), threading.Event()
+        feed = _bounded_feed(iter(range(5)), slots, stopped)
+        next(feed)
+
+        stopped.set()
+        slots.release()
+
+        assert list(feed) == []
+
+
+class DescribeBatchResult(object):
+
+    def it_knows_its_throughput(self):
+        result = BatchResult()
+        result._add_success(100)
+        result._add_failure(1, {}, 'error')
+        result.elapsed = 0.5
+        assert result.decks_per_second == 4.0
+        assert str(result) == (
+            '1 decks generated, 1 failed, 100 bytes in 0.50s (4.0 decks/s)'
+        )
+
+
+class DescribeMain(object):
+
+    def it_generates_decks_from_a_records_file(self, tmpdir, capsys):
+        records_path = tmpdir.join('records.jsonl')
+        records_path.write('\n'.join(
+            json.dumps(record) for record in (
+                {'title': 'foo'}, {'title': 'bar', 'fail': True}
+            )
+        ))
+        output = str(tmpdir.join('out'))
+
+        status = main([
+            '-', 'tests.test_batch:render_title', str(records_path), output,
+            '-j', '0'
+        ])
+
+        out, err = capsys.readouterr()
+        assert status == 1
+        assert os.listdir(output) == ['deck-000001.pptx']
+        assert out.startswith('1 decks generated, 1 failed')
+        assert 'record 1 failed' in err
+
+    def it_raises_on_a_badly_named_render_function(self, tmpdir):
+        records_path = tmpdir.join('records.jsonl')
+        records_path.write('')
+        with pytest.raises(ValueError):
+            main(['-', 'render_title', str(records_path), str(tmpdir)])
@@ -0,0 +1,120 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.dataframe module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import datetime
+
+import pytest
+
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.dataframe import add_table, category_chart_data, xy_chart_data
+from pptx.shapes.shapetree import SlideShapes
+
+from .unitutil.cxml import element
+
+pandas = pytest.importorskip('pandas')
+
+
+class DescribeCategoryChartData(object):
+
+    def it_makes_a_series_for_each_column(self):
+        df = pandas.DataFrame(
+            {'foo': [1, 2, 3], 'bar': [1.5, float('nan'), 2.5]},
+            index=['a', 'b', 'c'], columns=['foo', 'bar']
+        )
+
+        chart_data = category_chart_data(df)
+
+        assert isinstance(chart_data, CategoryChartData)
+        assert [c.label for c in chart_data.categories] == ['a', 'b', 'c']
+        assert [s.name for s in chart_data] == ['foo', 'bar']
+        assert chart_data[0].values == [1, 2, 3]
+        assert chart_data[1].values == [1.5, None, 2.5]
+        assert chart_data[0].number_format == '0'
+        assert chart_data[1].number_format == 'General'
+
+    def it_uses_a_number_format_when_specified(self):
+        df = pandas.DataFrame({'foo': [1, 2]})
+        chart_data = category_chart_data(df, number_format='0.0%')
+        assert chart_data[0].number_format == '0.0%'
+
+    def it_uses_a_date_index_as_date_categories(self):
+        df = pandas.DataFrame(
+            {'foo': [1, 2]},
+            index=pandas.to_datetime(['2017-01-01', '2017-02-01'])
+        )
+        chart_data = category_chart_data(df)
+        categories = chart_data.categories
+        assert categories.are_dates
+        assert categories[1].label == datetime.datetime(2017, 2, 1)
+
+    def it_uses_a_MultiIndex_as_multi_level_categories(self):
+        index = pandas.MultiIndex.from_tuples([
+            ('WEST', 'SF'), ('WEST', 'LA'), ('EAST', 'NY'), ('EAST', 'BOS'),
+            ('WEST', 'SEA'),
+        ])
+        df = pandas.DataFrame({'foo': [1, 2, 3, 4, 5]}, index=index)
+
+        categories = category_chart_data(df).categories
+
+        assert categories.depth == 2
+        assert [
+            (c.label, [sub.label for sub in c.sub_categories])
+            for c in categories
+        ] == [
+            ('WEST', ['SF', 'LA']), ('EAST', ['NY', 'BOS']),
+            ('WEST', ['SEA']),
+        ]
+
+
+class DescribeXyChartData(object):
+
+    def it_makes_a_series_for_each_column_but_x(self):
+        nan = float('nan')
+        df = pandas.DataFrame(
+            {'x': [1.0, 2.0, nan], 'y1': [3, 4, 5], 'y2': [6.0, nan, 7.0]},
+            columns=['x', 'y1', 'y2']
+        )
+
+        chart_data = xy_chart_data(df, 'x')
+
+        assert isinstance(chart_data, XyChartData)
+        assert [s.name for s in chart_data] == ['y1', 'y2']
+        assert chart_data[0].x_values == [1.0, 2.0]
+        assert chart_data[0].y_values == [3, 4]
+        assert chart_data[1].x_values == [1.0]
+        assert chart_data[1].y_values == [6.0]
+
+    def it_uses_the_index_for_x_values_by_default(self):
+        df = pandas.DataFrame({'y': [3, 4]}, index=[10, 20])
+        chart_data = xy_chart_data(df)
+        assert chart_data[0].x_values == [10, 20]
+        assert chart_data[0].y_values == [3, 4]
+
+
+class DescribeAddTable(object):
+
+    def it_adds_a_table_populated_from_the_dataframe(self, shapes):
+        df = pandas.DataFrame(
+            {'foo': [1, 2], 'bar': ['x', None]}, index=['a', 'b'],
+            columns=['foo', 'bar']
+        )
+
+        graphic_frame = add_table(shapes, df, 0, 0, 400, 300, index=True)
+
+        table = graphic_frame.table
+        assert [
+            [cell.text_frame.text for cell in row.cells]
+            for row in table.rows
+        ] == [['index', 'foo', 'bar'], ['a', '1', 'x'], ['b', '2', '']]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def shapes(self):
+        spTree = element('p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}')
+        return SlideShapes(spTree, None)
@@ -69,6 +69,19 @@ class DescribeEnumeration(object):
             FOOBAR.validate('foobar')
         with pytest.raises(ValueError):
             FOOBAR.validate(FOOBAR.READ_ONLY)
+        with pytest.raises(ValueError):
+            FOOBAR.validate(['unhashable'])
+
+    def it_generates_its_docs_page_on_first_access(self):
+        assert '_docs_rst' not in FOOBAR.__dict__
+        docs_rst = FOOBAR.__docs_rst__
+        assert docs_rst == (
+            '.. _MsoFoobar:\n\n``FOOBAR``\n==========\n\n'
+            'Enumeration docstring\n\n----\n\n'
+            'READ_WRITE\n    Readable and settable\n\n'
+            'READ_ONLY\n    Return value only\n'
+        )
+        assert FOOBAR.__dict__['_docs_rst'] is docs_rst
 
     def it_can_be_referred_to_by_a_convenience_alias_if_defined(self):
         assert BARFOO is FOOBAR  # noqa
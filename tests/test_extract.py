@@ -0,0 +1,113 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.extract module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+from pptx.extract import _iter_part_text, iter_text, TextRecord
+from pptx.opc.packuri import PackURI
+from pptx.util import Inches
+
+from .unitutil.file import absjoin, test_file_dir
+
+
+class Describe_iter_text(object):
+
+    def it_generates_the_text_of_each_paragraph(self, pptx_file):
+        records = list(iter_text(pptx_file))
+        assert records == [
+            TextRecord(0, 2, 'Title 1', 'Foo', False),
+            TextRecord(0, 3, 'TextBox 2', 'bar\nbaz', False),
+            TextRecord(0, 3, 'TextBox 2', 'qux', False),
+            TextRecord(0, 3, 'Notes Placeholder 2', 'note', True),
+            TextRecord(1, 2, 'Title 1', 'Second', False),
+            TextRecord(1, 3, 'Table 2', 'cell', False),
+        ]
+
+    def it_can_skip_the_notes(self, pptx_file):
+        records = list(iter_text(pptx_file, notes=False))
+        assert not any(record.is_notes for record in records)
+        assert len(records) == 5
+
+    def it_can_extract_from_a_path(self):
+        records = list(iter_text(absjoin(test_file_dir, 'test.pptx')))
+        assert [r.text for r in records] == [
+            'Presentation Title Text', 'Subtitle Text'
+        ]
+
+    def it_attributes_text_to_the_innermost_shape(self, slide_zipf):
+        records = list(_iter_part_text(
+            slide_zipf, PackURI('/ppt/slides/slide1.xml'), 0
+        ))
+        assert records[:2] == [
+            TextRecord(0, 5, 'Inner', 'grouped', False),
+            TextRecord(0, 4, 'Outer', 'ungrouped', False),
+        ]
+
+    def it_skips_alternate_content_fallbacks(self, slide_zipf):
+        records = list(_iter_part_text(
+            slide_zipf, PackURI('/ppt/slides/slide1.xml'), 0
+        ))
+        assert records[2:] == [TextRecord(0, 6, 'Choice', 'once', False)]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def slide_zipf(self):
+        def sp(id_, name, text):
+            return (
+                '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="%s"/></p:nvSpPr><p:tx'
+                'Body><a:p><a:r><a:t>%s</a:t></a:r></a:p></p:txBody></p:sp>'
+                % (id_, name, text)
+            )
+
+        xml = (
+            '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/200'
+            '6/main" xmlns:p="http://schemas.openxmlformats.org/presentation'
+            'ml/2006/main" xmlns:mc="http://schemas.openxmlformats.org/marku'
+            'p-compatibility/2006"><p:cSld><p:spTree><p:grpSp><p:nvGrpSpPr>'
+            '<p:cNvPr id="4" name="Outer"/></p:nvGrpSpPr>%s%s</p:grpSp><mc:A'
+            'lternateContent><mc:Choice Requires="p14">%s</mc:Choice><mc:Fal'
+            'lback>%s</mc:Fallback></mc:AlternateContent></p:spTree></p:cSld'
+            '></p:sld>' % (
+                sp(5, 'Inner', 'grouped'),
+                '<p:txBody><a:p><a:t>ungrouped</a:t></a:p></p:txBody>',
+                sp(6, 'Choice', 'once'), sp(6, 'Choice', 'once'),
+            )
+        ).encode('utf-8')
+
+        class ZipFile(object):
+            def open(self, membername):
+                assert membername == 'ppt/slides/slide1.xml'
+                return BytesIO(xml)
+
+        return ZipFile()
+
+    @pytest.fixture
+    def pptx_file(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = 'Foo'
+        text_frame = slide.shapes.add_textbox(0, 0, 0, 0).text_frame
+        text_frame.paragraphs[0].text = 'bar\nbaz'
+        text_frame.add_paragraph()
+        text_frame.add_paragraph().text = 'qux'
+        slide.notes_slide.notes_text_frame.text = 'note'
+
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = 'Second'
+        table = slide.shapes.add_table(
+            1, 1, 0, 0, Inches(1), Inches(1)
+        ).table
+        table.cell(0, 0).text = 'cell'
+
+        stream = BytesIO()
+        prs.save(stream)
+        stream.seek(0)
+        return stream
@@ -0,0 +1,32 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the initialization of the pptx package.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pptx
+
+
+class DescribeImportPptx(object):
+
+    @pytest.mark.parametrize('module_name', [
+        'PIL', 'xlsxwriter', 'pptx.chart.chart',
+    ])
+    def it_defers_importing_modules_not_needed_to_start(self, module_name):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(pptx.__file__))
+        code = 'import sys, pptx; print(%r in sys.modules)' % module_name
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], env=env
+        )
+        assert output.strip() == b'False'
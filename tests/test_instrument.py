@@ -0,0 +1,141 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.instrument module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from pptx import instrument
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.instrument import (
+    add_listener, Count, count, Recorder, recording, remove_listener, Span,
+    span
+)
+
+from .unitutil.file import absjoin, test_file_dir
+
+
+test_image_path = absjoin(test_file_dir, 'python-powered.png')
+
+
+class DescribeInstrumentation(object):
+
+    def it_does_nothing_while_no_listener_is_registered(self):
+        with span('foo', bar=42) as foo_span:
+            foo_span.set(baz=24)
+        count('foo')
+        assert foo_span is instrument._null_span
+
+    def it_reports_spans_to_its_listeners(self, events):
+        with span('foo', bar=42) as foo_span:
+            foo_span.set(baz=24)
+
+        assert len(events) == 1
+        event = events[0]
+        assert isinstance(event, Span)
+        assert event.name == 'foo'
+        assert event.duration >= 0.0
+        assert event.attrs == {'bar': 42, 'baz': 24}
+
+    def it_reports_a_span_ended_by_an_exception(self, events):
+        with pytest.raises(ValueError):
+            with span('foo'):
+                raise ValueError()
+        assert [event.name for event in events] == ['foo']
+
+    def it_reports_counts_to_its_listeners(self, events):
+        count('foo', 3, bar=42)
+        assert events == [Count('foo', 3, {'bar': 42})]
+
+    def it_stops_reporting_to_a_removed_listener(self):
+        events = []
+        add_listener(events.append)
+        remove_listener(events.append)
+        count('foo')
+        assert events == []
+        assert instrument._listeners == ()
+
+    def it_can_record_for_the_duration_of_a_block(self):
+        with recording() as recorder:
+            count('foo')
+        count('foo')
+        assert recorder.counts == [Count('foo', 1, {})]
+        assert instrument._listeners == ()
+
+    def it_reports_the_phases_of_loading_and_saving(self):
+        stream = BytesIO()
+        with recording() as recorder:
+            Presentation().save(stream)
+            stream.seek(0)
+            Presentation(stream)
+
+        names = set(event.name for event in recorder.spans)
+        assert names >= set([
+            'open_package', 'read_package', 'unmarshal_parts',
+            'unmarshal_relationships', 'after_unmarshal', 'parse_part',
+            'save_package', 'walk_parts', 'before_marshal', 'content_types',
+            'serialize_part', 'write_member',
+        ])
+        write_spans = [
+            event for event in recorder.spans if event.name == 'write_member'
+        ]
+        attrs = write_spans[0].attrs
+        assert set(attrs) == set(['membername', 'bytes', 'compressed_bytes'])
+
+    def it_counts_the_events_of_loading_and_saving(self):
+        stream = BytesIO()
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        with recording() as recorder:
+            slide.shapes.add_picture(test_image_path, 0, 0)
+            prs.save(stream)
+            stream.seek(0)
+            Presentation(stream, slides=[0])
+
+        totals = recorder.count_totals()
+        write_spans = [
+            event for event in recorder.spans if event.name == 'write_member'
+        ]
+        assert totals['members_written'] == len(write_spans)
+        assert totals['bytes_deflated'] == sum(
+            event.attrs['compressed_bytes'] for event in write_spans
+        )
+        assert totals['blobs_hashed'] >= 1
+        parsed = [event for event in recorder.counts
+                  if event.name == 'parts_parsed']
+        assert len(parsed) == len([
+            event for event in recorder.spans if event.name == 'parse_part'
+        ])
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def events(self, request):
+        events = []
+        add_listener(events.append)
+        request.addfinalizer(lambda: remove_listener(events.append))
+        return events
+
+
+class DescribeRecorder(object):
+
+    def it_totals_its_spans_and_counts(self):
+        recorder = Recorder()
+        for event in (
+                Span('foo', 0.0, 1.0, {}), Span('bar', 0.0, 0.5, {}),
+                Span('foo', 2.0, 2.0, {}), Count('baz', 2, {}),
+                Count('baz', 3, {})):
+            recorder(event)
+
+        assert recorder.totals() == {'foo': (2, 3.0), 'bar': (1, 0.5)}
+        assert recorder.count_totals() == {'baz': 5}
+        report_lines = recorder.report().splitlines()
+        assert report_lines[1].split() == ['foo', '2', '3.0000']
+        assert report_lines[2].split() == ['bar', '1', '0.5000']
+        assert report_lines[-1].split() == ['baz', '5']
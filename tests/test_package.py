@@ -12,16 +12,20 @@ import pytest
 
 from pptx.media import Video
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part, _Relationship
-from pptx.opc.packuri import PackURI
-from pptx.package import _ImageParts, _MediaParts, Package
+from pptx.opc.package import OpcPackage, Part, _Relationship
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.pkgreader import PackageReader, _SerializedRelationship
+from pptx.package import (
+    _ImageParts, _MediaParts, Package, _partnames_outside_selection
+)
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 
 
 from .unitutil.mock import (
-    call, class_mock, instance_mock, method_mock, property_mock
+    call, class_mock, function_mock, instance_mock, method_mock,
+    property_mock
 )
 
 
@@ -63,8 +67,102 @@ class DescribePackage(object):
         _MediaParts_.assert_called_once_with(package)
         assert media_parts is media_parts_
 
+    def it_can_open_a_pkg_file(self, request):
+        open_ = method_mock(request, OpcPackage, 'open')
+        package = Package.open('foo.pptx')
+        open_.assert_called_once_with('foo.pptx')
+        assert package is open_.return_value
+
+    def it_can_open_only_selected_slides(self, request):
+        open_ = method_mock(request, OpcPackage, 'open')
+        partnames_outside_selection_ = function_mock(
+            request, 'pptx.package._partnames_outside_selection'
+        )
+
+        package = Package.open('foo.pptx', [1, 3])
+
+        pkg_file, deferred = open_.call_args[0]
+        assert pkg_file == 'foo.pptx'
+        assert deferred('pkg_reader') is (
+            partnames_outside_selection_.return_value
+        )
+        partnames_outside_selection_.assert_called_once_with(
+            'pkg_reader', [1, 3]
+        )
+        assert package is open_.return_value
+
+    def it_knows_which_parts_are_outside_a_slide_selection(
+            self, selection_fixture):
+        pkg_reader_, slides, expected_partnames = selection_fixture
+        partnames = _partnames_outside_selection(pkg_reader_, slides)
+        assert partnames == expected_partnames
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ([0, 2], set(['/s2.xml', '/n2.xml', '/i2.png'])),
+        (lambda idx: idx == 1, set(
+            ['/s1.xml', '/n1.xml', '/s3.xml', '/i3.png']
+        )),
+        ([], set(
+            ['/s1.xml', '/n1.xml', '/s2.xml', '/n2.xml', '/i2.png',
+             '/s3.xml', '/i3.png']
+        )),
+    ])
+    def selection_fixture(self, request):
+        slides, expected_partnames = request.param
+        prs_xml = (
+            '<p:presentation xmlns:p="http://schemas.openxmlformats.org/pres'
+            'entationml/2006/main" xmlns:r="http://schemas.openxmlformats.or'
+            'g/officeDocument/2006/relationships"><p:sldIdLst><p:sldId id="2'
+            '56" r:id="rId3"/><p:sldId id="257" r:id="rId1"/><p:sldId id="25'
+            '8" r:id="rId2"/></p:sldIdLst></p:presentation>'
+        ).encode('utf-8')
+        srels = [
+            ('/', '/prs.xml', RT.OFFICE_DOCUMENT, 'rId1'),
+            ('/prs.xml', '/s2.xml', RT.SLIDE, 'rId1'),
+            ('/prs.xml', '/s3.xml', RT.SLIDE, 'rId2'),
+            ('/prs.xml', '/s1.xml', RT.SLIDE, 'rId3'),
+            ('/prs.xml', '/m.xml', RT.SLIDE_MASTER, 'rId4'),
+            ('/m.xml', '/l.xml', RT.SLIDE_LAYOUT, 'rId1'),
+            ('/l.xml', '/i1.png', RT.IMAGE, 'rId1'),
+            ('/s1.xml', '/l.xml', RT.SLIDE_LAYOUT, 'rId1'),
+            ('/s1.xml', '/n1.xml', RT.NOTES_SLIDE, 'rId2'),
+            ('/s1.xml', '/s3.xml', RT.SLIDE, 'rId3'),
+            ('/n1.xml', '/s1.xml', RT.SLIDE, 'rId1'),
+            ('/s2.xml', '/l.xml', RT.SLIDE_LAYOUT, 'rId1'),
+            ('/s2.xml', '/n2.xml', RT.NOTES_SLIDE, 'rId2'),
+            ('/s2.xml', '/i1.png', RT.IMAGE, 'rId3'),
+            ('/s2.xml', '/i2.png', RT.IMAGE, 'rId4'),
+            ('/s2.xml', 'http://foo', RT.HYPERLINK, 'rId5'),
+            ('/n2.xml', '/s2.xml', RT.SLIDE, 'rId1'),
+            ('/s3.xml', '/l.xml', RT.SLIDE_LAYOUT, 'rId1'),
+            ('/s3.xml', '/i3.png', RT.IMAGE, 'rId2'),
+        ]
+        partnames = set(target for _, target, _, _ in srels) - set(
+            ['http://foo']
+        )
+        pkg_reader_ = instance_mock(request, PackageReader)
+        pkg_reader_.iter_srels.return_value = [
+            (PACKAGE_URI if source == '/' else PackURI(source),
+             self._srel(request, target, reltype, rId))
+            for source, target, reltype, rId in srels
+        ]
+        pkg_reader_.iter_sparts.return_value = [
+            (PackURI(partname), None,
+             prs_xml if partname == '/prs.xml' else b'')
+            for partname in sorted(partnames)
+        ]
+        return pkg_reader_, slides, expected_partnames
+
+    def _srel(self, request, target, reltype, rId):
+        is_external = not target.startswith('/')
+        return instance_mock(
+            request, _SerializedRelationship, is_external=is_external,
+            reltype=reltype, rId=rId,
+            target_partname=None if is_external else PackURI(target)
+        )
+
     @pytest.fixture
     def image_part_fixture(self, image_parts_, image_part_,
                            _image_parts_prop_):
@@ -191,6 +289,29 @@ class Describe_ImageParts(object):
         ImagePart_.new.assert_called_once_with(package_, image_)
         assert image_part is image_part_
 
+    def it_can_import_an_image_part_from_another_package(self):
+        package = Package()
+        existing_part = ImagePart(
+            PackURI('/ppt/media/image1.png'), 'image/png', b'foo', package
+        )
+        package.relate_to(existing_part, RT.IMAGE)
+        image_parts = _ImageParts(package)
+        other_package = OpcPackage()
+        foo_part, bar_part = (
+            ImagePart(
+                PackURI('/ppt/media/image%d.png' % n), 'image/png', blob,
+                other_package
+            )
+            for n, blob in ((5, b'foo'), (6, b'bar'))
+        )
+
+        assert image_parts.import_part(foo_part) is existing_part
+        new_part = image_parts.import_part(bar_part)
+        assert new_part.package is package
+        assert new_part.partname == '/ppt/media/image2.png'
+        assert new_part.blob == b'bar'
+        assert image_parts.import_part(bar_part) is new_part
+
     def it_can_find_an_image_part_by_sha1_hash(self, find_fixture):
         image_parts, sha1, expected_value = find_fixture
         image_part = image_parts._find_by_sha1(sha1)
@@ -303,6 +424,29 @@ class Describe_MediaParts(object):
         assert MediaPart_.new.call_args_list == calls
         assert media_part is media_part_
 
+    def it_can_import_a_media_part_from_another_package(self):
+        package = Package()
+        existing_part = MediaPart(
+            PackURI('/ppt/media/media1.mp4'), 'video/mp4', b'foo', package
+        )
+        package.relate_to(existing_part, RT.MEDIA)
+        media_parts = _MediaParts(package)
+        other_package = OpcPackage()
+        foo_part, bar_part = (
+            MediaPart(
+                PackURI('/ppt/media/media%d.mp4' % n), 'video/mp4', blob,
+                other_package
+            )
+            for n, blob in ((5, b'foo'), (6, b'bar'))
+        )
+
+        assert media_parts.import_part(foo_part) is existing_part
+        new_part = media_parts.import_part(bar_part)
+        assert new_part.package is package
+        assert new_part.partname == '/ppt/media/media2.mp4'
+        assert new_part.blob == b'bar'
+        assert media_parts.import_part(bar_part) is new_part
+
     def it_can_find_a_media_part_by_sha1(self, find_fixture):
         media_parts, sha1, expected_value = find_fixture
         media_part = media_parts._find_by_sha1(sha1)
@@ -8,13 +8,18 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import gc
+
 import pytest
 
+from pptx import shared
 from pptx.opc.package import XmlPart
-from pptx.shared import ElementProxy, ParentedElementProxy
+from pptx.shared import (
+    cache_proxies, cached_proxy, ElementProxy, ParentedElementProxy
+)
 
 from .unitutil.cxml import element
-from .unitutil.mock import instance_mock
+from .unitutil.mock import call, instance_mock, Mock
 
 
 class DescribeElementProxy(object):
@@ -90,3 +95,49 @@ class DescribeParentedElementProxy(object):
     @pytest.fixture
     def part_(self, request):
         return instance_mock(request, XmlPart)
+
+
+class Describe_cached_proxy(object):
+
+    def it_creates_a_new_proxy_when_caching_is_off(self, factory_):
+        elm, owner = element('a:p'), object()
+        cached_proxy(elm, owner, factory_, owner)
+        cached_proxy(elm, owner, factory_, owner)
+        assert factory_.call_args_list == [call(elm, owner), call(elm, owner)]
+
+    def it_reuses_a_proxy_still_in_use_when_caching_is_on(self, caching):
+        p, p_2 = element('a:p'), element('a:p')
+        owner, other_owner = object(), object()
+
+        proxy = cached_proxy(p, owner, ParentedElementProxy_, owner)
+
+        assert cached_proxy(p, owner, ParentedElementProxy_, owner) is proxy
+        assert cached_proxy(p, other_owner, ParentedElementProxy_, owner) \
+            is not proxy
+        assert cached_proxy(p_2, owner, ParentedElementProxy_, owner) \
+            is not proxy
+
+    def it_does_not_keep_a_proxy_alive(self, caching):
+        p, owner = element('a:p'), object()
+        cached_proxy(p, owner, ParentedElementProxy_, owner)
+        gc.collect()
+        assert len(shared._proxies) == 0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def caching(self, request):
+        cache_proxies()
+        request.addfinalizer(lambda: cache_proxies(False))
+
+    @pytest.fixture
+    def factory_(self):
+        return Mock(name='factory')
+
+
+class ParentedElementProxy_(ParentedElementProxy):
+    """
+    Weak-referenceable proxy, as the proxies cached in practice are.
+    """
+
+    __slots__ = ('__weakref__',)
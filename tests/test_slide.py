@@ -10,6 +10,7 @@ from __future__ import (
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
@@ -322,6 +323,11 @@ class DescribeSlide(object):
         slide, notes_slide_ = notes_slide_fixture
         assert slide.notes_slide is notes_slide_
 
+    def it_can_seal_itself(self, part_prop_, slide_part_):
+        slide = Slide(None, None)
+        slide.seal()
+        slide_part_.seal.assert_called_once_with()
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -424,8 +430,9 @@ class DescribeSlides(object):
             slides[2]
 
     def it_knows_the_index_of_a_slide_it_contains(self, index_fixture):
-        slides, slide, expected_value = index_fixture
+        slides, slide, prs_part_, expected_value = index_fixture
         index = slides.index(slide)
+        prs_part_.slide_idx.assert_called_once_with(slide.part)
         assert index == expected_value
 
     def it_raises_on_slide_not_in_collection(self, raises_fixture):
@@ -445,15 +452,59 @@ class DescribeSlides(object):
 
     def it_can_add_a_new_slide(self, add_fixture):
         slides, slide_layout_, part_ = add_fixture[:3]
-        clone_layout_placeholders_, expected_xml, slide_ = add_fixture[3:]
+        clone_layout_placeholders_, slide_ = add_fixture[3:]
 
         slide = slides.add_slide(slide_layout_)
 
         part_.add_slide.assert_called_once_with(slide_layout_)
         clone_layout_placeholders_.assert_called_once_with(slide_layout_)
-        assert slides._sldIdLst.xml == expected_xml
+        part_.add_sldId.assert_called_once_with('rId2')
         assert slide is slide_
 
+    def it_can_duplicate_a_slide(self, request, part_prop_, slide_):
+        slides = Slides(element('p:sldIdLst/p:sldId{r:id=rId1}'), None)
+        part_ = part_prop_.return_value
+        new_slide_ = instance_mock(request, Slide, name='new_slide_')
+        part_.duplicate_slide.return_value = 'rId2', new_slide_
+
+        slide = slides.duplicate(slide_)
+
+        part_.duplicate_slide.assert_called_once_with(slide_)
+        part_.add_sldId.assert_called_once_with('rId2')
+        assert slide is new_slide_
+
+    def it_can_import_a_slide(self, request, part_prop_, slide_):
+        slides = Slides(element('p:sldIdLst/p:sldId{r:id=rId1}'), None)
+        part_ = part_prop_.return_value
+        slide_layout_ = instance_mock(request, SlideLayout)
+        _matching_layout_ = method_mock(
+            request, Slides, '_matching_layout', return_value=slide_layout_
+        )
+        new_slide_ = instance_mock(request, Slide, name='new_slide_')
+        part_.import_slide.return_value = 'rId2', new_slide_
+
+        slide = slides.import_slide(slide_, {'foo': 'bar'})
+
+        _matching_layout_.assert_called_once_with(
+            slide_.slide_layout, {'foo': 'bar'}
+        )
+        part_.import_slide.assert_called_once_with(slide_, slide_layout_)
+        part_.add_sldId.assert_called_once_with('rId2')
+        assert slide is new_slide_
+
+    def it_finds_the_layout_for_an_imported_slide(self, layout_fixture):
+        slides, slide_layout_, layout_mapping, expected_layout = (
+            layout_fixture
+        )
+        layout = slides._matching_layout(slide_layout_, layout_mapping)
+        assert layout is expected_layout
+
+    def it_raises_when_no_layout_matches(self, layout_fixture):
+        slides, slide_layout_ = layout_fixture[:2]
+        slide_layout_.name = 'Baz'
+        with pytest.raises(ValueError):
+            slides._matching_layout(slide_layout_, None)
+
     def it_finds_a_slide_by_slide_id(self, get_fixture):
         slides, slide_id, default, prs_part_, expected_value = get_fixture
         slide = slides.get(slide_id, default)
@@ -467,15 +518,38 @@ class DescribeSlides(object):
         slides = Slides(element('p:sldIdLst/p:sldId{r:id=rId1}'), None)
         part_ = part_prop_.return_value
         clone_layout_placeholders_ = slide_.shapes.clone_layout_placeholders
-        expected_xml = xml(
-            'p:sldIdLst/(p:sldId{r:id=rId1},p:sldId{r:id=rId2,id=256})'
-        )
         part_.add_slide.return_value = 'rId2', slide_
         return (
-            slides, slide_layout_, part_, clone_layout_placeholders_,
-            expected_xml, slide_
+            slides, slide_layout_, part_, clone_layout_placeholders_, slide_
         )
 
+    @pytest.fixture(params=[
+        ('Foo', None, 1),
+        ('Bar', None, 2),
+        ('Bar', {'Bar': 0}, 0),
+        ('Bar', {'Foo': 0}, 2),
+    ])
+    def layout_fixture(self, request, part_prop_):
+        name, mapping, expected_idx = request.param
+        layouts = []
+        for layout_name in ('Mapped', 'Foo', 'Bar', 'Bar'):
+            layout_ = instance_mock(request, SlideLayout)
+            layout_.name = layout_name
+            layouts.append(layout_)
+        masters = [
+            instance_mock(request, SlideMaster, slide_layouts=layouts[:2]),
+            instance_mock(request, SlideMaster, slide_layouts=layouts[2:]),
+        ]
+        part_prop_.return_value.presentation.slide_masters = masters
+        slides = Slides(None, None)
+        slide_layout_ = instance_mock(request, SlideLayout)
+        slide_layout_.name = name
+        layout_mapping = (
+            None if mapping is None else
+            dict((key, layouts[idx]) for key, idx in mapping.items())
+        )
+        return slides, slide_layout_, layout_mapping, layouts[expected_idx]
+
     @pytest.fixture(params=[True, False])
     def get_fixture(self, request, part_prop_, prs_part_, slide_):
         found = request.param
@@ -499,18 +573,13 @@ class DescribeSlides(object):
         return slides
 
     @pytest.fixture(params=[0, 1])
-    def index_fixture(self, request, part_prop_):
+    def index_fixture(self, request, part_prop_, slide_):
         idx = request.param
         sldIdLst = element('p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})')
         slides = Slides(sldIdLst, None)
-        _slides = [
-            Slide(element('p:sld'), None),
-            Slide(element('p:sld'), None)
-        ]
-        part_prop_.return_value.related_slide.side_effect = (
-            _slides
-        )
-        return slides, _slides[idx], idx
+        prs_part_ = part_prop_.return_value
+        prs_part_.slide_idx.return_value = idx
+        return slides, slide_, prs_part_, idx
 
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
@@ -533,10 +602,10 @@ class DescribeSlides(object):
         return slides, expected_value
 
     @pytest.fixture
-    def raises_fixture(self):
+    def raises_fixture(self, part_prop_, slide_):
         slides = Slides(element('p:sldIdLst'), None)
-        slide = Slide(element('p:sld'), None)
-        return slides, slide
+        part_prop_.return_value.slide_idx.side_effect = ValueError
+        return slides, slide_
 
     # fixture components ---------------------------------------------
 
@@ -586,6 +655,36 @@ class DescribeSlideLayout(object):
         cloneable = list(slide_layout.iter_cloneable_placeholders())
         assert cloneable == expected_placeholders
 
+    def it_builds_the_placeholder_prototypes_for_a_new_slide(self):
+        slide_layout = Presentation().slide_layouts[1]
+
+        prototypes = slide_layout.placeholder_prototypes()
+
+        assert [
+            (sp.shape_id, sp.shape_name, sp.ph_type, sp.ph_idx)
+            for sp in prototypes
+        ] == [
+            (2, 'Title 1', PP_PLACEHOLDER.TITLE, 0),
+            (3, 'Content Placeholder 2', PP_PLACEHOLDER.OBJECT, 1),
+        ]
+        assert slide_layout.placeholder_prototypes() is prototypes
+
+    def it_rebuilds_the_prototypes_after_a_placeholder_changes(self):
+        slide_layout = Presentation().slide_layouts[1]
+        prototypes = slide_layout.placeholder_prototypes()
+
+        slide_layout.placeholders[0].element.ph.type = PP_PLACEHOLDER.DATE
+        assert [
+            sp.shape_name for sp in slide_layout.placeholder_prototypes()
+        ] == ['Content Placeholder 1']
+
+        title_sp = slide_layout.placeholders[0].element
+        title_sp.getparent().remove(title_sp)
+        assert slide_layout.placeholder_prototypes() is not prototypes
+        assert [
+            sp.shape_name for sp in slide_layout.placeholder_prototypes()
+        ] == ['Content Placeholder 1']
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
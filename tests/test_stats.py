@@ -0,0 +1,198 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.stats module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import json
+import zlib
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.stats import (
+    _compressed_size, _fmt_bytes, ELEMENT_BYTES, main, package_stats,
+    PackageStats, PartStats, SlideStats
+)
+from pptx.util import Inches
+
+from .unitutil.file import absjoin, test_file_dir
+
+
+class Describe_package_stats(object):
+
+    def it_accounts_for_each_part(self, prs):
+        stats = prs.part.package.stats()
+
+        assert isinstance(stats, PackageStats)
+        partnames = [s.partname for s in stats.parts]
+        assert partnames == sorted(partnames)
+        slide_stats = _part(stats, '/ppt/slides/slide1.xml')
+        slide_blob = prs.slides[0].part.blob
+        element_count = sum(1 for _ in prs.slides[0]._element.iter())
+        assert slide_stats == PartStats(
+            '/ppt/slides/slide1.xml', prs.slides[0].part.content_type,
+            len(slide_blob), _compressed_size(slide_blob), element_count,
+            element_count * ELEMENT_BYTES, 1
+        )
+
+    def it_counts_the_references_to_a_part(self, prs):
+        stats = package_stats(prs.part.package)
+        image_stats = _part(stats, '/ppt/media/image1.png')
+        assert image_stats.ref_count == 2
+        assert image_stats.element_count is None
+        assert image_stats.memory == image_stats.size
+
+    def it_totals_the_parts_owned_by_each_slide(self, prs):
+        stats = package_stats(prs.part.package)
+
+        image_size = _part(stats, '/ppt/media/image1.png').size
+        slide_sizes = [
+            _part(stats, '/ppt/slides/slide%d.xml' % n).size for n in (1, 2)
+        ]
+        assert [s.partname for s in stats.slides] == [
+            '/ppt/slides/slide1.xml', '/ppt/slides/slide2.xml'
+        ]
+        assert all(isinstance(s, SlideStats) for s in stats.slides)
+        assert [s.part_count for s in stats.slides] == [2, 2]
+        assert [s.size for s in stats.slides] == [
+            size + image_size for size in slide_sizes
+        ]
+        assert [s.unshared_size for s in stats.slides] == slide_sizes
+
+    def it_can_skip_the_compressed_sizes(self, prs):
+        stats = package_stats(prs.part.package, compress=False)
+        assert all(s.compressed_size is None for s in stats.parts)
+        assert stats.compressed_size is None
+        assert stats.slides[0].compressed_size is None
+
+    def it_estimates_the_memory_of_unparsed_and_spilled_parts(self, prs):
+        blob = BytesIO()
+        prs.save(blob)
+        deferred = Presentation(blob, slides=[])
+        deferred.slides[1].part.spill()
+
+        stats = package_stats(deferred.part.package)
+
+        slide_stats = _part(stats, '/ppt/slides/slide1.xml')
+        assert slide_stats.element_count is None
+        assert slide_stats.memory == slide_stats.size
+        spilled_stats = _part(stats, '/ppt/slides/slide2.xml')
+        assert spilled_stats.element_count is None
+        assert spilled_stats.memory == 0
+
+    def it_leaves_a_deferred_slide_unparsed(self, prs):
+        blob = BytesIO()
+        prs.save(blob)
+        deferred = Presentation(blob, slides=[0])
+        package = deferred.part.package
+        slide_part = deferred.part.related_parts[
+            deferred.part._element.sldIdLst[1].rId
+        ]
+
+        stats = package.stats()
+
+        assert '_element' not in slide_part.__dict__
+        assert '_slide' not in slide_part.__dict__
+        assert len(stats.slides) == 2
+
+
+class DescribePackageStats(object):
+
+    def it_totals_its_parts(self, stats):
+        assert stats.size == 30
+        assert stats.compressed_size == 12
+        assert stats.memory == 2280
+
+    def it_totals_its_parts_by_content_type(self, stats):
+        assert stats.content_type_totals() == {
+            'text/xml': (2, 20, 9, 2270),
+            'image/png': (1, 10, 3, 10),
+        }
+
+    def it_can_produce_a_report(self, stats):
+        report = stats.report(top=1)
+        lines = report.splitlines()
+        assert lines[0] == (
+            'parts: 3  size: 30 B  compressed: 12 B  memory: 2.2 KB'
+        )
+        assert '/a.xml' in report
+        assert '/b.png' not in report
+        assert lines[-1].startswith('1     /a.xml')
+
+    def it_can_convert_itself_to_a_dict(self, stats):
+        d = stats.to_dict()
+        assert d['parts'][0] == {
+            'partname': '/a.xml', 'content_type': 'text/xml', 'size': 15,
+            'compressed_size': 6, 'element_count': 10, 'memory': 2250,
+            'ref_count': 1,
+        }
+        assert d['slides'][0]['unshared_size'] == 15
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def stats(self):
+        parts = [
+            PartStats('/a.xml', 'text/xml', 15, 6, 10, 2250, 1),
+            PartStats('/b.png', 'image/png', 10, 3, None, 10, 2),
+            PartStats('/c.xml', 'text/xml', 5, 3, None, 20, 1),
+        ]
+        slides = [SlideStats(0, '/a.xml', 2, 25, 9, 2260, 15)]
+        return PackageStats(parts, slides)
+
+
+class Describe_main(object):
+
+    def it_prints_a_report(self, capsys):
+        status = main([absjoin(test_file_dir, 'test.pptx'), '-n', '3'])
+        out = capsys.readouterr()[0]
+        assert status == 0
+        assert out.startswith('parts: 22  size: ')
+        assert '/ppt/slides/slide1.xml' in out
+
+    def it_can_print_json(self, capsys):
+        main([absjoin(test_file_dir, 'test.pptx'), '--json', '--no-compress'])
+        stats = json.loads(capsys.readouterr()[0])
+        assert len(stats['parts']) == 22
+        assert stats['parts'][0]['compressed_size'] is None
+        assert stats['slides'][0]['partname'] == '/ppt/slides/slide1.xml'
+
+
+class Describe_helpers(object):
+
+    def it_computes_the_deflated_size_of_a_blob(self):
+        blob = b'foobar' * 100
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+        )
+        expected = compressor.compress(blob) + compressor.flush()
+        assert _compressed_size(blob) == len(expected)
+
+    @pytest.mark.parametrize('value, expected', [
+        (None, '-'), (0, '0 B'), (1023, '1023 B'), (1536, '1.5 KB'),
+        (3 * 1024 * 1024, '3.0 MB'), (2 * 1024 ** 3, '2.0 GB'),
+    ])
+    def it_formats_byte_counts(self, value, expected):
+        assert _fmt_bytes(value) == expected
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def prs():
+    prs = Presentation()
+    image = absjoin(test_file_dir, 'python-powered.png')
+    for _ in range(2):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(image, Inches(1), Inches(1))
+    return prs
+
+
+def _part(stats, partname):
+    return [s for s in stats.parts if s.partname == partname][0]
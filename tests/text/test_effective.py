@@ -0,0 +1,153 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.text.effective module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.text import MSO_UNDERLINE, PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.effective import (
+    EffectiveFont, EffectiveParagraphFormat, TextFormatResolver
+)
+from pptx.util import Inches, Pt
+
+
+class DescribeTextFormatResolver(object):
+
+    def it_resolves_the_font_a_placeholder_run_inherits(self, prs):
+        slide = prs.slides[0]
+        title_run = slide.shapes.title.text_frame.paragraphs[0].runs[0]
+        body_paragraphs = slide.placeholders[1].text_frame.paragraphs
+        resolver = TextFormatResolver()
+
+        assert resolver.font(title_run) == EffectiveFont(
+            'Calibri', Pt(44), None, None, None, RGBColor(0, 0, 0)
+        )
+        assert resolver.font(body_paragraphs[0].runs[0]).size == Pt(32)
+        assert resolver.font(body_paragraphs[1].runs[0]).size == Pt(28)
+
+    def it_prefers_the_formatting_set_on_the_run(self, prs):
+        run = prs.slides[0].placeholders[1].text_frame.paragraphs[0].runs[0]
+        font = run.font
+        font.size = Pt(9)
+        font.bold = True
+        font.underline = MSO_UNDERLINE.DOUBLE_LINE
+        font.name = 'Arial'
+        font.color.rgb = RGBColor(0x12, 0x34, 0x56)
+
+        assert TextFormatResolver().font(run) == EffectiveFont(
+            'Arial', Pt(9), True, None, MSO_UNDERLINE.DOUBLE_LINE,
+            RGBColor(0x12, 0x34, 0x56)
+        )
+
+    def it_resolves_theme_colors(self, prs):
+        run = prs.slides[0].shapes.title.text_frame.paragraphs[0].runs[0]
+        run.font.color.theme_color = 5  # accent 1
+        assert TextFormatResolver().font(run).color == RGBColor(
+            0x4F, 0x81, 0xBD
+        )
+
+    def it_inherits_from_the_layout_placeholder(self, prs):
+        slide = prs.slides[0]
+        run = slide.placeholders[1].text_frame.paragraphs[0].runs[0]
+        layout_ph = slide.slide_layout.placeholders.get(1)
+        lstStyle = layout_ph.element.txBody.find(
+            '{http://schemas.openxmlformats.org/drawingml/2006/main}lstStyle'
+        )
+        lstStyle.append(parse_xml(
+            '<a:lvl1pPr %s algn="r"><a:defRPr sz="2000" i="1"/></a:lvl1pPr>'
+            % nsdecls('a')
+        ))
+        resolver = TextFormatResolver()
+
+        font = resolver.font(run)
+        paragraph_format = resolver.paragraph_format(run._parent)
+
+        assert (font.size, font.italic) == (Pt(20), True)
+        assert paragraph_format.alignment == PP_ALIGN.RIGHT
+
+    def it_resolves_a_text_box_from_the_presentation_defaults(self, prs):
+        slide = prs.slides[0]
+        textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        textbox.text_frame.text = 'box'
+        run = textbox.text_frame.paragraphs[0].runs[0]
+        assert TextFormatResolver().font(run).size == Pt(18)
+
+    def it_resolves_paragraph_formatting(self, prs):
+        slide = prs.slides[0]
+        title_paragraph = slide.shapes.title.text_frame.paragraphs[0]
+        body_paragraph = slide.placeholders[1].text_frame.paragraphs[0]
+        resolver = TextFormatResolver()
+
+        assert resolver.paragraph_format(title_paragraph) == (
+            EffectiveParagraphFormat(PP_ALIGN.CENTER, None, None, None)
+        )
+        body_paragraph.alignment = PP_ALIGN.JUSTIFY
+        body_paragraph.space_after = Pt(6)
+        assert resolver.paragraph_format(body_paragraph) == (
+            EffectiveParagraphFormat(PP_ALIGN.JUSTIFY, None, None, Pt(6))
+        )
+
+    def it_resolves_the_runs_of_a_layout_and_a_master(self, prs):
+        resolver = TextFormatResolver()
+        master_sizes = [
+            font.size for _, _, font in
+            resolver.iter_run_fonts(prs.slide_masters[0])
+        ]
+        layout_sizes = [
+            font.size for _, _, font in
+            resolver.iter_run_fonts(prs.slide_layouts[0])
+        ]
+        assert master_sizes == [
+            Pt(44), Pt(32), Pt(28), Pt(24), Pt(20), Pt(20)
+        ]
+        assert layout_sizes == [Pt(44), Pt(32)]
+
+    def it_can_iterate_the_run_fonts_of_a_slide(self, prs):
+        slide = prs.slides[0]
+        slide.shapes.add_table(1, 1, 0, 0, Inches(1), Inches(1))
+        textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        textbox.text_frame.text = 'box'
+
+        fonts = list(TextFormatResolver().iter_run_fonts(slide))
+
+        assert [(shape.name, run.text) for shape, run, _ in fonts] == [
+            ('Title 1', 'Title'), ('Content Placeholder 2', 'One'),
+            ('Content Placeholder 2', 'Two'), (textbox.name, 'box'),
+        ]
+        assert [font.size for _, _, font in fonts] == [
+            Pt(44), Pt(32), Pt(28), Pt(18)
+        ]
+
+    def it_shares_what_a_layout_contributes_between_slides(self, prs):
+        slide_2 = prs.slides.add_slide(prs.slide_layouts[1])
+        slide_2.placeholders[1].text_frame.text = 'Three'
+        resolver = TextFormatResolver()
+        list(resolver.iter_run_fonts(prs.slides[0]))
+        inherited_count = len(resolver._inherited)
+
+        list(resolver.iter_run_fonts(slide_2))
+
+        assert len(resolver._inherited) == inherited_count
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def prs():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = 'Title'
+    text_frame = slide.placeholders[1].text_frame
+    text_frame.text = 'One'
+    paragraph = text_frame.add_paragraph()
+    paragraph.text = 'Two'
+    paragraph.level = 1
+    return prs
@@ -0,0 +1,112 @@
+# encoding: utf-8
+
+"""
+Unit test suite for the pptx.text.replace module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+import pytest
+
+from pptx.presentation import Presentation
+from pptx.slide import Slide
+from pptx.text.replace import (
+    DEFAULT_TOKEN_PATTERN, _replace_in_paragraph, replace_tokens, TokenIndex
+)
+
+from ..unitutil.cxml import element, xml
+from ..unitutil.mock import instance_mock
+
+
+class Describe_replace_tokens(object):
+
+    def it_replaces_tokens_in_each_slide(self, prs_):
+        count = replace_tokens(prs_, {'name': 'Joe', 'n': 42})
+
+        assert count == 3
+        assert prs_.slides[0]._element.xml == xml(
+            'p:sld/(p:sp/p:txBody/a:p/a:r/a:t"Hi Joe",p:sp/p:txBody/a:p/(a:r'
+            '/a:t"42 ",a:r/a:t"{{other}}"))'
+        )
+        assert prs_.slides[1]._element.xml == xml(
+            'p:sld/p:sp/p:txBody/a:p/a:r/a:t"Joe"'
+        )
+
+    def it_can_use_another_token_pattern(self, prs_):
+        count = replace_tokens(prs_, {'other': 'x'}, r'\{\{(other)\}\}')
+        assert count == 1
+
+
+class DescribeTokenIndex(object):
+
+    def it_indexes_the_tokens_in_a_presentation(self, prs_):
+        index = TokenIndex(prs_)
+        assert index.tokens == frozenset(['name', 'n', 'other'])
+        assert index.locations('name') == [(0, 0), (1, 0)]
+        assert index.locations('other') == [(0, 1)]
+        assert index.locations('foo') == []
+
+    def it_can_replace_the_indexed_tokens(self, prs_):
+        index = TokenIndex(prs_)
+
+        count = index.replace(prs_, {'other': 'x', 'n': 1})
+
+        assert count == 2
+        assert prs_.slides[0]._element.xml == xml(
+            'p:sld/(p:sp/p:txBody/a:p/a:r/a:t"Hi {{ name }}",p:sp/p:txBody/'
+            'a:p/(a:r/a:t"1 ",a:r/a:t"x"))'
+        )
+
+
+
+class Describe_replace_in_paragraph(object):
+
+    def it_replaces_the_tokens_in_a_paragraph(self, replace_fixture):
+        p, replacements, expected_xml, expected_count = replace_fixture
+        count = _replace_in_paragraph(
+            p, re.compile(DEFAULT_TOKEN_PATTERN), replacements
+        )
+        assert p.xml == expected_xml
+        assert count == expected_count
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('a:p/a:r/a:t"foo"', 'a:p/a:r/a:t"foo"', 0),
+        ('a:p/a:r/a:t"{{a}}"', 'a:p/a:r/a:t"A"', 1),
+        ('a:p/a:r/a:t"x{{a}}y{{ b }}z"', 'a:p/a:r/a:t"xAyBBz"', 2),
+        ('a:p/a:r/a:t"{{c}} {{a}}"', 'a:p/a:r/a:t"{{c}} A"', 1),
+        ('a:p/(a:r/a:t"x{{",a:r/a:t"a",a:r/a:t"}}y")',
+         'a:p/(a:r/a:t"xA",a:r/a:t,a:r/a:t"y")', 1),
+        ('a:p/(a:r/a:t"{{a}}{",a:r/a:t"{b}}")',
+         'a:p/(a:r/a:t"ABB",a:r/a:t)', 2),
+        ('a:p/(a:r/a:t"x{{a",a:r/a:t,a:r/a:t"}}")',
+         'a:p/(a:r/a:t"xA",a:r/a:t,a:r/a:t)', 1),
+        ('a:p/(a:r/a:t"{{a",a:br,a:r/a:t"}}")',
+         'a:p/(a:r/a:t"{{a",a:br,a:r/a:t"}}")', 0),
+        ('a:p/(a:r/a:t"{{a}}",a:br,a:fld/a:t"{{b}}")',
+         'a:p/(a:r/a:t"A",a:br,a:fld/a:t"BB")', 2),
+    ])
+    def replace_fixture(self, request):
+        p_cxml, expected_cxml, expected_count = request.param
+        p = element(p_cxml)
+        replacements = {'a': 'A', 'b': 'BB'}
+        return p, replacements, xml(expected_cxml), expected_count
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def prs_(request):
+    slides = [
+        Slide(element(
+            'p:sld/(p:sp/p:txBody/a:p/a:r/a:t"Hi {{ name }}",p:sp/p:txBody/'
+            'a:p/(a:r/a:t"{{n}} ",a:r/a:t"{{other}}"))'
+        ), None),
+        Slide(element('p:sld/p:sp/p:txBody/a:p/a:r/a:t"{{name}}"'), None),
+    ]
+    prs_ = instance_mock(request, Presentation)
+    prs_.slides = slides
+    return prs_
@@ -16,6 +16,7 @@ from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, MSO_UNDERLINE, PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.shapes.autoshape import Shape
+from pptx.shared import cache_proxies
 from pptx.text.text import Font, _Hyperlink, _Paragraph, _Run, TextFrame
 from pptx.util import Inches, Pt
 
@@ -73,6 +74,21 @@ class DescribeTextFrame(object):
             assert isinstance(paragraph, _Paragraph)
             assert paragraph._element is ps[idx]
 
+    def it_reuses_its_paragraphs_when_proxies_are_cached(self, request):
+        cache_proxies()
+        request.addfinalizer(lambda: cache_proxies(False))
+        text_frame = TextFrame(element('p:txBody/(a:p/a:r,a:p)'), None)
+
+        paragraphs = text_frame.paragraphs
+        paragraph = text_frame.add_paragraph()
+        runs = paragraphs[0].runs
+
+        assert text_frame.paragraphs == paragraphs + (paragraph,)
+        assert all(
+            p is p_2 for p, p_2 in zip(text_frame.paragraphs, paragraphs)
+        )
+        assert paragraphs[0].runs[0] is runs[0]
+
     def it_can_add_a_paragraph_to_itself(self, add_paragraph_fixture):
         text_frame, expected_xml = add_paragraph_fixture
         text_frame.add_paragraph()
@@ -0,0 +1,40 @@
+# encoding: utf-8
+
+"""
+asyncio test helpers, kept apart from the test modules so those remain
+importable on Python versions without `async def`.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import asyncio
+
+
+class AsyncSink(object):
+    """
+    Byte sink whose `write()` is a coroutine function. When *block* is
+    |True|, the first write never completes, leaving the writer waiting
+    until it is cancelled; `first_write` is done once that write starts.
+    """
+    def __init__(self, loop, block=False):
+        self.chunks = []
+        self.first_write = loop.create_future()
+        self._block = block
+
+    async def write(self, data):
+        self.chunks.append(data)
+        if not self.first_write.done():
+            self.first_write.set_result(None)
+        if self._block:
+            await asyncio.Event().wait()
+
+
+class AsyncSource(object):
+    """
+    Byte source whose `read()` is a coroutine function.
+    """
+    def __init__(self, blob):
+        self._blob = blob
+
+    async def read(self):
+        return self._blob